@@ -4,8 +4,14 @@ Módulo para gerenciar a configuração de emuladores no NIX Launcher.
 
 import json
 import logging
+import os
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # Dependência opcional: recai no módulo json padrão
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
@@ -20,6 +26,8 @@ class EmulatorConfig:
                         Se None, tenta carregar do local padrão.
         """
         self.config_file = Path(config_file) if config_file else self._get_default_config_path()
+        # Assinatura (mtime_ns, tamanho) do arquivo correspondente a self.config
+        self._config_sig: Optional[Tuple[int, int]] = None
         self.config: Dict[str, Any] = self._load_config()
     
     def _get_default_config_path(self) -> Path:
@@ -28,12 +36,31 @@ class EmulatorConfig:
         config_dir.mkdir(exist_ok=True)
         return config_dir / 'emulators.json'
     
+    def _file_sig(self) -> Optional[Tuple[int, int]]:
+        """Retorna (mtime_ns, tamanho) do arquivo de configuração, ou None."""
+        try:
+            st = os.stat(self.config_file)
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+    
+    def _reload_if_stale(self) -> None:
+        """Relê o arquivo apenas se ele mudou desde a última leitura/gravação.
+        
+        Cada consulta custa um ``stat``; o JSON só é interpretado de novo
+        quando o arquivo é alterado por fora (outra instância, edição manual).
+        """
+        if self._file_sig() != self._config_sig:
+            self.config = self._load_config()
+    
     def _load_config(self) -> Dict[str, Any]:
         """Carrega a configuração de emuladores do arquivo."""
+        self._config_sig = sig = self._file_sig()
         try:
-            if self.config_file.exists():
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+            if sig is not None:
+                with open(self.config_file, 'rb') as f:
+                    data = f.read()
+                return orjson.loads(data) if orjson is not None else json.loads(data)
         except Exception as e:
             logger.error(f"Erro ao carregar configuração de emuladores: {e}")
         
@@ -46,8 +73,12 @@ class EmulatorConfig:
     def save_config(self) -> bool:
         """Salva a configuração de emuladores no arquivo."""
         try:
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(self.config, f, indent=2, ensure_ascii=False)
+            if orjson is not None:
+                payload = orjson.dumps(self.config, option=orjson.OPT_INDENT_2)
+            else:
+                payload = json.dumps(self.config, indent=2, ensure_ascii=False).encode('utf-8')
+            self.config_file.write_bytes(payload)
+            self._config_sig = self._file_sig()
             return True
         except Exception as e:
             logger.error(f"Erro ao salvar configuração de emuladores: {e}")
@@ -55,10 +86,12 @@ class EmulatorConfig:
     
     def get_emulators(self) -> List[Dict[str, Any]]:
         """Retorna a lista de emuladores configurados."""
+        self._reload_if_stale()
         return self.config.get("emulators", [])
     
     def get_rom_directories(self) -> List[str]:
         """Retorna a lista de diretórios de ROMs configurados."""
+        self._reload_if_stale()
         return self.config.get("rom_directories", [])
     
     def add_emulator(self, emulator: Dict[str, Any]) -> bool:
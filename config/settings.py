@@ -2,9 +2,16 @@
 Módulo de configuração centralizada para o NIX Launcher.
 """
 
+import copy
 import json
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Optional
+
+try:
+    import orjson
+except ImportError:  # Dependência opcional: recai no módulo json padrão
+    orjson = None
 
 # Diretórios base
 BASE_DIR = Path(__file__).parent.parent
@@ -82,6 +89,8 @@ class Settings:
     """Classe singleton para gerenciar configurações."""
     _instance = None
     _settings: Dict[str, Any] = {}
+    _txn_depth = 0  # Transações abertas (ver transaction())
+    _txn_changes: Dict[str, Any] = {}  # Chaves alteradas na transação atual
     
     def __new__(cls):
         if cls._instance is None:
@@ -94,17 +103,22 @@ class Settings:
         try:
             if SETTINGS_FILE.exists():
                 with open(SETTINGS_FILE, 'r', encoding='utf-8') as f:
-                    self._settings = {**DEFAULT_SETTINGS, **json.load(f)}
+                    self._settings = {**copy.deepcopy(DEFAULT_SETTINGS), **json.load(f)}
             else:
-                self._settings = DEFAULT_SETTINGS.copy()
+                self._settings = copy.deepcopy(DEFAULT_SETTINGS)
                 self._save_settings()
         except Exception:
-            self._settings = DEFAULT_SETTINGS.copy()
+            self._settings = copy.deepcopy(DEFAULT_SETTINGS)
     
     def _save_settings(self) -> None:
         """Salva as configurações no arquivo."""
-        with open(SETTINGS_FILE, 'w', encoding='utf-8') as f:
-            json.dump(self._settings, f, indent=4, ensure_ascii=False)
+        # O orjson só sabe indentar com 2 espaços; sem ele o arquivo mantém o
+        # formato original (4 espaços). Os dois são lidos da mesma forma
+        if orjson is not None:
+            payload = orjson.dumps(self._settings, option=orjson.OPT_INDENT_2)
+        else:
+            payload = json.dumps(self._settings, indent=4, ensure_ascii=False).encode('utf-8')
+        SETTINGS_FILE.write_bytes(payload)
     
     def get(self, key: str, default: Any = None) -> Any:
         """Obtém um valor de configuração."""
@@ -148,11 +162,50 @@ class Settings:
             settings = settings[k]
         
         settings[keys[-1]] = value
+        
+        # Dentro de uma transação, gravação e notificação ficam para o commit
+        if self._txn_depth:
+            self._txn_changes[key] = value
+            return
+        
         self._save_settings()
         
         # Notifica observadores sobre a mudança
         self.notify_observers(key, value)
     
+    @contextmanager
+    def transaction(self):
+        """
+        Agrupa várias chamadas a ``set`` em uma única gravação.
+        
+        Dentro do bloco os valores são atualizados em memória; ao sair, o
+        arquivo é gravado uma vez e cada chave alterada é notificada uma vez
+        (com o último valor). Transações aninhadas são confirmadas pela mais
+        externa.
+        
+        Exemplo:
+            with settings.transaction():
+                settings.set('ui.theme', 'light')
+                settings.set('ui.font_size', 14)
+        """
+        if not self._txn_depth:
+            self._txn_changes = {}
+        self._txn_depth += 1
+        try:
+            yield self
+        finally:
+            self._txn_depth -= 1
+            if not self._txn_depth:
+                changes, self._txn_changes = self._txn_changes, {}
+                if changes:
+                    self._save_settings()
+                    for key, value in changes.items():
+                        self.notify_observers(key, value)
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """Retorna uma cópia independente de todas as configurações."""
+        return copy.deepcopy(self._settings)
+    
     def get_theme_path(self, theme_name: str = None) -> Path:
         """
         Obtém o caminho para o arquivo de tema.
@@ -171,26 +224,41 @@ class Settings:
     
     # Observers pattern para notificar sobre mudanças
     _observers = []
+    # Observadores filtrados: chave (ou seção, ex.: 'ui') -> callbacks
+    _key_observers: Dict[str, list] = {}
     
-    def add_observer(self, callback):
+    def add_observer(self, callback, key: Optional[str] = None):
         """
         Adiciona um observador para ser notificado sobre mudanças nas configurações.
         
         Args:
             callback: Função que será chamada quando uma configuração mudar.
                      A assinatura deve ser: callback(key: str, value: Any) -> None
+            key: Se informado, o observador só é chamado para essa chave
+                (ex.: 'ui.theme') ou para as chaves dessa seção (ex.: 'ui').
+                Se None, é chamado para todas as mudanças.
         """
-        if callback not in self._observers:
-            self._observers.append(callback)
+        observers = self._observers if key is None else self._key_observers.setdefault(key, [])
+        if callback not in observers:
+            observers.append(callback)
     
     def remove_observer(self, callback):
-        """Remove um observador."""
+        """Remove um observador (com ou sem filtro de chave)."""
         if callback in self._observers:
             self._observers.remove(callback)
+        for observers in self._key_observers.values():
+            if callback in observers:
+                observers.remove(callback)
     
     def notify_observers(self, key: str, value: Any) -> None:
-        """Notifica todos os observadores sobre uma mudança."""
-        for callback in self._observers[:]:
+        """Notifica os observadores interessados em uma mudança."""
+        callbacks = self._observers[:]
+        if self._key_observers:
+            # A chave e cada seção que a contém ('ui.theme' -> 'ui', 'ui.theme')
+            parts = key.split('.')
+            for i in range(1, len(parts) + 1):
+                callbacks.extend(self._key_observers.get('.'.join(parts[:i]), ()))
+        for callback in callbacks:
             try:
                 callback(key, value)
             except Exception as e:
@@ -199,7 +267,7 @@ class Settings:
     
     def reset_to_defaults(self) -> None:
         """Reseta todas as configurações para os valores padrão."""
-        self._settings = {**DEFAULT_SETTINGS}
+        self._settings = copy.deepcopy(DEFAULT_SETTINGS)
         self._save_settings()
         
         # Notifica sobre todas as mudanças
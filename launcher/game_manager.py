@@ -7,6 +7,7 @@ suportadas pelo NIX Launcher.
 
 import logging
 import os
+import threading
 from typing import List, Dict, Any, Optional, Callable
 from pathlib import Path
 
@@ -24,6 +25,8 @@ class GameManager:
         Args:
             config: Dicionário de configuração para os manipuladores de plataforma.
                    Se None, as configurações serão carregadas automaticamente.
+                   As chaves 'emulators' e 'rom_directories', quando presentes,
+                   substituem as do arquivo de configuração de emuladores.
         """
         # Carrega a configuração de emuladores e combina com a configuração fornecida
         emu_config = emulator_config.config
@@ -32,17 +35,24 @@ class GameManager:
         if not emu_config.get("rom_directories") and config and "pastas_hd" in config:
             emu_config["rom_directories"] = config.get("pastas_hd", [])
         
-        # Combina as configurações
+        # Combina as configurações; emuladores e pastas de ROMs fornecidos
+        # explicitamente têm precedência sobre o arquivo de emuladores
+        config = config or {}
         self.config = {
-            "emulators": emu_config.get("emulators", []),
-            "rom_directories": emu_config.get("rom_directories", []),
-            "pastas_hd": config.get("pastas_hd", []) if config else []
+            "emulators": config.get("emulators") or emu_config.get("emulators", []),
+            "rom_directories": config.get("rom_directories") or emu_config.get("rom_directories", []),
+            "pastas_hd": config.get("pastas_hd", [])
         }
+        if "rom_cache_file" in config:
+            self.config["rom_cache_file"] = config["rom_cache_file"]
         
         self.platforms: List[PlatformHandler] = []
         self.games: Dict[str, Game] = {}
         self._game_list_updated_callbacks = []
         self._initialized = False
+        # A inicialização roda fora da thread da interface; chamadas
+        # concorrentes esperam a primeira em vez de repetir a descoberta
+        self._init_lock = threading.RLock()
     
     def initialize(self) -> bool:
         """
@@ -53,23 +63,29 @@ class GameManager:
         """
         if self._initialized:
             return True
-            
-        logger.info("Inicializando gerenciador de jogos...")
         
-        try:
-            # Descobre plataformas disponíveis
-            self.platforms = get_available_platforms(self.config)
-            logger.info(f"Plataformas encontradas: {[p.name for p in self.platforms]}")
+        with self._init_lock:
+            if self._initialized:
+                return True
             
-            # Carrega os jogos
-            self.refresh_games()
+            logger.info("Inicializando gerenciador de jogos...")
             
-            self._initialized = True
-            return True
-            
-        except Exception as e:
-            logger.error(f"Erro ao inicializar o gerenciador de jogos: {e}", exc_info=True)
-            return False
+            try:
+                # Descobre plataformas disponíveis
+                self.platforms = get_available_platforms(self.config)
+                logger.info(f"Plataformas encontradas: {[p.name for p in self.platforms]}")
+                
+                # Marca como inicializado antes de carregar os jogos: refresh_games
+                # chama initialize() enquanto a inicialização não terminou
+                self._initialized = True
+                
+                # Carrega os jogos
+                self.refresh_games()
+                return True
+                
+            except Exception as e:
+                logger.error(f"Erro ao inicializar o gerenciador de jogos: {e}", exc_info=True)
+                return False
     
     def refresh_games(self) -> bool:
         """
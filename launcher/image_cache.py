@@ -8,11 +8,14 @@ melhorando o desempenho e reduzindo o uso de largura de banda.
 import os
 import hashlib
 import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
 import requests
-from PyQt5.QtGui import QPixmap
+from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QImage, QPixmap
 
 # Configuração de logging
 logger = logging.getLogger(__name__)
@@ -20,6 +23,11 @@ logger = logging.getLogger(__name__)
 # Tamanho máximo do cache em bytes (50MB)
 MAX_CACHE_SIZE = 50 * 1024 * 1024
 
+# Threads de E/S para download e decodificação de imagens fora da thread da
+# interface. QImage (ao contrário de QPixmap) pode ser usado em qualquer thread.
+# O limite mantém downloads sobrepostos sem abrir uma conexão por jogo
+_IO_WORKERS = min(8, os.cpu_count() or 4)
+
 class ImageCache:
     """Classe para gerenciar o cache de imagens."""
     
@@ -42,6 +50,9 @@ class ImageCache:
         """
         Obtém uma imagem do cache ou baixa se não estiver em cache.
         
+        Deve ser chamado na thread da interface (cria um QPixmap); fora dela
+        use ``load_image``.
+        
         Args:
             url: URL da imagem a ser baixada.
             timeout: Tempo máximo de espera para o download em segundos.
@@ -49,67 +60,154 @@ class ImageCache:
         Returns:
             Um QPixmap com a imagem ou None em caso de erro.
         """
-        if not url:
+        image = self.load_image(url, timeout=timeout)
+        if image is None:
             return None
+        return QPixmap.fromImage(image)
+    
+    def load_image(self, url: str, size: Optional[Tuple[int, int]] = None,
+                   timeout: int = 10) -> Optional[QImage]:
+        """
+        Obtém e decodifica uma imagem como QImage, podendo rodar em qualquer thread.
         
-        # Gera um nome de arquivo único para a URL
-        file_hash = hashlib.md5(url.encode('utf-8')).hexdigest()
-        file_extension = os.path.splitext(url)[1].lower()
-        
-        # Garante que a extensão seja válida
-        if not file_extension or len(file_extension) > 5:
-            file_extension = '.jpg'  # Extensão padrão
+        Args:
+            url: URL da imagem.
+            size: Se informado, (largura, altura) para a qual a imagem é
+                reduzida mantendo a proporção, ainda na thread chamadora.
+            timeout: Tempo máximo de espera para o download em segundos.
             
-        cache_path = self.cache_dir / f"{file_hash}{file_extension}"
+        Returns:
+            A imagem decodificada (e redimensionada) ou None em caso de erro.
+        """
+        if not url:
+            return None
+        
+        cache_path = self._cache_path(url)
+        image = QImage()
         
         # Tenta carregar do cache
         if cache_path.exists():
             try:
-                pixmap = QPixmap(str(cache_path))
-                if not pixmap.isNull():
+                if image.load(str(cache_path)):
                     logger.debug(f"Imagem carregada do cache: {cache_path}")
-                    return pixmap
+                else:
+                    image = QImage()
             except Exception as e:
                 logger.warning(f"Erro ao carregar imagem do cache {cache_path}: {e}")
         
         # Se não estiver em cache ou ocorrer erro, baixa a imagem
-        return self._download_image(url, cache_path, timeout)
+        if image.isNull():
+            image = self._download_image(url, cache_path, timeout)
+            if image is None:
+                return None
+        
+        if size is not None:
+            image = _downscale(image, size)
+        
+        # Converte já aqui para o formato nativo de pintura: QPixmap.fromImage
+        # na thread da interface vira praticamente uma cópia
+        if image.format() != QImage.Format_ARGB32_Premultiplied:
+            image = image.convertToFormat(QImage.Format_ARGB32_Premultiplied)
+        return image
     
-    def _download_image(self, url: str, cache_path: Path, timeout: int) -> Optional[QPixmap]:
+    def ensure_cached(self, url: str, timeout: int = 10) -> bool:
         """
-        Baixa uma imagem e salva no cache.
+        Garante que a imagem esteja no cache em disco, sem decodificá-la.
+        
+        Args:
+            url: URL da imagem.
+            timeout: Tempo máximo de espera para o download em segundos.
+            
+        Returns:
+            True se a imagem já estava ou foi salva no cache.
+        """
+        if not url:
+            return False
+        cache_path = self._cache_path(url)
+        if cache_path.exists():
+            return True
+        
+        content = self._fetch(url, timeout)
+        if content is None:
+            return False
+        try:
+            with open(cache_path, 'wb') as f:
+                f.write(content)
+        except OSError as e:
+            logger.error(f"Erro ao salvar imagem em cache {cache_path}: {e}")
+            return False
+        logger.debug(f"Imagem salva em cache: {cache_path}")
+        return True
+    
+    def _cache_path(self, url: str) -> Path:
+        """Retorna o caminho do arquivo em cache correspondente à URL."""
+        # Gera um nome de arquivo único para a URL
+        file_hash = hashlib.md5(url.encode('utf-8')).hexdigest()
+        file_extension = os.path.splitext(url)[1].lower()
+        
+        # Garante que a extensão seja válida
+        if not file_extension or len(file_extension) > 5:
+            file_extension = '.jpg'  # Extensão padrão
+            
+        return self.cache_dir / f"{file_hash}{file_extension}"
+    
+    def _fetch(self, url: str, timeout: int) -> Optional[bytes]:
+        """
+        Baixa o conteúdo bruto de uma imagem.
         
         Args:
             url: URL da imagem.
-            cache_path: Caminho para salvar a imagem em cache.
             timeout: Tempo máximo de espera para o download.
             
         Returns:
-            Um QPixmap com a imagem ou None em caso de erro.
+            Os bytes baixados ou None em caso de erro (ou se a resposta não
+            for uma imagem).
         """
         try:
             logger.info(f"Baixando imagem: {url}")
             response = requests.get(url, timeout=timeout, stream=True)
             response.raise_for_status()
             
+            content_type = response.headers.get('Content-Type', '')
+            if content_type and not content_type.startswith('image/'):
+                logger.error(f"Resposta não é uma imagem ({content_type}): {url}")
+                return None
+            
             # Lê o conteúdo em blocos para lidar com imagens grandes
-            content = b''
-            for chunk in response.iter_content(chunk_size=8192):
-                content += chunk
+            return b''.join(response.iter_content(chunk_size=8192))
+        except requests.RequestException as e:
+            logger.error(f"Erro ao baixar imagem {url}: {e}")
+        except Exception as e:
+            logger.error(f"Erro inesperado ao baixar imagem {url}: {e}", exc_info=True)
+        return None
+    
+    def _download_image(self, url: str, cache_path: Path, timeout: int) -> Optional[QImage]:
+        """
+        Baixa uma imagem e salva no cache.
+        
+        Args:
+            url: URL da imagem.
+            cache_path: Caminho para salvar a imagem em cache.
+            timeout: Tempo máximo de espera para o download.
             
-            # Carrega a imagem
-            pixmap = QPixmap()
-            if pixmap.loadFromData(content):
+        Returns:
+            A imagem decodificada ou None em caso de erro.
+        """
+        content = self._fetch(url, timeout)
+        if content is None:
+            return None
+        
+        try:
+            # Decodifica a imagem (QImage é seguro fora da thread da interface)
+            image = QImage.fromData(content)
+            if not image.isNull():
                 # Salva a imagem no cache
                 with open(cache_path, 'wb') as f:
                     f.write(content)
                 logger.debug(f"Imagem salva em cache: {cache_path}")
-                return pixmap
+                return image
             else:
                 logger.error(f"Falha ao carregar imagem de dados baixados: {url}")
-                
-        except requests.RequestException as e:
-            logger.error(f"Erro ao baixar imagem {url}: {e}")
         except Exception as e:
             logger.error(f"Erro inesperado ao processar imagem {url}: {e}", exc_info=True)
         
@@ -137,19 +235,158 @@ class ImageCache:
             logger.error(f"Erro ao verificar tamanho do cache: {e}")
 
 
+def _downscale(image: QImage, size: Tuple[int, int]) -> QImage:
+    """
+    Reduz a imagem para caber em ``size`` mantendo a proporção.
+    
+    Para reduções maiores que 2x, um primeiro passo rápido (sem filtragem)
+    leva a imagem ao dobro do tamanho final e só então o passo suave é
+    aplicado: o filtro bilinear percorre uma imagem muito menor que a
+    original com resultado visual equivalente.
+    """
+    width, height = size
+    if image.width() > 2 * width and image.height() > 2 * height:
+        image = image.scaled(2 * width, 2 * height, Qt.KeepAspectRatio, Qt.FastTransformation)
+    return image.scaled(width, height, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+
+
 # Instância global do cache de imagens
 image_cache = ImageCache()
 
-# Função de conveniência para compatibilidade com código legado
-def baixar_imagem(url: str, timeout: int = 10) -> Optional[QPixmap]:
+# Pool de E/S compartilhado, criado sob demanda
+_io_executor: Optional[ThreadPoolExecutor] = None
+
+# Cargas em andamento por (url, tamanho): pedidos repetidos da mesma capa
+# compartilham o mesmo Future
+_inflight: Dict[Tuple[str, Optional[Tuple[int, int]]], Future] = {}
+# Downloads da pré-carga em andamento por URL; uma carga da mesma URL espera
+# o download terminar e então lê do cache em disco
+_downloads: Dict[str, Future] = {}
+_inflight_lock = threading.Lock()
+
+
+def _get_io_executor() -> ThreadPoolExecutor:
+    """Retorna o pool de threads usado para baixar e decodificar imagens."""
+    global _io_executor
+    if _io_executor is None:
+        _io_executor = ThreadPoolExecutor(max_workers=_IO_WORKERS, thread_name_prefix="nix-images")
+    return _io_executor
+
+
+def baixar_imagem(url: str, callback: Optional[Callable[[Optional[QImage]], None]] = None,
+                  timeout: int = 10, size: Optional[Tuple[int, int]] = None):
     """
-    Função de conveniência para compatibilidade com código legado.
+    Baixa (ou lê do cache) uma imagem.
+    
+    Sem ``callback``, mantém o comportamento legado: executa na thread
+    chamadora e retorna um QPixmap. Com ``callback``, o download, a
+    decodificação e o redimensionamento rodam no pool de E/S e o callback é
+    chamado *nessa thread* com um QImage (ou None em caso de erro); quem
+    atualiza widgets deve repassá-lo à thread da interface, por exemplo
+    emitindo um sinal.
     
     Args:
         url: URL da imagem a ser baixada.
+        callback: Função chamada com o QImage resultante.
         timeout: Tempo máximo de espera para o download em segundos.
+        size: (largura, altura) para redimensionar a imagem no pool de E/S.
         
     Returns:
-        Um QPixmap com a imagem ou None em caso de erro.
+        Um QPixmap (ou None) sem callback; com callback, o Future da carga
+        (possivelmente compartilhado com outro pedido da mesma imagem).
     """
-    return image_cache.get_image(url, timeout)
+    if callback is None:
+        return image_cache.get_image(url, timeout)
+    
+    future = _submit_load(url, size, timeout)
+    future.add_done_callback(lambda f: callback(f.result()))
+    return future
+
+
+def prefetch_images(urls: Iterable[str], timeout: int = 10) -> List[Future]:
+    """
+    Agenda no pool de E/S o download das imagens que faltam no cache em disco.
+    
+    Chamado quando a lista de jogos muda, antes de os cartões existirem: as
+    capas baixam em paralelo (limitado por ``_IO_WORKERS``) direto para o
+    cache em disco, sem decodificar nem redimensionar; imagens já em cache
+    custam só um ``stat`` no pool. A decodificação fica para o cartão que
+    exibir a capa, que espera um download ainda em andamento da mesma URL.
+    
+    Args:
+        urls: URLs das imagens (vazias e repetidas são ignoradas).
+        timeout: Tempo máximo de espera para cada download em segundos.
+        
+    Returns:
+        Os Futures agendados, cujo resultado indica se a imagem está em cache.
+    """
+    return [_submit_download(url, timeout) for url in dict.fromkeys(urls) if url]
+
+
+def _submit_download(url: str, timeout: int) -> Future:
+    """Agenda ``ensure_cached`` no pool, reaproveitando um download em andamento."""
+    with _inflight_lock:
+        future = _downloads.get(url)
+        if future is not None:
+            return future
+        future = _get_io_executor().submit(_download_task, url, timeout)
+        _downloads[url] = future
+    future.add_done_callback(lambda f: _forget(_downloads, url, f))
+    return future
+
+
+def _submit_load(url: str, size: Optional[Tuple[int, int]], timeout: int) -> Future:
+    """Agenda ``load_image`` no pool, reaproveitando uma carga já em andamento.
+    
+    Se a pré-carga ainda estiver baixando a mesma URL, a carga só é agendada
+    quando o download termina (sem ocupar uma thread do pool esperando).
+    """
+    key = (url, size)
+    with _inflight_lock:
+        future = _inflight.get(key)
+        if future is not None:
+            return future
+        download = _downloads.get(url)
+        if download is None:
+            future = _get_io_executor().submit(_load_task, url, size, timeout)
+        else:
+            future = Future()
+            download.add_done_callback(lambda _: _chain_load(future, url, size, timeout))
+        _inflight[key] = future
+    future.add_done_callback(lambda f: _forget(_inflight, key, f))
+    return future
+
+
+def _chain_load(future: Future, url: str, size: Optional[Tuple[int, int]], timeout: int) -> None:
+    """Agenda a carga adiada por um download e repassa o resultado a ``future``."""
+    try:
+        inner = _get_io_executor().submit(_load_task, url, size, timeout)
+    except RuntimeError:  # Pool encerrado (saída do programa)
+        future.set_result(None)
+        return
+    inner.add_done_callback(lambda f: future.set_result(f.result()))
+
+
+def _forget(registry: Dict[Any, Future], key: Any, future: Future) -> None:
+    """Remove uma tarefa concluída do registro de tarefas em andamento."""
+    with _inflight_lock:
+        if registry.get(key) is future:
+            del registry[key]
+
+
+def _download_task(url: str, timeout: int) -> bool:
+    """Baixa uma imagem para o cache no pool de E/S sem deixar exceções escaparem."""
+    try:
+        return image_cache.ensure_cached(url, timeout=timeout)
+    except Exception as e:
+        logger.error(f"Erro ao baixar imagem {url}: {e}", exc_info=True)
+        return False
+
+
+def _load_task(url: str, size: Optional[Tuple[int, int]], timeout: int) -> Optional[QImage]:
+    """Carrega uma imagem no pool de E/S sem deixar exceções escaparem."""
+    try:
+        return image_cache.load_image(url, size=size, timeout=timeout)
+    except Exception as e:
+        logger.error(f"Erro ao carregar imagem {url}: {e}", exc_info=True)
+        return None
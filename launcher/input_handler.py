@@ -15,20 +15,27 @@ Características principais:
 
 from __future__ import annotations
 
+import array
+import asyncio
+import functools
+import io
 import os
+import selectors
 import sys
 import time
 import logging
 import logging.handlers
+import math
 import threading
-from dataclasses import dataclass, field
-from enum import Enum, auto, unique
+from enum import IntEnum, auto, unique
+from operator import attrgetter
 from pathlib import Path
-from typing import (
-    Any, Callable, ClassVar, Dict, List, Literal, Optional, 
-    Tuple, TypedDict, TypeVar, Union, cast, overload
-)
-from typing_extensions import Self
+from typing import TYPE_CHECKING, Callable, Literal, TypedDict, Union
+
+if TYPE_CHECKING:  # Usados apenas em anotações (avaliadas de forma preguiçosa)
+    from typing import Any, ClassVar, Dict, List, Optional, Tuple
+    
+    InputBatchCallback = Callable[[Tuple['InputEvent', ...]], None]  # Um lote por leitura
 
 # Configuração de logging avançada
 def setup_logging(log_level: int = logging.INFO, log_file: str = 'nix_launcher.log') -> None:
@@ -73,13 +80,37 @@ def setup_logging(log_level: int = logging.INFO, log_file: str = 'nix_launcher.l
     root_logger.addHandler(file_handler)
     root_logger.addHandler(console_handler)
 
-# Configura o logging ao importar o módulo
-setup_logging()
+# A configuração global de logging é opcional: bibliotecas não devem
+# alterar o logger raiz ao serem importadas.
+if os.environ.get('NIX_AUTO_LOG_SETUP'):
+    setup_logging()
+
 logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
 
 # Constantes
 DEFAULT_DEADZONE = 0.2  # 20% de zona morta padrão
 EVENT_LOOP_SLEEP = 0.005  # 5ms entre iterações do loop de eventos
+DEBOUNCE_NS = 50_000_000  # 50ms entre eventos repetidos da mesma tecla
+
+# Relógio dos timestamps dos eventos, em nanossegundos. No Linux usa o
+# CLOCK_MONOTONIC_COARSE (mesma base do monotonic, resolução de um tick do
+# kernel, ~1-4ms) que é lido da vDSO sem consultar o contador da CPU; a
+# resolução basta para o debounce de teclado e para medir intervalos.
+# O módulo time não exporta a constante; 6 é o valor do <linux/time.h>
+_CLOCK_MONOTONIC_COARSE = 6
+_now_ns: Callable[[], int] = time.monotonic_ns
+if sys.platform.startswith('linux'):
+    try:
+        time.clock_gettime_ns(_CLOCK_MONOTONIC_COARSE)
+    except (AttributeError, OSError):
+        pass  # Kernel/plataforma sem o relógio: mantém time.monotonic_ns
+    else:
+        _now_ns = functools.partial(time.clock_gettime_ns, _CLOCK_MONOTONIC_COARSE)
+
+# Tempo máximo de espera pela thread de captura em stop(); só é atingido
+# quando ela está bloqueada em get_gamepad() (sem descritor para acordar)
+_STOP_JOIN_TIMEOUT = 2.0
 
 # Tipos personalizados
 GamepadType = Literal['xbox', 'playstation', 'nintendo', 'generic', 'unknown']
@@ -147,13 +178,16 @@ except (ImportError, OSError) as e:
     
     devices = DeviceManager()  # type: ignore
 
-class Button(Enum):
+class Button(IntEnum):
     """Enumeração de botões e eixos suportados do gamepad.
     
     Esta classe define todos os controles suportados pelo sistema, incluindo botões
     digitais, gatilhos analógicos e eixos de joystick. Os valores são mapeados
     para códigos de entrada físicos através do dicionário BUTTON_MAPPING.
     
+    Derivada de ``IntEnum``: membros são inteiros, comparados e usados como
+    índice das tabelas de estado sem passar por ``Enum.__eq__``/``__hash__``.
+    
     Exemplo de uso:
         >>> from launcher.input_handler import Button, InputHandler
         >>> 
@@ -217,7 +251,92 @@ class Button(Enum):
     LEFT_TRIGGER = auto()   # Gatilho esquerdo (valor analógico)
     RIGHT_TRIGGER = auto()  # Gatilho direito (valor analógico)
 
-@dataclass
+# Tamanho das listas de estado indexadas por Button.value (auto() começa em 1)
+_BUTTON_SLOTS = max(b.value for b in Button) + 1
+
+# Eixos contínuos; os demais botões só assumem os estados 0 e 1
+_ANALOG_BUTTONS = frozenset({
+    Button.LEFT_X, Button.LEFT_Y, Button.RIGHT_X, Button.RIGHT_Y,
+    Button.LEFT_TRIGGER, Button.RIGHT_TRIGGER,
+})
+_DIGITAL_BUTTONS = tuple(b for b in Button if b not in _ANALOG_BUTTONS)
+
+# Tabelas de normalização (int16 -> float) para eixos analógicos do evdev
+_AXIS_OFFSET = 32768
+_AXIS_LUT_SIZE = 65536
+# Nomes de eixos internados: as chaves do mapeamento usam as mesmas instâncias,
+# então as consultas nos conjuntos resolvem por identidade após o hash
+_TRIGGER_AXES = frozenset(map(sys.intern, ('ABS_Z', 'ABS_RZ', 'ABS_BRAKE', 'ABS_GAS')))
+_HAT_AXES = frozenset(map(sys.intern, ('ABS_HAT0X', 'ABS_HAT0Y')))
+
+
+def _normalize_axis(raw: float, inv_scale: float, offset: float,
+                    deadzone: float, low: float = -1.0) -> float:
+    """Núcleo aritmético da normalização de eixos: escala, limite e zona morta.
+    
+    Função pura e sem validações, usada para montar as tabelas de consulta
+    (``_build_axis_lut``). ``InputHandler._normalize_axis_value`` repete a mesma
+    escala e limite em linha, sem a zona morta.
+    
+    Args:
+        raw: Valor bruto já deslocado para começar em zero.
+        inv_scale: Fator de escala (inverso da amplitude).
+        offset: Deslocamento somado após a escala.
+        deadzone: Valores com módulo abaixo deste limiar viram 0.0.
+        low: Limite inferior do resultado (-1.0 para joysticks, 0.0 para gatilhos).
+        
+    Returns:
+        float: Valor normalizado no intervalo [low, 1.0].
+    """
+    value = raw * inv_scale + offset
+    if value < low:
+        value = low
+    elif value > 1.0:
+        value = 1.0
+    if -deadzone < value < deadzone:
+        return 0.0
+    return value
+
+
+@functools.lru_cache(maxsize=8)
+def _build_axis_lut(is_trigger: bool, deadzone: float) -> array.array:
+    """Pré-calcula o valor normalizado de cada leitura bruta de 16 bits.
+    
+    A tabela é indexada por ``raw + 32768`` e já inclui a zona morta, de modo
+    que o processamento de um eixo se reduz a uma única consulta. Tabelas são
+    compartilhadas entre instâncias com a mesma zona morta.
+    
+    Args:
+        is_trigger: True para gatilhos ([0.0, 1.0]), False para joysticks ([-1.0, 1.0]).
+        deadzone: Zona morta aplicada na base (gatilhos) ou no centro (joysticks).
+        
+    Returns:
+        array.array: Tabela ``'d'`` com 65536 entradas (float64, os mesmos
+        valores da aritmética de ``InputHandler._normalize_axis_value``).
+    """
+    # Fatores de escala e deslocamento calculados uma única vez por tabela
+    if is_trigger:
+        inv_scale, offset, low = 1.0 / (_AXIS_LUT_SIZE - 1), 0.0, 0.0
+    else:
+        inv_scale, offset, low = 2.0 / (_AXIS_LUT_SIZE - 1), -1.0, -1.0
+    return array.array('d', (_normalize_axis(i, inv_scale, offset, deadzone, low)
+                             for i in range(_AXIS_LUT_SIZE)))
+
+# Extrai (ev_type, code, state) de um evento bruto em uma única chamada
+_event_fields = attrgetter('ev_type', 'code', 'state')
+
+# Tipos de evento do evdev (strings internadas para comparação rápida)
+_EV_KEY = sys.intern("Key")
+_EV_ABSOLUTE = sys.intern("Absolute")
+
+# Tipo de tratamento de cada código na tabela de despacho do gamepad
+_KIND_DIGITAL = 0  # Botão digital (evento Key)
+_KIND_DPAD = 1     # Eixo HAT do D-Pad (evento Absolute)
+_KIND_AXIS = 2     # Joystick ou gatilho analógico (evento Absolute)
+
+# Tipos de evento repassados ao despacho; Sync/Misc são descartados na leitura
+_DISPATCHED_EV_TYPES = frozenset({_EV_KEY, _EV_ABSOLUTE})
+
 class InputEvent:
     """Representa um evento de entrada do usuário, como pressionamento de botão ou movimento de eixo.
     
@@ -242,20 +361,35 @@ class InputEvent:
                - Para eixos analógicos: valor normalizado entre -1.0 e 1.0.
                - Para gatilhos analógicos: valor normalizado entre 0.0 e 1.0.
         is_analog: Indica se o evento é de um controle analógico (True) ou digital (False).
-        timestamp: Timestamp em segundos desde a época (time.time()) quando o evento ocorreu.
+        timestamp: Instante do evento em nanossegundos (relógio monotônico).
         
     Notas:
         - Para botões digitais, os eventos de pressionar e soltar são enviados separadamente.
         - Para controles analógicos, eventos são enviados continuamente enquanto o valor muda.
-        - O valor do timestamp é o mesmo retornado por time.time() no momento do evento.
+        - O timestamp vem de um relógio monotônico: serve para medir intervalos entre
+          eventos, mas não representa data/hora de parede.
     """
-    button: Button
-    state: Union[int, float]
-    is_analog: bool = False
-    timestamp: float = field(default_factory=time.time)
+    # Slots em vez de __dict__: instâncias menores e acesso mais rápido aos campos.
+    # A classe continua mutável porque os eventos digitais são pré-alocados e
+    # reutilizados, tendo apenas o timestamp atualizado a cada envio.
+    __slots__ = ('button', 'state', 'is_analog', 'timestamp')
     
-    def __post_init__(self) -> None:
-        """Valida os valores após a inicialização."""
+    def __init__(self, button: Button, state: Union[int, float],
+                 is_analog: bool = False, timestamp: Optional[int] = None) -> None:
+        """Inicializa e valida o evento.
+        
+        Args:
+            button: Botão ou eixo que gerou o evento.
+            state: Estado do controle (0/1 para digitais, float para analógicos).
+            is_analog: Indica se o evento é analógico.
+            timestamp: Instante em nanossegundos; padrão: relógio monotônico
+                (``_now_ns``, de baixa resolução no Linux).
+        """
+        self.button = button
+        self.state = state
+        self.is_analog = is_analog
+        self.timestamp = _now_ns() if timestamp is None else timestamp
+        
         if not isinstance(self.button, Button):
             raise TypeError(f"button deve ser do tipo Button, não {type(self.button).__name__}")
             
@@ -264,6 +398,15 @@ class InputEvent:
         elif not self.is_analog and not isinstance(self.state, int):
             raise TypeError("Para eventos digitais, state deve ser int (0 ou 1)")
     
+    def __eq__(self, other: object) -> bool:
+        """Compara todos os campos do evento."""
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (self.button, self.state, self.is_analog, self.timestamp) == (
+            other.button, other.state, other.is_analog, other.timestamp)
+    
+    __hash__ = None  # Mutável: não pode ser usado como chave de dicionário
+    
     def __str__(self) -> str:
         """Retorna uma representação legível do evento."""
         event_type = "Analog" if self.is_analog else "Digital"
@@ -341,7 +484,7 @@ class InputHandler:
     Atributos:
         DEFAULT_KEYBOARD_MAPPING (ClassVar[Dict[str, Button]]): Mapeamento padrão de 
             teclas para botões do gamepad.
-        BUTTON_MAPPING (ClassVar[Dict[str, Union[Button, Tuple[Button, Button]]]]): 
+        BUTTON_MAPPING (ClassVar[Dict[str, Union[Button, Tuple[Optional[Button], ...]]]]): 
             Mapeamento de códigos de botão para a enumeração Button.
             
     Raises:
@@ -349,6 +492,17 @@ class InputHandler:
         TypeError: Se o callback fornecido não for chamável.
     """
     
+    # Atributos de instância em slots: acesso mais rápido no caminho quente e
+    # menor consumo de memória. Novos atributos precisam ser declarados aqui.
+    __slots__ = (
+        'on_input_event', 'on_input_batch', '_cb', '_batch', '_stop_event', '_thread',
+        '_last_state', '_key_event_timestamps', '_deadzone', '_gamepad_type',
+        '_digital_events', '_dpad_pressed', '_dpad_events', '_axis_luts', '_gamepad_device',
+        '_async_loop', '_async_stop', '_initialized', '_keyboard_mapping', '_keyboard_lookup',
+        '_dispatch', '_wake_fds', '_debug_reraise',
+        '_dbg', '__weakref__',
+    )
+    
     # Mapeamento padrão de teclado para botões do gamepad
     DEFAULT_KEYBOARD_MAPPING: ClassVar[Dict[str, Button]] = {
         # Navegação
@@ -383,7 +537,7 @@ class InputHandler:
     }
     
     # Mapeamento de códigos de botão para a enumeração Button
-    BUTTON_MAPPING: ClassVar[Dict[str, Union[Button, Tuple[Button, Button]]]] = {
+    BUTTON_MAPPING: ClassVar[Dict[str, Union[Button, Tuple[Optional[Button], ...]]]] = {
         # Mapeamento de botões Xbox/PS4
         'BTN_SOUTH': Button.A,      # A (Xbox) / Cross (PS)
         'BTN_EAST': Button.B,       # B (Xbox) / Circle (PS)
@@ -406,8 +560,9 @@ class InputHandler:
         'ABS_RZ': Button.RIGHT_TRIGGER, # Gatilho direito analógico
         
         # D-Pad (tratado como eixos)
-        'ABS_HAT0Y': (Button.DPAD_UP, Button.DPAD_DOWN),   # Eixo Y do D-Pad
-        'ABS_HAT0X': (Button.DPAD_LEFT, Button.DPAD_RIGHT), # Eixo X do D-Pad
+        # Tabelas (negativo, neutro, positivo) indexadas por sign(estado) + 1
+        'ABS_HAT0Y': (Button.DPAD_UP, None, Button.DPAD_DOWN),    # Eixo Y do D-Pad
+        'ABS_HAT0X': (Button.DPAD_LEFT, None, Button.DPAD_RIGHT), # Eixo X do D-Pad
     }
     
     def __init__(
@@ -416,7 +571,8 @@ class InputHandler:
         deadzone: float = DEFAULT_DEADZONE,
         poll_interval: float = EVENT_LOOP_SLEEP,
         keyboard_mapping: Optional[Dict[str, Button]] = None,
-        gamepad_mapping: Optional[Dict[str, Union[Button, Tuple[Button, Button]]]] = None
+        gamepad_mapping: Optional[Dict[str, Union[Button, Tuple[Button, Button]]]] = None,
+        on_input_batch: Optional[InputBatchCallback] = None
     ) -> None:
         """Inicializa o manipulador de entradas com configurações personalizáveis.
         
@@ -464,6 +620,10 @@ class InputHandler:
             gamepad_mapping (Optional[Dict[str, Union[Button, Tuple[Button, Button]]]], optional): 
                 Dicionário para mapeamento personalizado de botões do gamepad. 
                 Padrão: None.
+            on_input_batch (Optional[InputBatchCallback], optional):
+                Callback em lote. Se fornecido, substitui ``on_input_event`` no
+                despacho e é chamado uma única vez por leitura do dispositivo com
+                a tupla de eventos produzidos. Padrão: None.
                            
         Raises:
             TypeError: Se on_input_event não for callable ou se os tipos dos parâmetros 
@@ -489,13 +649,31 @@ class InputHandler:
             
         # Inicialização dos atributos básicos
         self.on_input_event = on_input_event
-        self._running: bool = False
+        self.on_input_batch = on_input_batch
+        self._batch: List[InputEvent] = []  # Eventos acumulados da leitura atual
+        self._cb: Optional[InputCallback] = None
+        self._bind_callback()  # Atualizado novamente em start()/run()
+        self._stop_event = threading.Event()
+        self._stop_event.set()  # Sinalizado enquanto o loop não está em execução
         self._thread: Optional[threading.Thread] = None
-        self._last_events: Dict[Button, Union[int, float]] = {}
-        self._key_event_timestamps: Dict[Button, float] = {}  # Rastreia timestamps dos eventos de teclado
+        # Caches de estado indexados por Button.value (arrays planos, sem hashing).
+        # NaN marca "sem estado anterior": qualquer comparação com NaN é falsa
+        self._last_state = array.array('d', [math.nan]) * _BUTTON_SLOTS
+        self._key_event_timestamps: List[int] = [0] * _BUTTON_SLOTS  # Timestamps (ns) dos eventos de teclado
         self._deadzone: float = 0.2  # 20% de zona morta padrão
-        self._callback_error_count: int = 0  # Contador de erros no callback
         self._gamepad_type: str = "unknown"
+        # Eventos digitais pré-alocados, indexados por [Button.value][estado]
+        self._digital_events: List[Optional[Tuple[InputEvent, InputEvent]]] = [None] * _BUTTON_SLOTS
+        for b in _DIGITAL_BUTTONS:
+            self._digital_events[b.value] = (InputEvent(b, 0, False, 0), InputEvent(b, 1, False, 0))
+        self._dpad_pressed: Dict[str, Optional[Tuple[InputEvent, InputEvent]]] = {}  # Par pressionado por eixo HAT
+        self._axis_luts: Dict[str, array.array] = {}  # Tabela de normalização por código de eixo
+        self._gamepad_device: Optional[Any] = None  # Dispositivo em modo não bloqueante (Linux)
+        self._async_loop: Optional[asyncio.AbstractEventLoop] = None  # Loop usado por run()
+        self._async_stop: Optional[asyncio.Event] = None
+        self._wake_fds: Optional[Tuple[int, int]] = None  # Pipe para acordar o seletor em stop()
+        self._debug_reraise: bool = False  # Se True, erros no processamento de eventos são propagados
+        self._dbg: bool = logger.isEnabledFor(logging.DEBUG)  # Atualizado em start()/run()
         self._initialized: bool = True  # Flag para verificação no __del__
         
         # Inicializa o mapeamento de teclado com uma cópia do mapeamento padrão
@@ -504,6 +682,8 @@ class InputHandler:
         except Exception as e:
             logger.error("Falha ao copiar o mapeamento padrão do teclado: %s", str(e))
             self._keyboard_mapping = {}
+        self._keyboard_lookup: Dict[str, Button] = {}
+        self._build_keyboard_lookup()
         
         # Configura o mapeamento específico para o sistema operacional
         if GAMEPAD_AVAILABLE:
@@ -518,7 +698,40 @@ class InputHandler:
                 # Não levantamos a exceção aqui para permitir que o teclado continue funcionando
         else:
             logger.info("Nenhum gamepad detectado, apenas suporte a teclado disponível")
+        
+        # Tabela de despacho do gamepad, montada após a detecção do modelo
+        self._dispatch: Dict[str, Dict[str, Tuple[int, Any, str]]] = {}
+        self._build_dispatch()
+        
+        # Eventos pré-alocados do D-Pad por eixo: (negativo, neutro, positivo),
+        # onde cada direção guarda o par (soltar, pressionar)
+        digital = self._digital_events
+        self._dpad_events: Dict[str, Tuple[Any, ...]] = {
+            axis: tuple(None if b is None else digital[b.value] for b in self.BUTTON_MAPPING[axis])
+            for axis in _HAT_AXES if axis in self.BUTTON_MAPPING
+        }
                 
+    def _build_dispatch(self) -> None:
+        """Pré-calcula a tabela ``tipo de evento -> código -> tratamento``.
+        
+        Cada entrada guarda ``(tipo de tratamento, botão ou tabela do D-Pad,
+        código canônico)``, de modo que ``_process_gamepad_event_fast`` resolve
+        tudo com duas consultas a dicionário, sem a cadeia de comparações de
+        tipo de evento e de pertinência aos eixos HAT. Os códigos são
+        registrados no original e em maiúsculas (ambos internados); o código
+        original tem prioridade.
+        """
+        key_table: Dict[str, Tuple[int, Any, str]] = {}
+        abs_table: Dict[str, Tuple[int, Any, str]] = {}
+        for case_variant in (False, True):
+            for code, button_info in self.BUTTON_MAPPING.items():
+                key = sys.intern(code.upper() if case_variant else code)
+                if isinstance(button_info, Button):
+                    key_table.setdefault(key, (_KIND_DIGITAL, button_info, code))
+                kind = _KIND_DPAD if code in _HAT_AXES else _KIND_AXIS
+                abs_table.setdefault(key, (kind, button_info, code))
+        self._dispatch = {_EV_KEY: key_table, _EV_ABSOLUTE: abs_table}
+    
     def __del__(self):
         """Libera recursos ao destruir a instância.
         
@@ -526,7 +739,7 @@ class InputHandler:
         for destruído pelo coletor de lixo.
         """
         # Verifica se o objeto foi inicializado corretamente
-        if hasattr(self, '_initialized') and self._initialized and self._running:
+        if hasattr(self, '_initialized') and self._initialized and self.is_running():
             try:
                 logger.debug("Destruindo InputHandler, parando thread de captura...")
                 self.stop()
@@ -534,6 +747,15 @@ class InputHandler:
                 # Evita exceções durante a coleta de lixo
                 logger.error("Erro ao parar o InputHandler durante a destruição: %s", str(e))
                 logger.debug("Detalhes do erro:", exc_info=True)
+        
+        # Fecha o pipe de despertar do seletor, se tiver sido criado
+        wake_fds = getattr(self, '_wake_fds', None)
+        if wake_fds is not None:
+            for fd in wake_fds:
+                try:
+                    os.close(fd)
+                except OSError:
+                    pass
     
     def _detect_gamepad_type(self) -> None:
         """Detecta o tipo de gamepad conectado e ajusta os mapeamentos.
@@ -686,6 +908,13 @@ class InputHandler:
         
         # Log final com o tipo detectado
         logger.info("Tipo de gamepad detectado: %s", self._gamepad_type)
+        
+        # Pré-calcula as tabelas de normalização agora, e não no primeiro
+        # movimento de eixo dentro do laço de eventos
+        for axis_name, button in self.BUTTON_MAPPING.items():
+            if button in _ANALOG_BUTTONS and axis_name not in self._axis_luts:
+                self._axis_luts[axis_name] = _build_axis_lut(
+                    axis_name in _TRIGGER_AXES, self._deadzone)
     
     def _normalize_axis_value(self, value: Union[int, float], min_val: Union[int, float], 
                             max_val: Union[int, float]) -> float:
@@ -719,28 +948,28 @@ class InputHandler:
             >>> handler._normalize_axis_value(255, 0, 255)  # Máximo
             1.0
         """
-        # Validação dos tipos dos parâmetros
-        if not all(isinstance(x, (int, float)) for x in (value, min_val, max_val)):
+        # Validações de tipo ficam restritas ao modo de depuração
+        if __debug__ and not all(isinstance(x, (int, float)) for x in (value, min_val, max_val)):
             raise TypeError("Todos os parâmetros devem ser numéricos")
             
-        # Validação dos limites
+        # Validação dos limites (também garante que não há divisão por zero)
         if min_val >= max_val:
             raise ValueError(f"min_val ({min_val}) deve ser menor que max_val ({max_val})")
             
-        # Se o valor já estiver normalizado, retorna diretamente (com validação)
-        if -1.0 <= value <= 1.0 and min_val == -1.0 and max_val == 1.0:
-            return float(value)
-            
-        # Garante que o valor está dentro dos limites (clamping)
-        clamped_value = max(min_val, min(value, max_val))
+        # Faixa de 16 bits (a dos eixos do evdev): uma consulta à tabela
+        # pré-calculada, sem zona morta, substitui a aritmética
+        if max_val - min_val == _AXIS_LUT_SIZE - 1 and type(value) is int and type(min_val) is int:
+            index = value - min_val
+            if index <= 0:
+                return -1.0
+            if index >= _AXIS_LUT_SIZE - 1:
+                return 1.0
+            return _build_axis_lut(False, 0.0)[index]
         
-        # Evita divisão por zero (embora já coberto pela validação acima)
-        if min_val == max_val:
-            return 0.0
-            
-        # Normaliza para [0, 1] e depois converte para [-1, 1]
-        normalized = (clamped_value - min_val) / (max_val - min_val)
-        return (normalized * 2.0) - 1.0
+        # Mapeia linearmente [min_val, max_val] para [-1, 1] e limita o resultado,
+        # dispensando o clamping prévio da entrada
+        v = (value - min_val) * (2.0 / (max_val - min_val)) - 1.0
+        return -1.0 if v < -1.0 else 1.0 if v > 1.0 else v
     
     def _process_gamepad_event(self, event: RawInputEvent) -> None:
         """Processa um evento bruto do gamepad.
@@ -779,120 +1008,175 @@ class InputHandler:
             event = SimpleNamespace(ev_type='Absolute', code='ABS_X', state=16000)
             handler._process_gamepad_event(event)
         """
-        # Validação inicial rápida
+        try:
+            self._process_gamepad_event_fast(event)
+        except Exception as e:
+            self._on_error(e, event)
+    
+    def _process_gamepad_event_fast(self, event: RawInputEvent) -> None:
+        """Caminho rápido de ``_process_gamepad_event``, sem tratamento de exceções.
+        
+        Mantido enxuto de propósito: erros são tratados uma única vez pelo
+        chamador em ``_on_error`` (caminho frio).
+        
+        Args:
+            event: O evento bruto do gamepad a ser processado.
+        """
         if not GAMEPAD_AVAILABLE:
             return
-            
-        # Verificação de atributos obrigatórios
-        required_attrs = ('ev_type', 'code', 'state')
-        if not all(hasattr(event, attr) for attr in required_attrs):
-            logger.debug("Evento inválido: atributos ausentes: %s", 
-                        [attr for attr in required_attrs if not hasattr(event, attr)])
-            return
-            
-        try:
-            button: Optional[Union[Button, Tuple[Button, Button]]] = None
-            state: Optional[Union[int, float]] = None
-            is_analog: bool = False
-            
-            # Obtém o tipo de evento em maiúsculas para comparação consistente
-            event_type = str(event.ev_type).upper()
-            event_code = str(event.code).upper()
-            
-            # Processa botões digitais (Key events)
-            if event_type == 'KEY':
-                button = self.BUTTON_MAPPING.get(event_code)
-                
-                # Ignora eventos de botão não mapeados
-                if button is None:
-                    return
-                    
-                # Garante 0 (soltar) ou 1 (pressionar) para botões digitais
-                state = 1 if event.state else 0
-                is_analog = False
-            
-            # Processa eixos analógicos (Absolute events)
-            elif event_type == 'ABSOLUTE':
-                button_info = self.BUTTON_MAPPING.get(event_code)
-                
-                # Ignora eixos não mapeados
-                if button_info is None:
-                    return
-                    
-                is_analog = True
-                
-                # Trata D-Pad (eixos HAT) - delega para o método especializado
-                if event_code in ('ABS_HAT0Y', 'ABS_HAT0X') and isinstance(button_info, tuple):
-                    self._process_dpad_event(event_code, button_info, event.state)
-                    return
-                
-                # Processa outros tipos de eixos analógicos usando o método auxiliar
-                button, state = self._process_analog_axis(event_code, button_info, event.state)
-                if button is None or state is None:
-                    return  # Evento não processado ou inválido
-            else:
-                # Ignora tipos de evento desconhecidos
+        
+        # Extração dos três campos em uma única chamada em C; atributos ausentes
+        # levantam AttributeError, tratado em _on_error
+        event_type, event_code, raw_state = _event_fields(event)
+        
+        # Tabela do tipo de evento e, nela, o código original; a versão em
+        # maiúsculas só é calculada quando o código não é encontrado
+        table = self._dispatch.get(event_type)
+        if table is None:
+            # Ignora tipos de evento desconhecidos
+            if self._dbg:
                 logger.debug("Tipo de evento desconhecido: %s", event_type)
-                return
+            return
+        entry = table.get(event_code)
+        if entry is None:
+            entry = table.get(str(event_code).upper())
+            if entry is None:
+                return  # Ignora códigos não mapeados
+        kind, button_info, event_code = entry
+        
+        # Processa botões digitais (Key events)
+        if kind == _KIND_DIGITAL:
+            # Garante 0 (soltar) ou 1 (pressionar) para botões digitais
+            self._send_event(self._digital_event(button_info, 1 if raw_state else 0))
+            return
+        
+        # Trata D-Pad (eixos HAT) - delega para o método especializado
+        if kind == _KIND_DPAD:
+            self._process_dpad_event(event_code, button_info, raw_state)
+            return
+        
+        # Processa os demais eixos analógicos usando o método auxiliar
+        button, state = self._process_analog_axis(event_code, button_info, raw_state)
+        if button is None:
+            return  # Evento não processado ou inválido
+        
+        # Ignora mudanças muito pequenas (limiar de 1%)
+        if abs(self._last_state[button.value] - state) < 0.01:
+            return
+        
+        self._send_event(InputEvent(button, state, True))
+    
+    def _on_error(self, error: Exception, event: Any) -> None:
+        """Caminho frio: registra falhas ocorridas no processamento de um evento.
+        
+        Args:
+            error: Exceção levantada pelo caminho rápido.
+            event: Evento bruto que estava sendo processado.
             
-            # Validação final antes de enviar o evento
-            if button is not None and state is not None and isinstance(button, Button):
-                # Verifica se o estado mudou significativamente para eventos analógicos
-                if is_analog:
-                    last_state = self._last_events.get(button)
-                    if last_state is not None and abs(last_state - state) < 0.01:  # Limiar de 1%
-                        return  # Ignora mudanças muito pequenas
-                
-                # Envia o evento processado
-                self._send_event(InputEvent(button, state, is_analog))
-                
-        except Exception as e:
+        Raises:
+            Exception: A própria ``error`` quando veio do callback do usuário;
+                ela propaga para o loop de eventos, que a registra.
+        """
+        if self._raised_in_callback(error):
+            raise error
+        
+        if isinstance(error, AttributeError) and not all(
+                hasattr(event, attr) for attr in ('ev_type', 'code', 'state')):
+            logger.debug("Evento inválido: atributos ausentes")
+            return
+        
+        if logger.isEnabledFor(logging.ERROR):
             logger.error("Erro ao processar evento do gamepad (tipo: %s, código: %s, estado: %s): %s", 
                         getattr(event, 'ev_type', '?'),
                         getattr(event, 'code', '?'),
                         getattr(event, 'state', '?'),
-                        str(e))
-            logger.debug("Detalhes do erro:", exc_info=True)
-            if __debug__:  # Apenas levanta exceções em modo de depuração
-                raise
+                        error)
+        if self._dbg:
+            logger.debug("Detalhes do erro:", exc_info=error)
+        if self._debug_reraise:  # Propaga a exceção apenas quando solicitado (ex.: testes)
+            raise error
     
-    def _process_dpad_event(self, axis_name: str, button_info: Tuple[Button, Button], state: int) -> None:
+    @staticmethod
+    def _raised_in_callback(error: BaseException) -> bool:
+        """Indica se a exceção foi levantada dentro do callback de ``_send_event``.
+        
+        Percorre o traceback (só no caminho frio): se houver um quadro de
+        ``_send_event`` com chamadas abaixo dele, a falha ocorreu no callback.
+        """
+        send_code = InputHandler._send_event.__code__
+        tb = error.__traceback__
+        while tb is not None:
+            if tb.tb_frame.f_code is send_code and tb.tb_next is not None:
+                return True
+            tb = tb.tb_next
+        return False
+    
+    def _digital_event(self, button: Button, state: int) -> InputEvent:
+        """Retorna o evento digital pré-alocado para ``button``/``state``.
+        
+        Os eventos de pressionar/soltar são instâncias compartilhadas, criadas uma
+        única vez em ``__init__``; apenas o timestamp é atualizado. O callback não
+        deve modificar nem guardar referência ao evento recebido (crie uma cópia
+        com ``InputEvent(e.button, e.state, e.is_analog, e.timestamp)`` se precisar retê-lo).
+        
+        Args:
+            button: Botão digital que gerou o evento.
+            state: 0 (soltar) ou 1 (pressionar).
+            
+        Returns:
+            InputEvent: Instância compartilhada com o timestamp atual.
+        """
+        pair = self._digital_events[button.value]
+        if pair is None:  # Eixo analógico mapeado como digital (ex.: teclado)
+            return InputEvent(button, state, False)
+        event = pair[state]
+        event.timestamp = _now_ns()
+        return event
+    
+    def _process_dpad_event(self, axis_name: str, button_info: Tuple[Optional[Button], None, Optional[Button]],
+                            state: int) -> None:
         """Processa eventos do D-Pad (eixos HAT).
         
         O D-Pad é tratado como um par de botões digitais (cima/baixo ou esquerda/direita).
-        Quando o D-Pad é movido para uma direção, um botão é ativado (estado=1) e o outro
-        é desativado (estado=0). Quando o D-Pad retorna à posição neutra, ambos os botões
-        são desativados.
+        O botão correspondente ao estado é obtido diretamente da tabela de três
+        posições ``(negativo, neutro, positivo)`` indexada por ``sign(state) + 1``.
+        Apenas o lado atualmente pressionado é liberado ao passar pelo neutro ou
+        ao inverter a direção, gerando um único evento de soltura.
         
         Args:
             axis_name: Nome do eixo do D-Pad ('ABS_HAT0X' ou 'ABS_HAT0Y').
-            button_info: Tupla contendo os botões para as duas direções do eixo.
+            button_info: Tabela ``(negativo, None, positivo)`` com os botões do eixo;
+                os eventos enviados vêm das instâncias pré-alocadas em ``_dpad_events``.
             state: Estado atual do eixo (-1, 0 ou 1).
             
         Note:
-            - Para eixo X: button_info[0] = esquerda, button_info[1] = direita
-            - Para eixo Y: button_info[0] = cima, button_info[1] = baixo
+            - Para eixo X: negativo = esquerda, positivo = direita
+            - Para eixo Y: negativo = cima, positivo = baixo
         """
-        try:
-            if state == 0:  # D-Pad retornou à posição neutra
-                # Envia eventos de soltura para ambas as direções
-                button1, button2 = button_info
-                self._send_event(InputEvent(button1, 0, is_analog=False))
-                self._send_event(InputEvent(button2, 0, is_analog=False))
-            else:
-                # Determina qual botão do D-Pad foi pressionado
-                button = button_info[0] if state < 0 else button_info[1]
-                # Envia evento de pressão para o botão ativado
-                self._send_event(InputEvent(button, 1, is_analog=False))
-                
-                # Log detalhado apenas em modo debug
+        # Pares pré-alocados (soltar, pressionar) de cada direção do eixo
+        pairs = self._dpad_events[axis_name]
+        pair = pairs[(state > 0) - (state < 0) + 1]
+        pressed = self._dpad_pressed
+        previous = pressed.get(axis_name)
+        send = self._send_event
+        
+        if previous is not None and previous is not pair:
+            # Libera apenas o lado que estava pressionado
+            release = previous[0]
+            release.timestamp = _now_ns()
+            send(release)
+            pressed[axis_name] = None
+        
+        if pair is not None:
+            pressed[axis_name] = pair
+            press = pair[1]
+            press.timestamp = _now_ns()
+            send(press)
+            
+            # Log detalhado apenas em modo debug
+            if self._dbg:
                 logger.debug("D-Pad %s: %s ativado (estado=%d)", 
-                           axis_name, button.name, state)
-                
-        except Exception as e:
-            logger.error("Erro ao processar evento do D-Pad (%s, %s, %d): %s", 
-                       axis_name, str(button_info), state, str(e))
-            logger.debug("Detalhes do erro:", exc_info=True)
+                           axis_name, press.button.name, state)
     
     def _process_analog_axis(self, axis_name: str, button_info: Union[Button, Any], 
                            raw_value: Union[int, float]) -> Tuple[Optional[Button], Optional[float]]:
@@ -918,53 +1202,26 @@ class InputHandler:
             return None, None
             
         try:
-            state: Optional[float] = None
-            button = button_info
-            
-            # Converte para inteiro se for uma string
-            if isinstance(raw_value, str):
-                raw_value = int(raw_value)
-                
-            # Trata gatilhos analógicos (LT/RT) - normaliza para [0.0, 1.0]
-            if axis_name in ('ABS_Z', 'ABS_RZ', 'ABS_BRAKE', 'ABS_GAS'):
-                # Normaliza para 0.0 a 1.0 (assumindo faixa 0-255 para gatilhos)
-                try:
-                    normalized = (int(raw_value) + 32768) / 65535.0
-                    state = max(0.0, min(1.0, normalized))
-                    
-                    # Aplica zona morta na base do gatilho
-                    if state < self._deadzone:
-                        state = 0.0
-                        
-                except (TypeError, ValueError) as e:
-                    logger.warning("Valor inválido para gatilho %s: %s", 
-                                 axis_name, str(raw_value))
-                    return None, None
-                    
-            # Trata joysticks analógicos - normaliza para [-1.0, 1.0]
-            else:
-                try:
-                    # Normaliza para -1.0 a 1.0
-                    normalized = self._normalize_axis_value(int(raw_value), -32768, 32767)
-                    
-                    # Aplica zona morta central
-                    if abs(normalized) < self._deadzone:
-                        normalized = 0.0
-                        
-                    state = normalized
-                    
-                except (TypeError, ValueError) as e:
-                    logger.warning("Valor inválido para eixo %s: %s", 
-                                 axis_name, str(raw_value))
-                    return None, None
-            
-            return button, state
-            
-        except Exception as e:
-            logger.error("Erro ao processar eixo analítico %s: %s", 
-                       axis_name, str(e))
-            logger.debug("Detalhes do erro:", exc_info=True)
+            index = int(raw_value) + _AXIS_OFFSET
+        except (TypeError, ValueError):
+            logger.warning("Valor inválido para eixo %s: %s", 
+                         axis_name, raw_value)
             return None, None
+        
+        # Garante que o índice está dentro da faixa de 16 bits (clamping)
+        if index < 0:
+            index = 0
+        elif index > _AXIS_LUT_SIZE - 1:
+            index = _AXIS_LUT_SIZE - 1
+        
+        # Gatilhos (LT/RT) usam [0.0, 1.0]; joysticks usam [-1.0, 1.0].
+        # A normalização e a zona morta já estão pré-calculadas na tabela,
+        # resolvida uma única vez por código de eixo.
+        lut = self._axis_luts.get(axis_name)
+        if lut is None:
+            lut = self._axis_luts[axis_name] = _build_axis_lut(
+                axis_name in _TRIGGER_AXES, self._deadzone)
+        return button_info, lut[index]
     
     def _process_keyboard_event(self, event: RawInputEvent) -> None:
         """Processa um evento de teclado.
@@ -999,40 +1256,40 @@ class InputHandler:
             return
             
         try:
-            # Obtém o código da tecla em maiúsculas para consistência
-            key = str(event.code).upper()
-            
-            # Verifica se a tecla está mapeada para algum botão do gamepad
-            button = self._keyboard_mapping.get(key)
+            # Consulta direta pelo código original na tabela pré-validada; a
+            # versão em maiúsculas só é calculada quando não há correspondência
+            lookup = self._keyboard_lookup
+            button = lookup.get(event.code)
             if button is None:
-                return  # Ignora teclas não mapeadas
-                
-            # Verifica se o botão mapeado é válido
-            if not isinstance(button, Button):
-                logger.warning("Mapeamento de tecla inválido para '%s': %s", key, str(button))
-                return
+                button = lookup.get(str(event.code).upper())
+                if button is None:
+                    return  # Ignora teclas não mapeadas
                 
             # Verifica se já existe um evento pendente para este botão
-            current_time = time.time()
-            last_event_time = self._key_event_timestamps.get(button, 0)
+            current_time = _now_ns()
+            last_event_time = self._key_event_timestamps[button.value]
             
             # Aplica um atraso mínimo entre eventos do mesmo botão para evitar duplicação
-            min_key_repeat_delay = 0.05  # 50ms
-            if current_time - last_event_time < min_key_repeat_delay:
+            if current_time - last_event_time < DEBOUNCE_NS:
                 return
                 
             # Atualiza o timestamp do último evento para este botão
-            self._key_event_timestamps[button] = current_time
+            self._key_event_timestamps[button.value] = current_time
             
-            # Cria e envia o evento de entrada
-            input_event = InputEvent(button, 1, is_analog=False)
-            self._send_event(input_event)
+            # Cria o evento de entrada
+            input_event = self._digital_event(button, 1)
                 
         except Exception as e:
-            logger.error("Erro ao processar evento de teclado: %s", str(e))
-            logger.debug("Detalhes do erro:", exc_info=True)
-            if __debug__:  # Apenas levanta exceções em modo de depuração
+            logger.error("Erro ao processar evento de teclado: %s", e)
+            if self._dbg:
+                logger.debug("Detalhes do erro:", exc_info=True)
+            if self._debug_reraise:  # Propaga a exceção apenas quando solicitado (ex.: testes)
                 raise
+            return
+        
+        # Envia fora do bloco acima: exceções do callback não são engolidas
+        # aqui, propagam para o loop de eventos, que as registra
+        self._send_event(input_event)
     
     def _send_event(self, event: InputEvent) -> None:
         """Envia um evento de entrada processado para o callback registrado.
@@ -1060,156 +1317,308 @@ class InputHandler:
             AttributeError: Se o evento não tiver os atributos necessários.
             TypeError: Se o evento não for uma instância de InputEvent.
         """
-        # Validação inicial do evento
-        if not isinstance(event, InputEvent):
-            logger.error("Tipo de evento inválido: %s", type(event).__name__)
-            return
-            
-        if not hasattr(event, 'button') or not hasattr(event, 'state') or not hasattr(event, 'is_analog'):
-            logger.error("Evento de entrada inválido: atributos ausentes")
-            return
-            
-        # Verifica se há um callback registrado
-        if not hasattr(self, 'on_input_event') or not callable(self.on_input_event):
+        # Verifica se há um callback registrado (comparação única por identidade)
+        callback = self._cb
+        if callback is None:
             logger.warning("Nenhum callback registrado para eventos de entrada")
             return
+        
+        # Validação do tipo apenas em modo de depuração
+        if __debug__ and not isinstance(event, InputEvent):
+            logger.error("Tipo de evento inválido: %s", type(event).__name__)
+            return
             
         try:
             # Obtém o último estado registrado para este botão
-            last_state = self._last_events.get(event.button)
+            state = event.state
+            idx = event.button.value
+            states = self._last_state
+            last_state = states[idx]
             
             # Para eventos analógicos, verifica se a diferença é significativa
             if event.is_analog:
-                # Valida o estado do evento analógico
-                if not isinstance(event.state, (int, float)):
-                    logger.warning("Estado analógico inválido: %s", str(event.state))
-                    return
-                    
                 # Verifica se o estado está dentro dos limites esperados
-                if event.state < -1.0 or event.state > 1.0:
-                    logger.warning("Estado analógico fora do intervalo [-1.0, 1.0]: %f", event.state)
+                if state < -1.0 or state > 1.0:
+                    logger.warning("Estado analógico fora do intervalo [-1.0, 1.0]: %f", state)
                     # Normaliza para o intervalo válido
-                    event.state = max(-1.0, min(1.0, event.state))
+                    state = event.state = -1.0 if state < -1.0 else 1.0
                 
-                # Aplica o limiar apenas se houver um estado anterior para comparar
-                if last_state is not None:
-                    # Limiar de 5% para eventos analógicos (evita atualizações por ruído)
-                    if abs(event.state - last_state) < 0.05:
-                        return
+                # Limiar de 5% para eventos analógicos (evita atualizações por ruído)
+                if abs(state - last_state) < 0.05:
+                    return
             
             # Para botões digitais, verifica se o estado realmente mudou
-            elif not event.is_analog and last_state == event.state:
+            elif last_state == state:
                 return
-                
-            # Atualiza o último estado registrado
-            self._last_events[event.button] = event.state
+        except (AttributeError, TypeError) as e:
+            logger.error("Evento de entrada inválido: %s", e)
+            return
             
-            # Envia o evento para o callback registrado em um bloco try/except separado
-            # para garantir que erros no callback não afetem o processamento de eventos
+        # Atualiza o último estado registrado
+        states[idx] = state
+        
+        # Envia o evento para o callback registrado; exceções do callback
+        # propagam para o loop de eventos, que as registra
+        callback(event)
+    
+    def _read_gamepad_events(self) -> List[Any]:
+        """Lê de uma só vez todos os eventos pendentes do gamepad.
+        
+        No Linux o dispositivo de caractere do gamepad é colocado em modo não
+        bloqueante e os eventos enfileirados são drenados em um único laço,
+        amortizando o custo de cada despertar da thread entre vários eventos.
+        Nas demais plataformas (ou se o dispositivo não expuser o descritor),
+        recorre a ``get_gamepad()``.
+        
+        Returns:
+            List[Any]: Eventos brutos lidos (possivelmente vazia).
+        """
+        device = self._gamepad_device
+        if device is None:
+            if not sys.platform.startswith('linux') or not devices.gamepads:
+                return get_gamepad()
+            device = devices.gamepads[0]
             try:
-                self.on_input_event(event)
-            except Exception as callback_error:
-                logger.error("Erro no callback de evento de entrada: %s", str(callback_error))
-                logger.debug("Detalhes do erro no callback:", exc_info=True)
-                
-                # Se o callback falhar repetidamente, podemos querer desativá-lo
-                # para evitar sobrecarga do sistema de logs
-                if hasattr(self, '_callback_error_count'):
-                    self._callback_error_count += 1
-                    if self._callback_error_count > 10:  # Limite arbitrário
-                        logger.error("Muitos erros no callback, desativando...")
-                        self.on_input_event = None
-                else:
-                    self._callback_error_count = 1
-                
-        except Exception as e:
-            logger.error("Erro ao processar evento de entrada: %s", str(e))
-            logger.debug("Detalhes do erro:", exc_info=True)
-            if __debug__:  # Apenas levanta exceções em modo de depuração
-                raise
-
-    def _process_keyboard_event(self, event: RawInputEvent) -> None:
-        """Processa um evento de teclado.
+                os.set_blocking(device._character_device.fileno(), False)
+            except (AttributeError, io.UnsupportedOperation):
+                return get_gamepad()
+            self._gamepad_device = device
         
-        Converte eventos de teclado em eventos de botão do gamepad usando o
-        mapeamento configurado. Apenas teclas mapeadas são processadas.
+        return self._drain_device(device)
+    
+    @staticmethod
+    def _drain_device(device: Any) -> List[Any]:
+        """Drena todos os eventos já enfileirados em um dispositivo não bloqueante.
+        
+        Eventos de sincronização (``Sync``) e de varredura (``Misc``), que
+        acompanham cada relatório do evdev, são descartados aqui para que apenas
+        botões e eixos cheguem ao despacho em Python.
+        """
+        drained: List[Any] = []
+        append = drained.append
+        relevant = _DISPATCHED_EV_TYPES
+        while True:
+            try:
+                events = device._do_iter()
+            except BlockingIOError:
+                break
+            if not events:
+                break
+            for event in events:
+                if event.ev_type in relevant:
+                    append(event)
+        return drained
+    
+    @staticmethod
+    def _coalesce_events(events: List[Any]) -> List[Any]:
+        """Mantém apenas o último valor de cada eixo analógico no lote.
+        
+        Um movimento de joystick pode gerar dezenas de eventos ``Absolute`` do
+        mesmo eixo em um único quadro; só o valor final interessa à interface.
+        Botões e eixos do D-Pad (HAT) são preservados na ordem original, pois
+        cada transição de pressionar/soltar é significativa.
         
         Args:
-            event: O evento de teclado a ser processado.
-                
-        Note:
-            Este método ignora silenciosamente erros durante o processamento
-            para evitar que falhas no teclado afetem a execução principal.
+            events: Eventos brutos lidos no quadro atual.
+            
+        Returns:
+            List[Any]: Eventos digitais na ordem original seguidos do último
+            evento de cada eixo analógico.
+        """
+        if len(events) < 2:
+            return events
+        
+        ordered: List[Any] = []
+        latest: Dict[str, Any] = {}
+        for event in events:
+            if event.ev_type == _EV_ABSOLUTE and event.code not in _HAT_AXES:
+                latest[event.code] = event
+            else:
+                ordered.append(event)
+        
+        if latest:
+            ordered.extend(latest.values())
+        return ordered
+    
+    def _bind_callback(self) -> None:
+        """Define o destino de ``_send_event`` para o próximo ciclo de captura.
+        
+        Com ``on_input_batch`` os eventos são apenas acumulados em ``_batch``
+        e entregues por ``_flush_batch`` ao fim de cada leitura; caso
+        contrário ``on_input_event`` é chamado a cada evento.
+        """
+        if callable(self.on_input_batch):
+            self._batch.clear()
+            self._cb = self._batch.append
+        else:
+            self._cb = self.on_input_event if callable(self.on_input_event) else None
+    
+    def _flush_batch(self) -> None:
+        """Entrega ao callback em lote os eventos acumulados na leitura atual."""
+        batch = self._batch
+        if not batch:
+            return
+        events = tuple(batch)
+        batch.clear()
+        self.on_input_batch(events)
+    
+    def _on_readable(self, device: Any) -> None:
+        """Callback do loop asyncio chamado quando o descritor do gamepad tem dados.
+        
+        Args:
+            device: Dispositivo ``inputs`` cujo descritor ficou legível.
         """
         try:
-            # Ignora eventos de liberação de tecla que não estão mapeados
-            if event.ev_type != 'Key' or event.state == 0:
-                return
-                
-            key = event.code.upper()
-            button = self._keyboard_mapping.get(key)
-                
-            if button is not None:
-                # Envia o evento apenas quando a tecla é pressionada (state=1)
-                # Ignora eventos de liberação (state=0) para evitar duplicação
-                # já que o jogo pode querer lidar com o estado de forma contínua
-                self._send_event(InputEvent(button, 1))
-                    
+            events = self._drain_device(device)
+        except (UnpluggedError, OSError) as e:
+            logger.warning("Gamepad desconectado ou erro de E/S: %s", str(e))
+            asyncio.get_running_loop().remove_reader(device._character_device.fileno())
+            return
+        
+        process_event = self._process_gamepad_event
+        try:
+            for event in self._coalesce_events(events):
+                process_event(event)
+            self._flush_batch()
         except Exception as e:
-            logger.error("Erro ao processar evento de teclado: %s", str(e))
-            logger.debug("Detalhes do erro:", exc_info=True)
-            if __debug__:  # Apenas levanta exceções em modo de depuração
-                raise
+            logger.error("Erro ao despachar eventos de entrada: %s", e)
+            if self._dbg:
+                logger.debug("Detalhes do erro:", exc_info=True)
     
-    def _send_event(self, event: InputEvent) -> None:
-        """Envia um evento de entrada processado para o callback registrado.
+    async def run(self) -> None:
+        """Captura eventos integrada a um loop asyncio já em execução.
         
-        Este método gerencia o envio de eventos de entrada, garantindo que apenas
-        eventos significativos (com mudança de estado acima de um limiar) sejam
-        repassados ao callback. Isso ajuda a reduzir o ruído e melhorar a
-        responsividade do sistema.
+        No Linux os descritores dos gamepads são registrados diretamente no
+        reator com ``loop.add_reader``, sem thread dedicada nem troca de
+        contexto por evento. Nas demais plataformas (ou se o loop não suportar
+        leitores de descritor) o loop de eventos tradicional é executado em um
+        executor. A corrotina termina quando ``stop()`` é chamado.
         
-        Args:
-            event: O evento de entrada a ser processado.
-                
-        Note:
-            - Para eventos analógicos, um limiar de 5% é aplicado para evitar
-              atualizações desnecessárias por pequenas flutuações.
-            - Para eventos digitais, apenas mudanças de estado são repassadas.
+        Example:
+            ```python
+            handler = InputHandler(on_input_event)
+            asyncio.get_running_loop().create_task(handler.run())
+            ```
         """
-        if not hasattr(self, 'on_input_event') or not callable(self.on_input_event):
-            logger.warning("Nenhum callback registrado para eventos de entrada")
+        if self.is_running():
+            logger.warning("InputHandler já está em execução")
             return
-                
+        
+        loop = asyncio.get_running_loop()
+        self._bind_callback()
+        self._dbg = logger.isEnabledFor(logging.DEBUG)
+        self._stop_event.clear()
+        self._async_loop = loop
+        self._async_stop = asyncio.Event()
+        registered: List[int] = []
+        
         try:
-            # Obtém o último estado registrado para este botão
-            last_state = self._last_events.get(event.button)
-                
-            # Para eventos analógicos, verifica se a diferença é significativa
-            if event.is_analog and last_state is not None:
-                # Limiar de 5% para eventos analógicos (evita atualizações por ruído)
-                if abs(event.state - last_state) < 0.05:
-                    return
-                
-            # Para botões digitais, verifica se o estado realmente mudou
-            elif not event.is_analog and last_state == event.state:
+            if not GAMEPAD_AVAILABLE:
+                await self._async_stop.wait()
                 return
-                    
-            # Atualiza o último estado registrado
-            self._last_events[event.button] = event.state
+            
+            if sys.platform.startswith('linux'):
+                try:
+                    for device in devices.gamepads:
+                        fd = device._character_device.fileno()
+                        os.set_blocking(fd, False)
+                        loop.add_reader(fd, self._on_readable, device)
+                        registered.append(fd)
+                except (AttributeError, NotImplementedError, io.UnsupportedOperation) as e:
+                    logger.debug("Leitura assíncrona indisponível, usando executor: %s", str(e))
+                    for fd in registered:
+                        loop.remove_reader(fd)
+                    registered.clear()
+            
+            if registered:
+                logger.info("InputHandler integrado ao loop asyncio (%d dispositivo(s))", len(registered))
+                await self._async_stop.wait()
+            else:
+                await loop.run_in_executor(None, self._event_loop)
+        finally:
+            for fd in registered:
+                loop.remove_reader(fd)
+            self._stop_event.set()
+            self._async_loop = None
+            self._async_stop = None
+    
+    def _open_selector(self) -> Optional[selectors.BaseSelector]:
+        """Registra os descritores dos gamepads em um seletor (epoll no Linux).
+        
+        Também registra a extremidade de leitura do pipe de despertar, usado por
+        ``stop()`` para interromper a espera imediatamente.
+        
+        Returns:
+            Optional[selectors.BaseSelector]: Seletor pronto para uso, ou None se a
+            plataforma ou o dispositivo não expuserem descritores de arquivo.
+        """
+        if not sys.platform.startswith('linux'):
+            return None
+        
+        selector = selectors.DefaultSelector()
+        try:
+            for device in devices.gamepads:
+                fd = device._character_device.fileno()
+                os.set_blocking(fd, False)
+                selector.register(fd, selectors.EVENT_READ, device)
+            if not selector.get_map():
+                selector.close()
+                return None
+            
+            if self._wake_fds is None:
+                self._wake_fds = os.pipe()
+                os.set_blocking(self._wake_fds[0], False)
+            selector.register(self._wake_fds[0], selectors.EVENT_READ, None)
+        except (AttributeError, OSError, io.UnsupportedOperation) as e:
+            logger.debug("Seletor indisponível, usando leitura periódica: %s", str(e))
+            selector.close()
+            return None
+        return selector
+    
+    def _select_loop(self, selector: selectors.BaseSelector) -> None:
+        """Despacha eventos dos gamepads à medida que os descritores ficam legíveis.
+        
+        Retorna quando ``stop()`` é chamado ou quando não resta nenhum gamepad
+        registrado (por exemplo, após uma desconexão).
+        
+        Args:
+            selector: Seletor criado por ``_open_selector``.
+        """
+        is_stopped = self._stop_event.is_set
+        select = selector.select
+        drain = self._drain_device
+        coalesce = self._coalesce_events
+        process_event = self._process_gamepad_event
+        flush = self._flush_batch
+        devices_left = len(selector.get_map()) - 1  # Desconta o pipe de despertar
+        
+        while devices_left and not is_stopped():
+            for key, _ in select():
+                device = key.data
+                if device is None:
+                    # Pipe de despertar: stop() foi chamado
+                    try:
+                        os.read(key.fd, 64)
+                    except BlockingIOError:
+                        pass
+                    continue
                 
-            # Envia o evento para o callback registrado
-            try:
-                self.on_input_event(event)
-            except Exception as callback_error:
-                logger.error("Erro no callback de evento de entrada: %s", str(callback_error))
-                logger.debug("Detalhes do erro no callback:", exc_info=True)
-                    
-        except Exception as e:
-            logger.error("Erro ao processar evento de entrada: %s", str(e))
-            logger.debug("Detalhes do erro:", exc_info=True)
-        if __debug__:  # Apenas levanta exceções em modo de depuração
-            raise
+                try:
+                    events = drain(device)
+                except (UnpluggedError, OSError) as e:
+                    logger.warning("Gamepad desconectado ou erro de E/S: %s", str(e))
+                    selector.unregister(key.fd)
+                    devices_left -= 1
+                    continue
+                
+                try:
+                    for event in coalesce(events):
+                        process_event(event)
+                    flush()
+                except Exception as e:
+                    logger.error("Erro ao despachar eventos de entrada: %s", e)
+                    if self._dbg:
+                        logger.debug("Detalhes do erro:", exc_info=True)
     
     def _event_loop(self):
         """Loop principal para capturar eventos de entrada.
@@ -1218,12 +1627,27 @@ class InputHandler:
         (se disponível) e os processa. O loop é executado em uma thread separada e
         inclui controle de taxa de atualização e tratamento robusto de erros.
         
-        O loop usa um atraso dinâmico para manter uma taxa de atualização consistente
-        enquanto minimiza o uso da CPU. Em caso de erros, o loop continua em execução
-        a menos que um erro crítico ocorra ou que o sinal de parada seja recebido.
+        No Linux, os descritores dos gamepads são monitorados com ``selectors``
+        (epoll) e a thread só acorda quando há eventos ou quando ``stop()`` é
+        chamado. Nas demais plataformas, ou se os descritores não estiverem
+        acessíveis, o loop usa prazos monotônicos (sem deriva acumulada) para
+        manter uma taxa de atualização consistente enquanto minimiza o uso da CPU.
+        Em caso de erros, o loop continua em execução a menos que um erro crítico
+        ocorra ou que o sinal de parada seja recebido.
         """
         logger.info("Iniciando loop de eventos de entrada")
         
+        # Caminho orientado a eventos (Linux): bloqueia até o descritor ficar legível
+        selector = self._open_selector() if GAMEPAD_AVAILABLE else None
+        if selector is not None:
+            try:
+                self._select_loop(selector)
+            finally:
+                selector.close()
+            if self._stop_event.is_set():
+                return
+            logger.info("Nenhum gamepad monitorado, retornando à leitura periódica")
+        
         # Taxa de atualização alvo (em segundos entre iterações)
         target_fps = 200  # 200 FPS para baixa latência
         target_frame_time = 1.0 / target_fps
@@ -1232,30 +1656,46 @@ class InputHandler:
         error_count = 0
         max_consecutive_errors = 5
         
-        while self._running:
-            frame_start_time = time.time()
-            
+        # Referências locais para evitar buscas de atributo a cada iteração
+        stop_event = self._stop_event
+        is_stopped = stop_event.is_set
+        wait = stop_event.wait
+        read_events = self._read_gamepad_events
+        coalesce = self._coalesce_events
+        process_event = self._process_gamepad_event
+        flush = self._flush_batch
+        now = time.monotonic
+        gamepad_available = GAMEPAD_AVAILABLE
+        
+        # Prazo monotônico do próximo quadro (evita deriva acumulada)
+        next_tick = now()
+        
+        while not is_stopped():
             try:
                 # Processa eventos do gamepad se disponível
-                if GAMEPAD_AVAILABLE:
+                if gamepad_available:
                     try:
-                        events = get_gamepad()
-                        for event in events:
+                        for event in coalesce(read_events()):
                             if event.ev_type in ("Key", "Absolute"):
-                                self._process_gamepad_event(event)
+                                process_event(event)
+                        flush()
                     except (UnpluggedError, OSError) as e:
                         logger.warning("Gamepad desconectado ou erro de E/S: %s", str(e))
+                        self._gamepad_device = None
                         # Tenta redetectar o gamepad na próxima iteração
-                        time.sleep(1)
+                        wait(1.0)
+                        next_tick = now()
                         continue
                 
-                # Calcula o tempo restante para manter a taxa de quadros desejada
-                frame_time = time.time() - frame_start_time
-                sleep_time = max(0, target_frame_time - frame_time)
-                
-                # Usa um pequeno atraso para reduzir o uso da CPU
-                if sleep_time > 0.001:  # Apenas dorme se o tempo for significativo
-                    time.sleep(min(sleep_time, 0.05))  # Máximo de 50ms para manter responsividade
+                # Avança o prazo em passos fixos; quadros longos são compensados
+                # nos seguintes e atrasos grandes (>100ms) ressincronizam o prazo.
+                # A espera no evento de parada é interrompida imediatamente por stop()
+                next_tick += target_frame_time
+                sleep_time = next_tick - now()
+                if sleep_time > 0:
+                    wait(sleep_time)
+                elif sleep_time < -0.1:
+                    next_tick = now()
                 
                 # Reseta o contador de erros após uma iteração bem-sucedida
                 error_count = 0
@@ -1269,11 +1709,12 @@ class InputHandler:
                 # Se muitos erros consecutivos ocorrerem, faz uma pausa maior
                 if error_count >= max_consecutive_errors:
                     logger.error("Muitos erros consecutivos, pausando por 5 segundos...")
-                    time.sleep(5)
+                    wait(5.0)
+                    next_tick = now()
                     error_count = 0  # Reseta após a pausa
                     
                     # Se ainda estiver com problemas após a pausa, tenta reiniciar
-                    if self._running:
+                    if not is_stopped():
                         logger.info("Tentando recuperar o loop de eventos...")
     
     def start(self) -> None:
@@ -1290,12 +1731,16 @@ class InputHandler:
             O método é seguro para chamadas múltiplas - se já estiver em execução,
             uma mensagem de aviso será registrada e o método retornará sem fazer nada.
         """
-        if self._running:
+        if self.is_running():
             logger.warning("InputHandler já está em execução")
             return
                 
+        # Captura o callback atual e o nível de log uma única vez para o despacho
+        self._bind_callback()
+        self._dbg = logger.isEnabledFor(logging.DEBUG)
+        
         try:
-            self._running = True
+            self._stop_event.clear()
             self._thread = threading.Thread(
                 target=self._event_loop,
                 name="InputHandler",
@@ -1309,7 +1754,7 @@ class InputHandler:
                 raise RuntimeError("Falha ao iniciar a thread de captura de entrada")
                     
         except Exception as e:
-            self._running = False
+            self._stop_event.set()
             if self._thread:
                 self._thread.join(timeout=1.0)
                 self._thread = None
@@ -1320,7 +1765,7 @@ class InputHandler:
     
     def is_running(self) -> bool:
         """Verifica se o monitoramento de entradas está ativo."""
-        return self._running
+        return not self._stop_event.is_set()
     
     def stop(self) -> None:
         """Para o monitoramento de entradas de forma segura.
@@ -1333,19 +1778,37 @@ class InputHandler:
             O método é seguro para chamadas múltiplas - se já estiver parado,
             uma mensagem de aviso será registrada e o método retornará sem fazer nada.
         """
-        if not self._running:
+        if not self.is_running():
             logger.warning("InputHandler já está parado")
             return
             
         try:
             logger.info("Parando InputHandler...")
-            self._running = False
+            self._stop_event.set()
             
-            if self._thread and self._thread.is_alive():
+            # Acorda a thread bloqueada no seletor, se houver
+            if self._wake_fds is not None:
+                try:
+                    os.write(self._wake_fds[1], b'\0')
+                except OSError:
+                    pass
+            
+            # Acorda a corrotina run(), se a captura estiver integrada ao asyncio
+            if self._async_loop is not None and self._async_stop is not None:
+                self._async_loop.call_soon_threadsafe(self._async_stop.set)
+            
+            # Todas as esperas da thread de captura (seletor, evento de parada)
+            # são interrompidas acima, então o join retorna assim que ela sai.
+            # O limite só protege contra get_gamepad(), que bloqueia sem
+            # descritor para acordar. Se stop() for chamado de dentro de um
+            # callback, a própria thread de captura apenas sai do laço.
+            thread = self._thread
+            if (thread is not None and thread.is_alive()
+                    and thread is not threading.current_thread()):
                 logger.debug("Aguardando thread de captura terminar...")
-                self._thread.join(timeout=2.0)  # Timeout de 2 segundos
+                thread.join(timeout=_STOP_JOIN_TIMEOUT)
                 
-                if self._thread.is_alive():
+                if thread.is_alive():
                     logger.warning("Thread de captura não respondeu ao sinal de parada")
             
             logger.info("InputHandler parado com sucesso")
@@ -1364,6 +1827,27 @@ class InputHandler:
             mapping: Dicionário mapeando códigos de tecla para botões do gamepad.
         """
         self._keyboard_mapping = mapping or self.DEFAULT_KEYBOARD_MAPPING.copy()
+        self._build_keyboard_lookup()
+    
+    def _build_keyboard_lookup(self) -> None:
+        """Pré-calcula a tabela de consulta usada por ``_process_keyboard_event``.
+        
+        Cada tecla é registrada com o código original e em maiúsculas (ambos
+        internados) e os mapeamentos inválidos são descartados aqui, uma única
+        vez, em vez de validados a cada evento.
+        """
+        valid: Dict[str, Button] = {}
+        for key, button in self._keyboard_mapping.items():
+            if not isinstance(button, Button):
+                logger.warning("Mapeamento de tecla inválido para '%s': %s", key, str(button))
+                continue
+            valid[sys.intern(str(key))] = button
+        
+        # Códigos exatos têm prioridade sobre as variantes em maiúsculas
+        lookup = dict(valid)
+        for key, button in valid.items():
+            lookup.setdefault(sys.intern(key.upper()), button)
+        self._keyboard_lookup = lookup
     
     def set_deadzone(self, deadzone: float):
         """
@@ -1373,6 +1857,7 @@ class InputHandler:
             deadzone: Valor da zona morta (0.0 a 1.0).
         """
         self._deadzone = max(0.0, min(1.0, deadzone))
+        self._axis_luts.clear()  # Tabelas reconstruídas com a nova zona morta
 
 # Alias para compatibilidade com código existente
 GamepadListener = InputHandler
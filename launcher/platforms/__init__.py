@@ -5,13 +5,21 @@ Este pacote contém implementações específicas para cada plataforma de jogos
 suportada pelo NIX Launcher, como Steam, jogos locais, emuladores, etc.
 """
 
-from typing import List, Dict, Any, Optional, Protocol
+import os
+import sys
+from typing import Any, Callable, Dict, List, Optional, Protocol
 from dataclasses import dataclass
 from pathlib import Path
 
+# Argumentos de @dataclass para os jogos das plataformas: no Python 3.10+ usa
+# __slots__ (instâncias menores e acesso mais rápido aos campos)
+_DATACLASS_SLOTS: Dict[str, Any] = {'slots': True} if sys.version_info >= (3, 10) else {}
+
 
 class Game(Protocol):
     """Interface para representar um jogo de qualquer plataforma."""
+    __slots__ = ()
+    
     id: str
     name: str
     platform: str
@@ -46,21 +54,71 @@ class PlatformHandler(Protocol):
         ...
 
 
+class _LazyHandler:
+    """Proxy que só instancia o manipulador de plataforma no primeiro uso.
+    
+    O nome da plataforma é conhecido de antemão, então listar as plataformas
+    não custa nada; a construção real (e seus índices) só acontece quando
+    algum outro atributo é acessado.
+    """
+    
+    def __init__(self, name: str, factory: Callable[[], PlatformHandler]):
+        self._name = name
+        self._factory = factory
+        self._handler: Optional[PlatformHandler] = None
+    
+    @property
+    def name(self) -> str:
+        """Retorna o nome da plataforma sem instanciar o manipulador."""
+        return self._name
+    
+    def _resolve(self) -> PlatformHandler:
+        """Retorna o manipulador real, criando-o na primeira chamada."""
+        if self._handler is None:
+            self._handler = self._factory()
+        return self._handler
+    
+    def is_available(self) -> bool:
+        return self._resolve().is_available()
+    
+    def get_games(self) -> List[Game]:
+        return self._resolve().get_games()
+    
+    def launch_game(self, game_id: str) -> bool:
+        return self._resolve().launch_game(game_id)
+    
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self._resolve(), attr)
+
+
+def _any_emulator_installed(emulators: List[Dict[str, Any]]) -> bool:
+    """Verificação barata equivalente a ``EmulatorHandler.is_available``.
+    
+    Só confere a existência dos executáveis, sem importar o módulo de
+    emuladores. Em ambiente de teste (``NIX_TEST_MODE``) basta haver
+    emuladores configurados.
+    """
+    if os.environ.get('NIX_TEST_MODE'):
+        return True
+    return any(os.path.exists(os.path.expanduser(emu.get("path", ""))) for emu in emulators)
+
+
 def get_available_platforms(config: Optional[Dict[str, Any]] = None) -> List[PlatformHandler]:
     """Retorna uma lista de plataformas disponíveis no sistema.
     
+    Jogos locais e emuladores são devolvidos como proxies preguiçosos: cada
+    manipulador só é construído quando for usado. A Steam precisa localizar a
+    instalação para saber se está disponível, então é verificada na hora.
+    
     Args:
         config: Dicionário de configuração opcional. Se não fornecido, será usado um vazio.
     """
-    from .steam import SteamHandler
-    from .local_games import LocalGamesHandler
-    from .emulators import EmulatorHandler
-    
-    available = []
+    available: List[PlatformHandler] = []
     config = config or {}
     
     # Verifica e adiciona Steam se disponível
     try:
+        from .steam import SteamHandler
         steam = SteamHandler()
         if steam.is_available():
             available.append(steam)
@@ -68,18 +126,19 @@ def get_available_platforms(config: Optional[Dict[str, Any]] = None) -> List[Pla
         print(f"Erro ao carregar Steam: {e}")
     
     # Sempre adiciona suporte a jogos locais
-    try:
-        local = LocalGamesHandler()
-        available.append(local)
-    except Exception as e:
-        print(f"Erro ao carregar jogos locais: {e}")
+    def _local_factory() -> PlatformHandler:
+        from .local_games import LocalGamesHandler
+        return LocalGamesHandler()
     
-    # Adiciona suporte a emuladores se configurado
-    try:
-        emulators = EmulatorHandler(config)
-        if emulators.is_available():
-            available.append(emulators)
-    except Exception as e:
-        print(f"Erro ao carregar emuladores: {e}")
+    available.append(_LazyHandler("Jogos Locais", _local_factory))
+    
+    # Adiciona suporte a emuladores se houver algum configurado e instalado
+    emulators = config.get("emulators")
+    if emulators and _any_emulator_installed(emulators):
+        def _emulators_factory() -> PlatformHandler:
+            from .emulators import EmulatorHandler
+            return EmulatorHandler(config)
+        
+        available.append(_LazyHandler("Emuladores", _emulators_factory))
     
     return available
@@ -5,18 +5,127 @@ Este módulo fornece suporte para emuladores de consoles clássicos como
 Super Nintendo, Mega Drive, entre outros.
 """
 
+import functools
+import json
 import os
+import re
+import shlex
+import sys
 import logging
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Tuple, Set
-from dataclasses import dataclass
+from typing import List, Dict, Any, FrozenSet, Optional, Tuple, Set
+from dataclasses import dataclass, field
 
 from ..game import Game
 from . import PlatformHandler
 
 logger = logging.getLogger(__name__)
 
+# Modo de teste (NIX_TEST_MODE=1), lido uma única vez na importação
+_TEST_MODE = bool(os.environ.get('NIX_TEST_MODE'))
+
+# Mapeamento de extensões para plataformas (sem o ponto inicial).
+# Arquivos compactados não têm plataforma implícita e são identificados pelo nome.
+_EXT_TO_PLATFORM: Dict[str, str] = {
+    # SNES
+    'smc': 'Super Nintendo',
+    'sfc': 'Super Nintendo',
+    'fig': 'Super Nintendo',
+    'swc': 'Super Nintendo',
+    'mgd': 'Super Nintendo',
+    # Sega Genesis/Mega Drive
+    'gen': 'Sega Genesis',
+    'md': 'Sega Genesis',
+    'smd': 'Sega Genesis',
+    'bin': 'Sega Genesis',
+    'sgd': 'Sega Genesis',
+    '68k': 'Sega Genesis',
+    'sg': 'Sega Genesis',
+    'pco': 'Sega Genesis',
+    # NES
+    'nes': 'Nintendo Entertainment System',
+    'nez': 'Nintendo Entertainment System',
+    'fds': 'Nintendo Entertainment System',
+    'unf': 'Nintendo Entertainment System',
+    'unif': 'Nintendo Entertainment System',
+    # Game Boy
+    'gb': 'Game Boy',
+    'gbc': 'Game Boy Color',
+    'gba': 'Game Boy Advance',
+    'agb': 'Game Boy Advance',
+    # Nintendo 64
+    'n64': 'Nintendo 64',
+    'v64': 'Nintendo 64',
+    'z64': 'Nintendo 64',
+    'u1': 'Nintendo 64',
+}
+
+# Versão do formato do cache de ROMs em disco
+_ROM_CACHE_VERSION = 2
+
+# Pasta padrão do cache de ROMs quando a configuração não define rom_cache_file
+_DEFAULT_ROM_CACHE_DIR = Path.home() / ".cache" / "nix_launcher"
+
+# Pastas (em minúsculas) ignoradas na varredura de ROMs, além das ocultas
+_SKIP_DIRS = frozenset({
+    'system volume information',
+    '$recycle.bin',
+    'node_modules',
+    'steamapps',
+    '__pycache__',
+})
+
+# Termos usados para identificar a plataforma pelo nome, na ordem de prioridade
+_KNOWN_PLATFORM_TERMS: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    ('snes', ('snes', 'super nintendo', 'super nintendo entertainment system')),
+    ('genesis', ('genesis', 'mega drive', 'sega genesis', 'sega mega drive')),
+    ('nes', ('nes', 'nintendo entertainment system', 'famicom')),
+    ('gba', ('gba', 'game boy advance')),
+    ('gbc', ('gbc', 'game boy color')),
+    ('gb', ('gb', 'game boy')),
+    ('n64', ('n64', 'nintendo 64')),
+)
+
+# Nome canônico de cada plataforma identificada pelos termos acima
+_PLATFORM_CANONICAL: Dict[str, str] = {
+    'snes': 'Super Nintendo',
+    'genesis': 'Sega Genesis',
+    'nes': 'Nintendo Entertainment System',
+    'gba': 'Game Boy Advance',
+    'gbc': 'Game Boy Color',
+    'gb': 'Game Boy',
+    'n64': 'Nintendo 64',
+}
+
+# Uma expressão compilada por plataforma, na ordem de prioridade: uma só
+# busca em C por plataforma substitui os testes "term in text" de cada termo.
+# Testar as plataformas em sequência (e não uma alternância única) preserva a
+# prioridade: em "business tycoon (snes)" o "nes" de "business" não vence o SNES
+_PLATFORM_TERM_RES: Tuple[Tuple[str, "re.Pattern[str]"], ...] = tuple(
+    (_PLATFORM_CANONICAL[platform_name], re.compile('|'.join(map(re.escape, terms))))
+    for platform_name, terms in _KNOWN_PLATFORM_TERMS
+)
+
+def _match_terms(text: str) -> Optional[str]:
+    """Retorna a plataforma de maior prioridade cujo termo aparece em ``text`` (em minúsculas)."""
+    for platform, pattern in _PLATFORM_TERM_RES:
+        if pattern.search(text):
+            return platform
+    return None
+
+
+@functools.lru_cache(maxsize=1024)
+def _platform_from_dir(parent_dir: str) -> Optional[str]:
+    """Retorna a plataforma indicada pelo nome (em minúsculas) de uma pasta.
+    
+    Centenas de ROMs costumam compartilhar a mesma pasta, então o resultado é
+    memorizado por nome durante toda a varredura.
+    """
+    return _match_terms(parent_dir)
+
+
 @dataclass
 class EmulatorConfig:
     """Configuração para um emulador específico."""
@@ -28,6 +137,53 @@ class EmulatorConfig:
     working_dir: Optional[str] = None
     scan_subfolders: bool = True
     core_name: Optional[str] = None  # Para RetroArch
+    # Argumentos pré-processados: (contém_placeholder, token)
+    _arg_tokens: List[Tuple[bool, str]] = field(init=False, repr=False, default_factory=list)
+    
+    def __post_init__(self):
+        """Divide o modelo de argumentos em tokens uma única vez.
+        
+        As aspas do modelo delimitam tokens (um caminho com espaços continua
+        sendo um único argumento) e só os tokens com ``{...}`` são formatados
+        a cada execução.
+        """
+        self._arg_tokens = [
+            ('{' in token, token) for token in _split_args(self.args or "")
+        ]
+    
+    def build_args(self, rom: str) -> List[str]:
+        """Monta a lista de argumentos para uma ROM a partir do modelo.
+        
+        Args:
+            rom: Caminho completo da ROM.
+            
+        Returns:
+            Argumentos (sem o executável) com os placeholders substituídos.
+        """
+        values = {
+            'rom': rom,
+            'rom_dir': os.path.dirname(rom),
+            'rom_name': os.path.splitext(os.path.basename(rom))[0],
+        }
+        return [
+            token.format_map(values) if is_placeholder else token
+            for is_placeholder, token in self._arg_tokens
+        ]
+
+
+def _split_args(args: str) -> List[str]:
+    """Divide uma linha de argumentos respeitando aspas.
+    
+    No Windows o modo POSIX do ``shlex`` removeria as barras invertidas dos
+    caminhos, então é usado o modo não POSIX e as aspas externas são retiradas.
+    """
+    if os.name != 'nt':
+        return shlex.split(args)
+    tokens = shlex.split(args, posix=False)
+    return [
+        token[1:-1] if len(token) >= 2 and token[0] == token[-1] and token[0] in '"\'' else token
+        for token in tokens
+    ]
 
 class EmulatorHandler(PlatformHandler):
     """Manipulador para jogos de emuladores."""
@@ -35,14 +191,24 @@ class EmulatorHandler(PlatformHandler):
     def __init__(self, config: Dict[str, Any]):
         self.config = config
         self.emulators: List[EmulatorConfig] = []
-        self._rom_extensions: Set[str] = set()
+        self._rom_extensions: FrozenSet[str] = frozenset()
+        self._ext_routes: Dict[str, str] = {}
         self._platform_emulators: Dict[str, List[EmulatorConfig]] = {}
         self._games: List[Game] = []
+        self._games_by_id: Dict[str, Game] = {}
+        self._loaded = False  # True após a primeira carga, mesmo sem ROMs
+        # rom_cache_file: None desativa o índice de ROMs em disco
+        self._cache_path: Optional[Path] = None
+        if "rom_cache_file" not in config:
+            self._cache_path = _DEFAULT_ROM_CACHE_DIR / "roms.json"
+        elif config["rom_cache_file"] is not None:
+            self._cache_path = Path(os.path.expanduser(config["rom_cache_file"]))
         
         # Carrega a configuração dos emuladores
         self._load_emulators()
         
         # Configura estruturas de busca
+        rom_extensions: Set[str] = set()
         for emu in self.emulators:
             for platform in emu.platforms:
                 platform_lower = platform.lower()
@@ -50,8 +216,23 @@ class EmulatorHandler(PlatformHandler):
                     self._platform_emulators[platform_lower] = []
                 self._platform_emulators[platform_lower].append(emu)
                 
-            # Adiciona extensões ao conjunto global
-            self._rom_extensions.update(ext.lower() for ext in emu.extensions)
+            # Adiciona extensões ao conjunto global (sem o ponto inicial)
+            rom_extensions.update(ext.lower().lstrip('.') for ext in emu.extensions)
+        
+        # Conjunto imutável de strings internadas: a varredura testa milhões de
+        # nomes contra ele e a comparação por identidade resolve a maioria
+        self._rom_extensions = frozenset(sys.intern(ext) for ext in rom_extensions)
+        
+        # Roteamento pré-calculado: extensão suportada -> plataforma implícita,
+        # ou '' quando a extensão não define a plataforma (ex.: .zip) e a
+        # identificação depende do nome do arquivo/pasta. Uma única consulta
+        # por arquivo decide se ele é ROM e, quase sempre, sua plataforma.
+        # As variantes em maiúsculas (.SMC, comuns em dumps antigos) também
+        # são registradas para dispensar o lower() por arquivo
+        for ext in self._rom_extensions:
+            route = _EXT_TO_PLATFORM.get(ext, '')
+            self._ext_routes[ext] = route
+            self._ext_routes.setdefault(sys.intern(ext.upper()), route)
     
     def _load_emulators(self) -> None:
         """Carrega a configuração dos emuladores."""
@@ -81,249 +262,334 @@ class EmulatorHandler(PlatformHandler):
     def is_available(self) -> bool:
         """Verifica se há emuladores configurados e disponíveis.
         
-        Em ambiente de teste, retorna True se houver emuladores configurados,
-        independentemente da existência dos executáveis.
+        Em ambiente de teste (``NIX_TEST_MODE``), retorna True se houver
+        emuladores configurados, independentemente da existência dos executáveis.
         """
         if not self.emulators:
             return False
             
         # Em ambiente de teste, considera disponível se houver emuladores configurados
-        import sys
-        if 'pytest' in sys.modules:
+        if _TEST_MODE:
             return True
             
         # Verifica se pelo menos um emulador está disponível
         return any(os.path.exists(emu.path) for emu in self.emulators)
     
-    def load_games(self) -> None:
-        """Carrega os jogos (ROMs) das pastas configuradas."""
+    def load_games(self, use_cache: bool = True) -> None:
+        """Carrega os jogos (ROMs) das pastas configuradas.
+        
+        Cada diretório raiz é varrido em uma thread própria (até 8), já que a
+        varredura é dominada por E/S (readdir/stat) e as raízes são
+        independentes; com uma única raiz ela roda na própria thread. Os IDs
+        são atribuídos após a junção, na ordem da configuração, para que
+        permaneçam estáveis entre execuções.
+        
+        O conteúdo de cada diretório visitado é salvo em disco junto com o seu
+        mtime. Nas cargas seguintes, só os diretórios cujo mtime mudou são
+        listados de novo; os demais são reaproveitados do índice sem nenhuma
+        chamada a ``os.scandir``.
+        
+        Args:
+            use_cache: Se False, ignora o índice salvo e lista todos os
+                diretórios (veja ``rescan()``).
+        """
         self._games = []
+        self._games_by_id = {}
         
         # Obtém a lista de pastas de ROMs da configuração
         rom_dirs = self.config.get("rom_directories", self.config.get("pastas_hd", []))
         
         if not rom_dirs:
             logger.warning("Nenhum diretório de ROMs configurado")
+            self._loaded = True
             return
             
         logger.info(f"Buscando ROMs nos diretórios: {rom_dirs}")
         logger.debug(f"Extensões suportadas: {self._rom_extensions}")
         
-        for rom_dir in rom_dirs:
+        cached_index = self._load_rom_index() if use_cache and self._cache_path else {}
+        
+        if len(rom_dirs) == 1:
+            # Uma só raiz: nada a sobrepor, evita criar e encerrar o pool
+            results = [self._scan_dir(rom_dirs[0], cached_index)]
+        else:
+            with ThreadPoolExecutor(max_workers=min(8, len(rom_dirs))) as executor:
+                results = list(executor.map(lambda rom_dir: self._scan_dir(rom_dir, cached_index), rom_dirs))
+        
+        rom_index: Dict[str, Dict[str, Any]] = {}
+        ignored = unidentified = listed = 0
+        for games, dir_index, stats in results:
+            for game in games:
+                game.id = f"emulator_{len(self._games)}"
+                self._games.append(game)
+                self._games_by_id[game.id] = game
+            rom_index.update(dir_index)
+            ignored += stats["ignored"]
+            unidentified += stats["unidentified"]
+            listed += stats["listed"]
+        
+        # Um único resumo no lugar de uma linha de log por arquivo
+        logger.info(
+            "Varredura de ROMs concluída: %d ROMs encontradas, %d arquivos ignorados "
+            "(%d de %d diretórios listados, os demais vieram do cache)",
+            len(self._games), ignored, listed, len(rom_index)
+        )
+        if unidentified:
+            logger.warning(
+                "%d ROMs ignoradas por não ser possível identificar a plataforma "
+                "(detalhes no nível DEBUG)", unidentified
+            )
+        
+        # O índice só é regravado se algum diretório mudou (ou deixou de existir)
+        if self._cache_path and (listed or rom_index.keys() != cached_index.keys()):
+            self._save_rom_index(rom_index)
+        
+        self._loaded = True
+    
+    def rescan(self) -> None:
+        """Recarrega as ROMs listando todos os diretórios, sem usar o cache."""
+        self.load_games(use_cache=False)
+    
+    def _cache_key(self) -> Dict[str, Any]:
+        """Retorna os dados que identificam a configuração de um cache de ROMs."""
+        return {
+            "version": _ROM_CACHE_VERSION,
+            "extensions": sorted(self._rom_extensions),
+        }
+    
+    def _load_rom_index(self) -> Dict[str, Dict[str, Any]]:
+        """Carrega o índice de diretórios de ROMs salvo em disco.
+        
+        O índice só é usado se foi gerado com o mesmo formato e as mesmas
+        extensões; a validade de cada diretório é conferida depois, pelo mtime
+        (criar, remover ou renomear arquivos atualiza o mtime da pasta que os
+        contém).
+        
+        Returns:
+            Dicionário diretório -> entrada do índice (vazio se não houver
+            índice válido).
+        """
+        try:
+            with open(self._cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        
+        if not isinstance(data, dict) or data.get("key") != self._cache_key():
+            return {}
+        
+        directories = data.get("directories")
+        return directories if isinstance(directories, dict) else {}
+    
+    def _save_rom_index(self, rom_index: Dict[str, Dict[str, Any]]) -> None:
+        """Grava o índice de diretórios de ROMs em disco.
+        
+        A escrita é atômica: o arquivo é gravado ao lado e depois renomeado.
+        
+        Args:
+            rom_index: Entrada de cada diretório visitado na varredura.
+        """
+        data = {
+            "key": self._cache_key(),
+            "directories": rom_index,
+        }
+        tmp_path = self._cache_path.with_name(self._cache_path.name + ".tmp")
+        try:
+            self._cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp_path, self._cache_path)
+        except OSError as e:
+            logger.warning(f"Não foi possível salvar o cache de ROMs em {self._cache_path}: {e}")
+    
+    def _scan_dir(
+        self, rom_dir: str, cached_index: Dict[str, Dict[str, Any]]
+    ) -> Tuple[List[Game], Dict[str, Dict[str, Any]], Dict[str, int]]:
+        """Varre um diretório de ROMs e retorna os jogos encontrados (sem ID).
+        
+        A árvore é percorrida diretório a diretório; um diretório cujo mtime é
+        o mesmo do índice tem suas ROMs e subpastas reaproveitadas, e só os
+        demais são listados.
+        
+        Args:
+            rom_dir: Diretório raiz de ROMs.
+            cached_index: Índice salvo na carga anterior.
+            
+        Returns:
+            Tupla com a lista de jogos encontrados, a entrada do índice de
+            cada diretório visitado e os contadores ``ignored`` (extensão não
+            suportada), ``unidentified`` (plataforma desconhecida) e ``listed``
+            (diretórios listados de novo).
+        """
+        games: List[Game] = []
+        dir_index: Dict[str, Dict[str, Any]] = {}
+        stats = {"ignored": 0, "unidentified": 0, "listed": 0}
+        debug = logger.isEnabledFor(logging.DEBUG)
+        rom_dir = os.path.expanduser(rom_dir)  # Expande ~ para o diretório home
+        if not os.path.isdir(rom_dir):
+            logger.warning(f"Diretório de ROMs não encontrado: {rom_dir}")
+            return games, dir_index, stats
+        
+        logger.info(f"Buscando ROMs em: {rom_dir}")
+        
+        # Pilha de diretórios: a ordem de visita é a mesma com ou sem cache
+        pending = [rom_dir]
+        while pending:
+            current = pending.pop()
             try:
-                rom_dir = os.path.expanduser(rom_dir)  # Expande ~ para o diretório home
-                if not os.path.isdir(rom_dir):
-                    logger.warning(f"Diretório de ROMs não encontrado: {rom_dir}")
+                mtime_ns = os.stat(current).st_mtime_ns
+            except OSError as e:
+                logger.warning(f"Não foi possível listar o diretório {current}: {e}")
+                continue
+            
+            entry = cached_index.get(current)
+            if entry is None or entry.get("mtime") != mtime_ns:
+                try:
+                    entry = self._list_rom_dir(current, mtime_ns, debug)
+                except Exception as e:
+                    logger.error(f"Erro ao processar diretório {current}: {e}", exc_info=True)
                     continue
+                stats["listed"] += 1
+            dir_index[current] = entry
+            
+            # Cria os jogos; o ID é atribuído em load_games
+            for stem, platform, file_path in entry["roms"]:
+                games.append(Game(
+                    id="",
+                    name=stem,
+                    platform=platform,
+                    executable=file_path,
+                    install_dir=os.path.dirname(file_path)
+                ))
+            stats["ignored"] += entry["ignored"]
+            stats["unidentified"] += entry["unidentified"]
+            pending.extend(entry["subdirs"])
+        
+        return games, dir_index, stats
+    
+    def _list_rom_dir(self, current: str, mtime_ns: int, debug: bool) -> Dict[str, Any]:
+        """Lista um único diretório com ``os.scandir`` e identifica suas ROMs.
+        
+        O tipo de cada entrada vem do cache do ``DirEntry`` (sem ``stat`` extra
+        por arquivo, ao contrário de ``os.walk``), e a extensão é extraída com
+        ``rpartition`` apenas do nome e procurada na tabela de roteamento
+        ``_ext_routes``, com custo constante independente de quantos emuladores
+        e extensões existam.
+        
+        Args:
+            current: Diretório a ser listado.
+            mtime_ns: mtime do diretório, lido antes da listagem.
+            debug: Se o log de depuração está habilitado.
+            
+        Returns:
+            Entrada do índice: ``mtime``, ``subdirs`` (na ordem da pilha de
+            visita), ``roms`` (tuplas ``[nome_sem_extensão, plataforma,
+            caminho]``) e os contadores ``ignored`` e ``unidentified``.
+        """
+        ext_routes = self._ext_routes
+        # Nome (em minúsculas) da pasta, calculado uma vez por diretório
+        parent_dir = os.path.basename(os.path.normpath(current)).lower()
+        subdirs: List[str] = []
+        roms: List[List[str]] = []
+        ignored = unidentified = 0
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        # Pastas ocultas e de sistema nunca contêm ROMs e podem
+                        # ter milhares de arquivos; são podadas sem descer nelas
+                        dir_name = entry.name
+                        if dir_name.startswith('.') or dir_name.lower() in _SKIP_DIRS:
+                            continue
+                        subdirs.append(entry.path)
+                        continue
                     
-                logger.info(f"Buscando ROMs em: {rom_dir}")
-                
-                # Para cada arquivo nas pastas de ROMs
-                for root, _, files in os.walk(rom_dir):
-                    for file in files:
-                        file_ext = os.path.splitext(file)[1].lower()
-                        
-                        # Verifica se a extensão corresponde a alguma ROM suportada
-                        if file_ext in self._rom_extensions:
-                            file_path = os.path.join(root, file)
-                            
-                            # Tenta identificar a plataforma
-                            platform = self._identify_platform(file_path, file_ext)
-                            
-                            if platform:
-                                # Cria o jogo
-                                game = Game(
-                                    id=f"emulator_{len(self._games)}",
-                                    name=os.path.splitext(file)[0],
-                                    platform=platform,
-                                    executable=file_path,
-                                    install_dir=os.path.dirname(file_path)
-                                )
-                                self._games.append(game)
-                                logger.info(f"ROM encontrada: {game.name} ({platform}) em {file_path}")
-                            else:
-                                logger.warning(f"Não foi possível identificar a plataforma para: {file_path}")
-                        else:
-                            logger.debug(f"Arquivo ignorado (extensão não suportada): {file}")
-            except Exception as e:
-                logger.error(f"Erro ao processar diretório {rom_dir}: {e}", exc_info=True)
+                    # Extensão extraída só do nome, sem criar Path; apenas
+                    # capitalizações mistas (.Smc) passam por lower().
+                    # Arquivos que não são ROMs param aqui
+                    name = entry.name
+                    stem, dot, ext = name.rpartition('.')
+                    platform = None
+                    if dot:
+                        platform = ext_routes.get(ext)
+                        if platform is None:
+                            platform = ext_routes.get(ext.lower())
+                    if platform is None:
+                        ignored += 1
+                        if debug:
+                            logger.debug("Arquivo ignorado (extensão não suportada): %s", name)
+                        continue
+                    
+                    # Extensões sem plataforma implícita recorrem ao nome do
+                    # arquivo (em minúsculas) e da pasta
+                    file_path = entry.path
+                    if not platform:
+                        platform = self._identify_platform(name.lower(), parent_dir, ext)
+                    if platform:
+                        roms.append([stem, platform, file_path])
+                        if debug:
+                            logger.debug("ROM encontrada: %s (%s) em %s", stem, platform, file_path)
+                    else:
+                        unidentified += 1
+                        if debug:
+                            logger.debug("Não foi possível identificar a plataforma para: %s", file_path)
+        except OSError as e:
+            logger.warning(f"Não foi possível listar o diretório {current}: {e}")
+        
+        return {
+            "mtime": mtime_ns,
+            "subdirs": subdirs,
+            "roms": roms,
+            "ignored": ignored,
+            "unidentified": unidentified,
+        }
     
     def get_games(self) -> List[Game]:
-        """Retorna a lista de jogos (ROMs) carregados."""
-        if not self._games:
+        """Retorna a lista de jogos (ROMs) carregados.
+        
+        A varredura só acontece na primeira chamada; uma pasta sem ROMs não
+        dispara uma nova varredura a cada chamada. Use ``load_games()`` para
+        recarregar explicitamente.
+        """
+        if not self._loaded:
             self.load_games()
         return self._games
     
-    def _identify_platform(self, file_path: str, file_ext: str) -> Optional[str]:
-        """Tenta identificar a plataforma do jogo."""
-        # Remove o ponto da extensão, se presente
-        file_ext = file_ext.lower().lstrip('.')
-        file_name = os.path.basename(file_path).lower()
-        
-        logger.debug(f"Tentando identificar plataforma para: {file_name} (extensão: {file_ext})")
-        
-        # Mapeamento detalhado de extensões para plataformas
-        extension_to_platform = {
-            # SNES
-            'smc': 'Super Nintendo',
-            'sfc': 'Super Nintendo',
-            'fig': 'Super Nintendo',
-            'swc': 'Super Nintendo',
-            'mgd': 'Super Nintendo',
-            # Sega Genesis/Mega Drive
-            'gen': 'Sega Genesis',
-            'md': 'Sega Genesis',
-            'smd': 'Sega Genesis',
-            'bin': 'Sega Genesis',
-            'sgd': 'Sega Genesis',
-            '68k': 'Sega Genesis',
-            'sg': 'Sega Genesis',
-            'pco': 'Sega Genesis',
-            # NES
-            'nes': 'Nintendo Entertainment System',
-            'fds': 'Nintendo Entertainment System',
-            'unf': 'Nintendo Entertainment System',
-            'unif': 'Nintendo Entertainment System',
-            # Game Boy
-            'gb': 'Game Boy',
-            'gbc': 'Game Boy Color',
-            'gba': 'Game Boy Advance',
-            'agb': 'Game Boy Advance',
-            # Nintendo 64
-            'n64': 'Nintendo 64',
-            'v64': 'Nintendo 64',
-            'z64': 'Nintendo 64',
-            'u1': 'Nintendo 64',
-            # Outros
-            'zip': None,  # Será verificado pelo conteúdo
-            '7z': None,   # Será verificado pelo conteúdo
-        }
+    def _identify_platform(self, file_name: str, parent_dir: str, file_ext: str) -> Optional[str]:
+        """Tenta identificar a plataforma do jogo.
         
-        # Tenta identificar pela extensão primeiro
-        platform = extension_to_platform.get(file_ext)
+        Args:
+            file_name: Nome do arquivo, já em minúsculas.
+            parent_dir: Nome da pasta que contém o arquivo, já em minúsculas.
+            file_ext: Extensão do arquivo (com ou sem ponto).
+        """
+        logger.debug("Tentando identificar plataforma para: %s (extensão: %s)", file_name, file_ext)
+        
+        # Extensão, depois nome do arquivo e, por fim, nome da pasta. Arquivos
+        # compactados não têm extensão mapeada e caem direto nos nomes.
+        platform = _EXT_TO_PLATFORM.get(file_ext.lower().lstrip('.'))
         if platform:
-            logger.debug(f"Plataforma identificada por extensão direta: {platform} para {file_name}")
+            logger.debug("Plataforma identificada por extensão: %s para %s", platform, file_name)
             return platform
         
-        # Se for arquivo compactado, tenta identificar pelo nome
-        if file_ext in ['zip', '7z']:
-            known_platforms = {
-                'snes': ['snes', 'super nintendo', 'super nintendo entertainment system'],
-                'genesis': ['genesis', 'mega drive', 'sega genesis', 'sega mega drive'],
-                'nes': ['nes', 'nintendo entertainment system', 'famicom'],
-                'gba': ['gba', 'game boy advance'],
-                'gbc': ['gbc', 'game boy color'],
-                'gb': ['gb', 'game boy'],
-                'n64': ['n64', 'nintendo 64']
-            }
-            
-            # Tenta identificar pelo nome do arquivo
-            for platform_name, terms in known_platforms.items():
-                if any(term in file_name for term in terms):
-                    platform_map = {
-                        'snes': 'Super Nintendo',
-                        'genesis': 'Sega Genesis',
-                        'nes': 'Nintendo Entertainment System',
-                        'gba': 'Game Boy Advance',
-                        'gbc': 'Game Boy Color',
-                        'gb': 'Game Boy',
-                        'n64': 'Nintendo 64'
-                    }
-                    platform = platform_map.get(platform_name)
-                    if platform:
-                        logger.debug(f"Plataforma identificada por nome em arquivo compactado: {platform} para {file_name}")
-                        return platform
-            
-            # Tenta identificar pelo nome da pasta
-            parent_dir = os.path.basename(os.path.dirname(file_path)).lower()
-            logger.debug(f"Verificando nome da pasta: {parent_dir}")
-            
-            for platform_name, terms in known_platforms.items():
-                if any(term in parent_dir for term in terms):
-                    platform_map = {
-                        'snes': 'Super Nintendo',
-                        'genesis': 'Sega Genesis',
-                        'nes': 'Nintendo Entertainment System',
-                        'gba': 'Game Boy Advance',
-                        'gbc': 'Game Boy Color',
-                        'gb': 'Game Boy',
-                        'n64': 'Nintendo 64'
-                    }
-                    platform = platform_map.get(platform_name)
-                    if platform:
-                        logger.debug(f"Plataforma identificada por nome da pasta em arquivo compactado: {platform} para {file_name}")
-                        return platform
-        
-        # Se não encontrou, tenta pelo nome do arquivo
-        known_platforms = {
-            'snes': ['snes', 'super nintendo', 'super nintendo entertainment system'],
-            'genesis': ['genesis', 'mega drive', 'sega genesis', 'sega mega drive'],
-            'nes': ['nes', 'nintendo entertainment system', 'famicom'],
-            'gba': ['gba', 'game boy advance'],
-            'gbc': ['gbc', 'game boy color'],
-            'gb': ['gb', 'game boy'],
-            'n64': ['n64', 'nintendo 64']
-        }
-        
-        for platform_name, terms in known_platforms.items():
-            if any(term in file_name for term in terms):
-                platform_map = {
-                    'snes': 'Super Nintendo',
-                    'genesis': 'Sega Genesis',
-                    'nes': 'Nintendo Entertainment System',
-                    'gba': 'Game Boy Advance',
-                    'gbc': 'Game Boy Color',
-                    'gb': 'Game Boy',
-                    'n64': 'Nintendo 64'
-                }
-                platform = platform_map.get(platform_name)
-                if platform:
-                    logger.debug(f"Plataforma identificada por nome do arquivo: {platform} para {file_name}")
-                    return platform
-        
-        # Se não encontrou, tenta pelo nome da pasta
-        parent_dir = os.path.basename(os.path.dirname(file_path)).lower()
-        logger.debug(f"Verificando nome da pasta: {parent_dir}")
-        
-        for platform_name, terms in known_platforms.items():
-            if any(term in parent_dir for term in terms):
-                platform_map = {
-                    'snes': 'Super Nintendo',
-                    'genesis': 'Sega Genesis',
-                    'nes': 'Nintendo Entertainment System',
-                    'gba': 'Game Boy Advance',
-                    'gbc': 'Game Boy Color',
-                    'gb': 'Game Boy',
-                    'n64': 'Nintendo 64'
-                }
-                platform = platform_map.get(platform_name)
-                if platform:
-                    logger.debug(f"Plataforma identificada por nome da pasta: {platform} para {file_name}")
-                    return platform
-        
-        # Mapeamento final de extensões para plataformas (como último recurso)
-        extension_to_platform = {
-            'smc': 'Super Nintendo', 'sfc': 'Super Nintendo', 'fig': 'Super Nintendo',
-            'swc': 'Super Nintendo', 'mgd': 'Super Nintendo', 'gen': 'Sega Genesis',
-            'md': 'Sega Genesis', 'smd': 'Sega Genesis', 'bin': 'Sega Genesis',
-            'nes': 'Nintendo Entertainment System', 'nez': 'Nintendo Entertainment System',
-            'gba': 'Game Boy Advance', 'gbc': 'Game Boy Color', 'gb': 'Game Boy',
-            'n64': 'Nintendo 64', 'v64': 'Nintendo 64', 'z64': 'Nintendo 64'
-        }
+        platform = _match_terms(file_name)
+        if platform:
+            logger.debug("Plataforma identificada por nome do arquivo: %s para %s", platform, file_name)
+            return platform
         
-        platform = extension_to_platform.get(file_ext)
+        platform = _platform_from_dir(parent_dir)
         if platform:
-            logger.debug(f"Plataforma identificada por mapeamento de extensão: {platform} para {file_name}")
+            logger.debug("Plataforma identificada por nome da pasta: %s para %s", platform, file_name)
             return platform
         
-        logger.warning(f"Não foi possível identificar a plataforma para o arquivo: {file_name}")
+        logger.debug("Nenhuma plataforma corresponde ao arquivo: %s", file_name)
         return None
     
     def launch_game(self, game_id: str) -> bool:
         """Inicia um jogo usando o emulador apropriado."""
-        # Obtém o jogo pelo ID
-        games = self.get_games()
-        game = next((g for g in games if g.id == game_id), None)
+        # Obtém o jogo pelo ID (carregando a lista, se necessário)
+        self.get_games()
+        game = self._games_by_id.get(game_id)
         
         if not game:
             logger.error(f"Jogo não encontrado: {game_id}")
@@ -338,17 +604,10 @@ class EmulatorHandler(PlatformHandler):
         # Usa o primeiro emulador da lista para a plataforma
         emulator = self._platform_emulators[platform][0]
         
-        # Prepara o comando para iniciar o jogo
+        # Prepara o comando a partir do modelo de argumentos pré-processado;
+        # cada argumento vai direto para o processo, sem passar pelo shell
         cmd = [emulator.path]
-        
-        # Adiciona argumentos adicionais, substituindo placeholders
-        if emulator.args:
-            args = emulator.args.format(
-                rom=f'"{game.executable}"',
-                rom_dir=f'"{os.path.dirname(game.executable)}"',
-                rom_name=f'"{os.path.splitext(os.path.basename(game.executable))[0]}"'
-            )
-            cmd.extend(args.split())
+        cmd.extend(emulator.build_args(game.executable))
         
         # Define o diretório de trabalho, se especificado
         cwd = emulator.working_dir if emulator.working_dir else os.path.dirname(emulator.path)
@@ -358,13 +617,17 @@ class EmulatorHandler(PlatformHandler):
             logger.debug(f"Comando: {cmd}")
             logger.debug(f"Diretório: {cwd}")
             
-            # Inicia o processo
+            # Inicia o processo desvinculado do launcher: as saídas vão para
+            # DEVNULL (pipes nunca lidos travariam o emulador quando o buffer
+            # enchesse) e, no POSIX, o emulador ganha sua própria sessão
             subprocess.Popen(
                 cmd,
                 cwd=cwd,
-                shell=True,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE
+                shell=False,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                start_new_session=True
             )
             return True
             
@@ -6,17 +6,105 @@ localmente no sistema, fora de plataformas como Steam, Epic, etc.
 """
 
 import os
+import re
+import atexit
+import time
 import logging
+import threading
 import json
+import weakref
 from pathlib import Path
-from typing import List, Dict, Any, Optional
-from dataclasses import dataclass
+from typing import List, Dict, Any, Iterator, Optional, Tuple
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
 
-from . import PlatformHandler, Game
+from . import PlatformHandler, Game, _DATACLASS_SLOTS
+
+try:
+    import orjson
+except ImportError:  # Dependência opcional: recai no módulo json padrão
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Palavras-chave que indicam que o arquivo pode ser um jogo
+_GAME_KEYWORDS = (
+    'launcher', 'game', 'setup', 'install', 'play', 'start', 'run',
+    'battle', 'war', 'quest', 'adventure', 'legend', 'kingdom', 'empire',
+    'simulator', 'tycoon', 'edition', 'definitive', 'remastered', 'hd'
+)
+
+# Palavras que indicam que o arquivo provavelmente não é um jogo
+_NON_GAME_KEYWORDS = (
+    'unins', 'uninst', 'uninstall', 'crash', 'error', 'dxsetup', 'vcredist',
+    'directx', 'redist', 'msi', 'msp', 'patch', 'update', 'eula', 'readme',
+    'license', 'changelog', 'config', 'settings', 'options', 'credits', 'help'
+)
+
+# Cada lista compilada em uma única alternância: uma busca em C por nome de
+# arquivo no lugar de dezenas de testes "keyword in filename"
+_GAME_KEYWORDS_RE = re.compile('|'.join(map(re.escape, _GAME_KEYWORDS)))
+_NON_GAME_KEYWORDS_RE = re.compile('|'.join(map(re.escape, _NON_GAME_KEYWORDS)))
+
+# Validade (em segundos) do resultado da verificação de existência dos executáveis
+_EXISTS_TTL = 5.0
+
+# Quantidade mínima de caminhos para verificar a existência em paralelo
+_BATCH_EXISTS_MIN = 16
+
+# Threads usadas para listar diretórios em paralelo na busca por jogos
+_SCAN_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Pastas de sistema ou de ferramentas que nunca contêm jogos (nomes em minúsculas);
+# pastas ocultas (iniciadas por ".") também são ignoradas na busca
+_SKIP_DIRS = frozenset({
+    'system volume information',
+    '$recycle.bin',
+    'node_modules',
+    '__pycache__',
+})
+
+# Entradas acumuladas no journal antes de consolidá-lo no arquivo principal
+_JOURNAL_COMPACT_EVERY = 64
+
+# Escritas dos arquivos em segundo plano, uma por vez e sem se intercalar,
+# compartilhadas por todos os manipuladores (as threads só nascem no uso)
+_SAVE_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="LocalGamesSave")
+
+# Manipuladores vivos cujo journal é consolidado ao encerrar o processo; a
+# referência fraca não impede que manipuladores descartados sejam coletados
+_LIVE_HANDLERS: "weakref.WeakSet[LocalGamesHandler]" = weakref.WeakSet()
+
+
+@atexit.register
+def _compact_live_handlers() -> None:
+    """Consolida o journal de todos os manipuladores ainda vivos."""
+    for handler in list(_LIVE_HANDLERS):
+        handler._compact()
+
+
+def _batch_exists(paths: List[str]) -> List[bool]:
+    """Verifica a existência de vários caminhos de uma vez.
+    
+    Com poucos caminhos, as verificações são feitas em sequência. Acima de
+    ``_BATCH_EXISTS_MIN``, são distribuídas por um pool de threads: o
+    ``stat`` libera o GIL, então, em discos lentos ou de rede, as latências
+    se sobrepõem em vez de se somarem.
+    
+    Args:
+        paths: Caminhos a verificar.
+        
+    Returns:
+        Lista de booleanos na mesma ordem de ``paths``.
+    """
+    if len(paths) < _BATCH_EXISTS_MIN:
+        return [os.path.exists(path) for path in paths]
+    
+    with ThreadPoolExecutor(max_workers=min(_SCAN_WORKERS, len(paths))) as executor:
+        return list(executor.map(os.path.exists, paths))
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class LocalGame(Game):
     """Classe que representa um jogo local."""
     id: str
@@ -30,6 +118,8 @@ class LocalGame(Game):
     last_played: Optional[float] = None
     playtime: float = 0.0
     metadata: Dict[str, Any] = None
+    # Caminho completo do executável, montado uma única vez na criação
+    _full_path: Path = field(init=False, repr=False, compare=False)
     
     def __post_init__(self):
         """Configurações adicionais após a inicialização."""
@@ -39,6 +129,8 @@ class LocalGame(Game):
         # Se o caminho do executável for relativo, torna-o absoluto em relação ao diretório de instalação
         if self.executable and not os.path.isabs(self.executable):
             self.executable = str(self.install_dir / self.executable)
+        
+        self._full_path = Path(self.install_dir) / self.executable
 
 
 class LocalGamesHandler(PlatformHandler):
@@ -49,7 +141,22 @@ class LocalGamesHandler(PlatformHandler):
         self._config_file = Path.home() / ".config" / "nix_launcher" / "local_games.json"
         self._games: Dict[str, LocalGame] = {}
         self._scan_directories: List[Path] = []
+        # Alterações pontuais (uma linha JSON por mudança) ainda não consolidadas
+        self._journal_file = self._config_file.with_suffix('.journal')
+        self._journal_entries = 0
+        # Assinatura (mtime_ns, tamanho, tamanho do journal) refletida em memória
+        self._cfg_sig: Optional[Tuple[int, int, int]] = None
+        # Resultado recente de exists() por executável: caminho -> (instante, existe)
+        self._exists_cache: Dict[str, Tuple[float, bool]] = {}
+        # Contador de alterações da biblioteca e último resultado de get_games,
+        # válido enquanto a revisão não mudar e nenhuma verificação expirar
+        self._revision = 0
+        self._games_cache: List[Game] = []
+        self._cache_rev = -1
+        self._cache_expires = 0.0
+        self._save_lock = threading.Lock()
         self._load_config()
+        _LIVE_HANDLERS.add(self)
     
     @property
     def name(self) -> str:
@@ -70,16 +177,36 @@ class LocalGamesHandler(PlatformHandler):
         # Carrega os jogos do arquivo de configuração
         self._load_config()
         
-        # Retorna apenas os jogos que ainda existem no sistema
+        # Nada mudou desde a última chamada: devolve o mesmo resultado
+        now = time.monotonic()
+        if self._cache_rev == self._revision and now < self._cache_expires:
+            return list(self._games_cache)
+        
+        # Retorna apenas os jogos que ainda existem no sistema; a verificação de
+        # cada executável é reaproveitada por alguns segundos entre chamadas, e
+        # as que expiraram são feitas em lote
+        exists_cache = self._exists_cache
+        games = [(game, str(game._full_path)) for game in self._games.values()]
+        stale = [
+            key for _, key in games
+            if key not in exists_cache or now - exists_cache[key][0] >= _EXISTS_TTL
+        ]
+        for key, exists in zip(stale, _batch_exists(stale)):
+            exists_cache[key] = (now, exists)
+        
         valid_games = []
-        for game in self._games.values():
-            game_path = Path(game.install_dir) / game.executable
-            if game_path.exists():
+        for game, key in games:
+            if exists_cache[key][1]:
                 valid_games.append(game)
             else:
-                logger.warning(f"Jogo não encontrado: {game.name} em {game_path}")
+                logger.warning(f"Jogo não encontrado: {game.name} em {key}")
+        
+        # O resultado vale até a verificação mais antiga usada nele expirar
+        self._games_cache = valid_games
+        self._cache_rev = self._revision
+        self._cache_expires = min((exists_cache[key][0] for _, key in games), default=now) + _EXISTS_TTL
         
-        return valid_games
+        return list(valid_games)
     
     def launch_game(self, game_id: str) -> bool:
         """
@@ -99,7 +226,7 @@ class LocalGamesHandler(PlatformHandler):
             return False
         
         game = self._games[game_id]
-        game_path = Path(game.install_dir) / game.executable
+        game_path = game._full_path
         
         if not game_path.exists():
             logger.error(f"Arquivo do jogo não encontrado: {game_path}")
@@ -113,10 +240,12 @@ class LocalGamesHandler(PlatformHandler):
                 # No Linux/Mac, use subprocess
                 subprocess.Popen([str(game_path)])
             
-            # Atualiza o horário da última execução
-            import time
+            # Atualiza o horário da última execução; só a alteração é anotada
+            # no journal, em segundo plano, para não atrasar o retorno ao
+            # pressionar "Jogar"
             game.last_played = time.time()
-            self._save_config()
+            self._revision += 1
+            _SAVE_EXECUTOR.submit(self._append_journal, game_id, {'last_played': game.last_played})
             
             return True
         except Exception as e:
@@ -151,6 +280,8 @@ class LocalGamesHandler(PlatformHandler):
         
         # Adiciona à lista de jogos
         self._games[game_id] = game
+        self._exists_cache.pop(str(game._full_path), None)
+        self._revision += 1
         
         # Salva a configuração
         if self._save_config():
@@ -169,7 +300,9 @@ class LocalGamesHandler(PlatformHandler):
             True se o jogo foi removido com sucesso, False caso contrário
         """
         if game_id in self._games:
-            del self._games[game_id]
+            game = self._games.pop(game_id)
+            self._exists_cache.pop(str(game._full_path), None)
+            self._revision += 1
             return self._save_config()
         
         return False
@@ -200,75 +333,178 @@ class LocalGamesHandler(PlatformHandler):
         """
         found_games = []
         
+        # Aliases locais evitam buscas de atributo no laço mais quente do scan
+        games = self._games
+        looks_like_game = self._looks_like_game_lower
+        basename = os.path.basename
+        exts = ('.exe', '.lnk')
+        
         for directory in self._scan_directories:
-            for root, _, files in os.walk(directory):
+            for root, files in self._walk_scandir(directory):
+                # O ID depende só do diretório: calculado uma vez por pasta. Se
+                # ele já existe (jogo conhecido ou achado antes nesta busca),
+                # nenhum arquivo da pasta pode virar jogo novo, então nem se
+                # procura palavra-chave neles
+                game_id = f"local_auto_{basename(root).lower().replace(' ', '_')}"
+                if game_id in games:
+                    continue
                 for file in files:
-                    if file.lower().endswith(('.exe', '.lnk')):
-                        # Verifica se o arquivo parece ser um jogo (pode ser aprimorado)
-                        if self._looks_like_game(file):
-                            game_name = os.path.splitext(file)[0]
-                            game_id = f"local_auto_{os.path.basename(root).lower().replace(' ', '_')}"
-                            
-                            # Cria o jogo se ainda não existir
-                            if game_id not in self._games:
-                                game = LocalGame(
-                                    id=game_id,
-                                    name=game_name,
-                                    install_dir=Path(root),
-                                    executable=file,
-                                    metadata={"auto_detected": True}
-                                )
-                                self._games[game_id] = game
-                                found_games.append(game)
+                    fl = file.lower()
+                    # Verifica se o arquivo parece ser um jogo (pode ser aprimorado)
+                    if fl.endswith(exts) and looks_like_game(fl):
+                        game = LocalGame(
+                            id=game_id,
+                            # A extensão (.exe/.lnk) já foi confirmada acima
+                            name=file.rpartition('.')[0],
+                            install_dir=Path(root),
+                            executable=file,
+                            metadata={"auto_detected": True}
+                        )
+                        games[game_id] = game
+                        found_games.append(game)
+                        break
         
         # Salva os jogos encontrados
         if found_games:
+            self._revision += 1
             self._save_config()
         
         return found_games
     
+    @staticmethod
+    def _list_dir(root: str) -> Tuple[List[str], List[str]]:
+        """Lista um único diretório com ``os.scandir``.
+        
+        As entradas são classificadas pelo tipo já obtido na listagem do
+        ``DirEntry``, sem um ``stat`` extra por entrada. Links simbólicos e
+        arquivos especiais (pipes, sockets) são descartados, assim como pastas
+        ocultas e as de ``_SKIP_DIRS``. No Windows, ``os.scandir`` é implementado sobre
+        ``FindFirstFileW``/``FindNextFileW`` e ``is_dir()`` lê os atributos
+        devolvidos pela própria listagem, então nenhum arquivo é aberto. No
+        Linux, a listagem usa ``readdir`` (lotes de ``getdents64``) e o tipo
+        vem de ``d_type``; só sistemas de arquivos que não o preenchem
+        recorrem a um ``lstat``.
+        
+        Args:
+            root: Diretório a ser listado.
+            
+        Returns:
+            Tupla ``(nomes_de_arquivos, caminhos_de_subdiretórios)``.
+        """
+        files: List[str] = []
+        subdirs: List[str] = []
+        try:
+            with os.scandir(root) as entries:
+                for entry in entries:
+                    if entry.is_file(follow_symlinks=False):
+                        files.append(entry.name)
+                    elif entry.is_dir(follow_symlinks=False):
+                        name = entry.name
+                        if not name.startswith('.') and name.lower() not in _SKIP_DIRS:
+                            subdirs.append(entry.path)
+        except OSError as e:
+            logger.debug(f"Não foi possível listar o diretório {root}: {e}")
+        return files, subdirs
+    
+    @classmethod
+    def _walk_scandir(cls, directory: Path) -> Iterator[Tuple[str, List[str]]]:
+        """Percorre ``directory`` recursivamente, listando as pastas em paralelo.
+        
+        A varredura é dominada por chamadas de sistema de metadados, então cada
+        diretório é listado em uma tarefa de um pool de threads, e cada
+        subdiretório encontrado vira uma nova tarefa. Só a thread chamadora
+        agenda tarefas e consome resultados, portanto nenhum estado é
+        compartilhado entre as threads. Os diretórios são entregues na mesma
+        ordem de ``os.walk`` (de cima para baixo), mantendo o resultado
+        determinístico.
+        
+        Args:
+            directory: Diretório raiz da varredura.
+            
+        Yields:
+            Tuplas ``(diretório, nomes_de_arquivos)`` para cada diretório visitado.
+        """
+        root = str(directory)
+        listings: Dict[str, Tuple[List[str], List[str]]] = {}
+        
+        with ThreadPoolExecutor(max_workers=_SCAN_WORKERS) as executor:
+            pending = {executor.submit(cls._list_dir, root): root}
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    path = pending.pop(future)
+                    listing = future.result()
+                    listings[path] = listing
+                    for subdir in listing[1]:
+                        pending[executor.submit(cls._list_dir, subdir)] = subdir
+        
+        stack = [root]
+        while stack:
+            path = stack.pop()
+            files, subdirs = listings[path]
+            yield path, files
+            # Empilha em ordem reversa para visitar as subpastas na ordem listada
+            stack.extend(reversed(subdirs))
+    
     def _load_config(self) -> bool:
         """
         Carrega a configuração de jogos locais do arquivo.
         
+        Se o arquivo não mudou (mesmo mtime e tamanho) desde a última leitura
+        ou escrita, o estado em memória é mantido e nada é relido. Depois do
+        arquivo principal, as alterações pendentes do journal são reaplicadas.
+        
         Returns:
             True se a configuração foi carregada com sucesso, False caso contrário
         """
-        try:
-            if not self._config_file.exists():
-                return False
-            
-            with open(self._config_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            # Carrega os jogos
-            self._games.clear()
-            for game_id, game_data in data.get('games', {}).items():
+        with self._save_lock:
+            try:
                 try:
-                    game = LocalGame(
-                        id=game_id,
-                        name=game_data['name'],
-                        install_dir=Path(game_data['install_dir']),
-                        executable=game_data['executable'],
-                        platform=game_data.get('platform', 'local'),
-                        icon=game_data.get('icon'),
-                        banner=game_data.get('banner'),
-                        is_installed=game_data.get('is_installed', True),
-                        last_played=game_data.get('last_played'),
-                        playtime=game_data.get('playtime', 0.0),
-                        metadata=game_data.get('metadata', {})
-                    )
-                    self._games[game_id] = game
-                except Exception as e:
-                    logger.error(f"Erro ao carregar jogo {game_id}: {e}")
-            
-            # Carrega os diretórios para escanear
-            self._scan_directories = [Path(d) for d in data.get('scan_directories', [])]
-            
-            return True
-        except Exception as e:
-            logger.error(f"Erro ao carregar configuração de jogos locais: {e}")
-            return False
+                    stat = self._config_file.stat()
+                except FileNotFoundError:
+                    return False
+                
+                sig = (stat.st_mtime_ns, stat.st_size, self._journal_size())
+                if sig == self._cfg_sig:
+                    return True
+                
+                if orjson is not None:
+                    data = orjson.loads(self._config_file.read_bytes())
+                else:
+                    with open(self._config_file, 'r', encoding='utf-8') as f:
+                        data = json.load(f)
+                
+                # Carrega os jogos
+                self._games.clear()
+                for game_id, game_data in data.get('games', {}).items():
+                    try:
+                        game = LocalGame(
+                            id=game_id,
+                            name=game_data['name'],
+                            install_dir=Path(game_data['install_dir']),
+                            executable=game_data['executable'],
+                            platform=game_data.get('platform', 'local'),
+                            icon=game_data.get('icon'),
+                            banner=game_data.get('banner'),
+                            is_installed=game_data.get('is_installed', True),
+                            last_played=game_data.get('last_played'),
+                            playtime=game_data.get('playtime', 0.0),
+                            metadata=game_data.get('metadata', {})
+                        )
+                        self._games[game_id] = game
+                    except Exception as e:
+                        logger.error(f"Erro ao carregar jogo {game_id}: {e}")
+                
+                # Carrega os diretórios para escanear
+                self._scan_directories = [Path(d) for d in data.get('scan_directories', [])]
+                
+                self._replay_journal()
+                self._cfg_sig = sig
+                self._revision += 1
+                return True
+            except Exception as e:
+                logger.error(f"Erro ao carregar configuração de jogos locais: {e}")
+                return False
     
     def _save_config(self) -> bool:
         """
@@ -288,8 +524,9 @@ class LocalGamesHandler(PlatformHandler):
                 'scan_directories': [str(d) for d in self._scan_directories]
             }
             
-            # Converte os jogos para dicionário
-            for game_id, game in self._games.items():
+            # Converte os jogos para dicionário (sobre uma cópia, pois a escrita
+            # pode ocorrer em outra thread)
+            for game_id, game in list(self._games.items()):
                 data['games'][game_id] = {
                     'name': game.name,
                     'install_dir': str(game.install_dir),
@@ -303,15 +540,113 @@ class LocalGamesHandler(PlatformHandler):
                     'metadata': game.metadata or {}
                 }
             
-            # Salva no arquivo
-            with open(self._config_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            # Salva em um arquivo temporário e o troca de lugar atomicamente: uma
+            # falha no meio da escrita nunca deixa o arquivo pela metade. O
+            # fsync antes da troca garante que o conteúdo novo já está no disco
+            # quando o nome passa a apontar para ele
+            if orjson is not None:
+                payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+            else:
+                payload = json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+            tmp_file = self._config_file.with_name(self._config_file.name + '.tmp')
+            with self._save_lock:
+                with open(tmp_file, 'wb') as f:
+                    f.write(payload)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_file, self._config_file)
+                
+                # O arquivo completo já inclui tudo o que estava no journal
+                self._journal_file.unlink(missing_ok=True)
+                self._journal_entries = 0
+                
+                # O arquivo agora reflete a memória: a próxima leitura é dispensada
+                stat = self._config_file.stat()
+                self._cfg_sig = (stat.st_mtime_ns, stat.st_size, 0)
             
             return True
         except Exception as e:
             logger.error(f"Erro ao salvar configuração de jogos locais: {e}")
             return False
     
+    def _journal_size(self) -> int:
+        """Retorna o tamanho atual do journal (0 se ele não existir)."""
+        try:
+            return os.stat(self._journal_file).st_size
+        except FileNotFoundError:
+            return 0
+    
+    def _append_journal(self, game_id: str, delta: Dict[str, Any]) -> bool:
+        """
+        Anota a alteração de um jogo no journal, sem reescrever o arquivo inteiro.
+        
+        O custo da escrita não depende do tamanho da biblioteca. A cada
+        ``_JOURNAL_COMPACT_EVERY`` entradas, o journal é consolidado no arquivo
+        principal.
+        
+        Args:
+            game_id: ID do jogo alterado
+            delta: Campos alterados e seus novos valores
+            
+        Returns:
+            True se a alteração foi registrada com sucesso, False caso contrário
+        """
+        # Sem o arquivo principal em dia, não há base sobre a qual reaplicar
+        if self._cfg_sig is None:
+            return self._save_config()
+        
+        entry = {'id': game_id, 'set': delta}
+        try:
+            with self._save_lock:
+                if orjson is not None:
+                    line = orjson.dumps(entry) + b'\n'
+                else:
+                    line = json.dumps(entry, ensure_ascii=False).encode('utf-8') + b'\n'
+                with open(self._journal_file, 'ab') as f:
+                    f.write(line)
+                    f.flush()
+                    os.fsync(f.fileno())
+                
+                self._journal_entries += 1
+                self._cfg_sig = self._cfg_sig[:2] + (self._journal_size(),)
+                compact = self._journal_entries >= _JOURNAL_COMPACT_EVERY
+        except Exception as e:
+            logger.error(f"Erro ao registrar alteração do jogo {game_id}: {e}")
+            return False
+        
+        return self._save_config() if compact else True
+    
+    def _replay_journal(self) -> None:
+        """Reaplica sobre os jogos em memória as alterações anotadas no journal."""
+        try:
+            data = self._journal_file.read_bytes()
+        except FileNotFoundError:
+            self._journal_entries = 0
+            return
+        
+        entries = 0
+        for line in data.splitlines():
+            try:
+                entry = orjson.loads(line) if orjson is not None else json.loads(line)
+            except ValueError:
+                # Linha incompleta (escrita interrompida): as demais continuam válidas
+                continue
+            
+            entries += 1
+            game = self._games.get(entry.get('id'))
+            if game is None:
+                continue
+            for field_name, value in entry.get('set', {}).items():
+                if hasattr(game, field_name):
+                    setattr(game, field_name, value)
+        
+        self._journal_entries = entries
+    
+    def _compact(self) -> None:
+        """Consolida o journal no arquivo principal, se houver algo pendente."""
+        if self._journal_entries:
+            self._save_config()
+    
     @staticmethod
     def _looks_like_game(filename: str) -> bool:
         """
@@ -323,28 +658,12 @@ class LocalGamesHandler(PlatformHandler):
         Returns:
             True se o arquivo parece ser um jogo, False caso contrário
         """
-        # Lista de palavras-chave que indicam que o arquivo pode ser um jogo
-        game_keywords = [
-            'launcher', 'game', 'setup', 'install', 'play', 'start', 'run',
-            'battle', 'war', 'quest', 'adventure', 'legend', 'kingdom', 'empire',
-            'simulator', 'tycoon', 'edition', 'definitive', 'remastered', 'hd'
-        ]
-        
-        # Lista de palavras que indicam que o arquivo provavelmente não é um jogo
-        non_game_keywords = [
-            'unins', 'uninst', 'uninstall', 'crash', 'error', 'dxsetup', 'vcredist',
-            'directx', 'redist', 'msi', 'msp', 'patch', 'update', 'eula', 'readme',
-            'license', 'changelog', 'config', 'settings', 'options', 'credits', 'help'
-        ]
-        
         # Converte para minúsculas para comparação sem distinção de maiúsculas/minúsculas
-        filename_lower = filename.lower()
-        
-        # Verifica se o nome do arquivo contém alguma palavra-chave de jogo
-        has_game_keyword = any(keyword in filename_lower for keyword in game_keywords)
-        
-        # Verifica se o nome do arquivo contém alguma palavra-chave de não-jogo
-        has_non_game_keyword = any(keyword in filename_lower for keyword in non_game_keywords)
-        
+        return LocalGamesHandler._looks_like_game_lower(filename.lower())
+    
+    @staticmethod
+    def _looks_like_game_lower(filename_lower: str) -> bool:
+        """Variante de ``_looks_like_game`` para nomes já em minúsculas."""
         # Considera como jogo se tiver uma palavra-chave de jogo e nenhuma de não-jogo
-        return has_game_keyword and not has_non_game_keyword
+        return (_NON_GAME_KEYWORDS_RE.search(filename_lower) is None
+                and _GAME_KEYWORDS_RE.search(filename_lower) is not None)
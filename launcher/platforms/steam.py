@@ -6,18 +6,140 @@ permitindo a descoberta e execução de jogos da Steam no NIX Launcher.
 """
 
 import os
+import re
+import mmap
+import functools
 import json
 import vdf
 import logging
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 
-from . import PlatformHandler, Game
+from . import PlatformHandler, Game, _DATACLASS_SLOTS
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Arquivos já analisados: (caminho, analisador) -> (mtime_ns, resultado)
+_PARSE_CACHE: Dict[Tuple[str, Callable[[str], Any]], Tuple[int, Any]] = {}
+
+# Campos do AppState usados pelo launcher, extraídos direto dos bytes do manifesto
+_MANIFEST_KEYS = re.compile(
+    rb'^[ \t]*"(appid|name|installdir|executable|LastUpdated|PlaytimeForever|SizeOnDisk|'
+    rb'StateFlags|developer|publisher|releasestate)"[ \t]+"((?:[^"\\]|\\.)*)"',
+    re.MULTILINE
+)
+
+# Sequências de escape do formato VDF
+_VDF_ESCAPES = {'\\n': '\n', '\\t': '\t', '\\v': '\v', '\\b': '\b',
+                '\\r': '\r', '\\f': '\f', '\\a': '\a', '\\\\': '\\',
+                '\\?': '?', '\\"': '"', "\\'": "'"}
+_VDF_ESCAPE_RE = re.compile(r'\\.')
+
+# Bibliotecas já resolvidas: caminho da Steam -> (mtime_ns do libraryfolders.vdf, pastas)
+_LIBRARY_CACHE: Dict[str, Tuple[Optional[int], List[Path]]] = {}
+
+# Início de um manifesto válido (espaços em branco seguidos da chave AppState)
+_APPSTATE_HEADER = re.compile(rb'\s*"AppState"')
+
+
+def _cached_parse(path: Path, parser: Callable[[str], Any]) -> Any:
+    """Analisa um arquivo, reaproveitando o resultado anterior se ele não mudou.
+    
+    Args:
+        path: Caminho do arquivo.
+        parser: Função que recebe o caminho e devolve o conteúdo analisado.
+        
+    Returns:
+        Resultado de ``parser`` para o conteúdo atual do arquivo.
+    """
+    path_str = str(path)
+    key = (path_str, parser)
+    mtime_ns = os.stat(path_str).st_mtime_ns
+    cached = _PARSE_CACHE.get(key)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+    
+    result = parser(path_str)
+    _PARSE_CACHE[key] = (mtime_ns, result)
+    return result
+
+
+def _parse_vdf_file(path: str) -> Dict[str, Any]:
+    """Analisa um arquivo VDF completo com a biblioteca ``vdf``."""
+    with open(path, 'r', encoding='utf-8') as f:
+        return vdf.load(f)
+
+
+def _parse_manifest_file(path: str) -> Optional[Dict[str, Any]]:
+    """Extrai os campos do AppState de um manifesto ``appmanifest_*.acf``.
+    
+    Em vez de montar a árvore inteira com o analisador em Python puro, uma
+    expressão regular sobre os bytes do arquivo, mapeado em memória, extrai
+    apenas as chaves usadas; só os valores encontrados são decodificados.
+    Vale a primeira ocorrência de cada chave, que é a do próprio AppState (os
+    blocos aninhados, como ``UserConfig``, vêm depois). Se ``appid`` ou
+    ``name`` não forem encontrados, recorre ao analisador completo.
+    
+    Returns:
+        Dicionário com os campos do AppState ou None se não houver AppState.
+    """
+    fields: Dict[str, Any] = {}
+    with open(path, 'rb') as f:
+        # Arquivos vazios não podem ser mapeados (e não têm AppState)
+        if os.fstat(f.fileno()).st_size == 0:
+            return None
+        
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            if _APPSTATE_HEADER.match(data):
+                for key, value in _MANIFEST_KEYS.findall(data):
+                    key_str = key.decode('ascii')
+                    if key_str not in fields:
+                        value_str = value.decode('utf-8', errors='replace')
+                        if '\\' in value_str:
+                            value_str = _VDF_ESCAPE_RE.sub(
+                                lambda m: _VDF_ESCAPES.get(m.group(), m.group()), value_str
+                            )
+                        fields[key_str] = value_str
+    
+    if fields.get('appid') and fields.get('name'):
+        return fields
+    
+    return _parse_vdf_file(path).get('AppState')
+
+
+def _load_vdf(path: Path) -> Dict[str, Any]:
+    """Carrega um arquivo VDF, reaproveitando a análise anterior se ele não mudou."""
+    return _cached_parse(path, _parse_vdf_file)
+
+
+@functools.lru_cache(maxsize=1)
+def _find_steam_path() -> Optional[Path]:
+    """
+    Encontra o caminho de instalação do Steam no sistema.
+    
+    O resultado é calculado uma única vez por processo.
+    
+    Returns:
+        Path para o diretório de instalação do Steam ou None se não encontrado
+    """
+    # Verifica os locais comuns de instalação do Steam
+    possible_paths = [
+        Path(os.path.expandvars(r"%ProgramFiles(x86)%\Steam")),
+        Path(os.path.expandvars(r"%ProgramFiles%\Steam")),
+        Path.home() / ".steam" / "steam",  # Linux
+        Path.home() / "Library" / "Application Support" / "Steam"  # macOS
+    ]
+    
+    for path in possible_paths:
+        if path.exists() and (path / "steam.exe" if os.name == 'nt' else path / "steam").exists():
+            return path
+    
+    return None
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class SteamGame(Game):
     """Classe que representa um jogo da Steam."""
     appid: str
@@ -77,26 +199,27 @@ class SteamHandler(PlatformHandler):
             logger.warning("Steam não está disponível no sistema")
             return []
         
-        games = []
-        
-        # Para cada pasta de biblioteca da Steam
+        # Reúne os manifestos de todas as bibliotecas antes de analisá-los
+        manifests: List[Tuple[Path, Path]] = []
         for lib_path in self._library_folders:
             steamapps_path = lib_path / "steamapps"
             if not steamapps_path.exists():
                 continue
                 
             # Encontra todos os manifestos de jogos
-            manifest_files = list(steamapps_path.glob("appmanifest_*.acf"))
-            
-            for manifest_file in manifest_files:
-                try:
-                    game = self._parse_manifest(manifest_file, steamapps_path)
-                    if game:
-                        games.append(game)
-                except Exception as e:
-                    logger.error(f"Erro ao processar manifesto {manifest_file}: {e}")
+            manifests.extend(
+                (manifest_file, steamapps_path)
+                for manifest_file in steamapps_path.glob("appmanifest_*.acf")
+            )
+        
+        if not manifests:
+            return []
         
-        return games
+        # Cada manifesto é independente: leitura e análise em paralelo, com o
+        # resultado na mesma ordem da lista (erros já são tratados por manifesto)
+        with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4, len(manifests))) as executor:
+            parsed = executor.map(lambda item: self._parse_manifest(*item), manifests)
+            return [game for game in parsed if game]
     
     def launch_game(self, game_id: str) -> bool:
         """
@@ -131,19 +254,7 @@ class SteamHandler(PlatformHandler):
         Returns:
             Path para o diretório de instalação do Steam ou None se não encontrado
         """
-        # Verifica os locais comuns de instalação do Steam
-        possible_paths = [
-            Path(os.path.expandvars(r"%ProgramFiles(x86)%\Steam")),
-            Path(os.path.expandvars(r"%ProgramFiles%\Steam")),
-            Path.home() / ".steam" / "steam",  # Linux
-            Path.home() / "Library" / "Application Support" / "Steam"  # macOS
-        ]
-        
-        for path in possible_paths:
-            if path.exists() and (path / "steam.exe" if os.name == 'nt' else path / "steam").exists():
-                return path
-        
-        return None
+        return _find_steam_path()
     
     def _find_library_folders(self) -> List[Path]:
         """
@@ -155,17 +266,27 @@ class SteamHandler(PlatformHandler):
         if not self._steam_path:
             return []
         
-        library_folders = [self._steam_path]  # A pasta principal é sempre uma biblioteca
-        
-        # Tenta encontrar o arquivo libraryfolders.vdf que contém as outras bibliotecas
+        # Tenta encontrar o arquivo libraryfolders.vdf que contém as outras bibliotecas;
+        # enquanto ele não mudar, a lista resolvida antes continua valendo
         library_file = self._steam_path / "steamapps" / "libraryfolders.vdf"
+        try:
+            mtime_ns: Optional[int] = library_file.stat().st_mtime_ns
+        except OSError:
+            mtime_ns = None
         
-        if not library_file.exists():
-            return library_folders
+        cache_key = str(self._steam_path)
+        cached = _LIBRARY_CACHE.get(cache_key)
+        if cached is not None and cached[0] == mtime_ns:
+            return list(cached[1])
+        
+        library_folders = [self._steam_path]  # A pasta principal é sempre uma biblioteca
+        
+        if mtime_ns is None:
+            _LIBRARY_CACHE[cache_key] = (mtime_ns, library_folders)
+            return list(library_folders)
         
         try:
-            with open(library_file, 'r', encoding='utf-8') as f:
-                data = vdf.load(f)
+            data = _load_vdf(library_file)
                 
             # O formato do arquivo libraryfolders.vdf mudou ao longo do tempo
             if 'libraryfolders' in data:
@@ -184,8 +305,10 @@ class SteamHandler(PlatformHandler):
                             library_folders.append(path)
         except Exception as e:
             logger.error(f"Erro ao ler arquivo de bibliotecas da Steam: {e}")
+            return library_folders
         
-        return library_folders
+        _LIBRARY_CACHE[cache_key] = (mtime_ns, library_folders)
+        return list(library_folders)
     
     def _parse_manifest(self, manifest_path: Path, steamapps_path: Path) -> Optional[SteamGame]:
         """
@@ -199,13 +322,10 @@ class SteamHandler(PlatformHandler):
             Objeto SteamGame ou None se o jogo não for válido
         """
         try:
-            with open(manifest_path, 'r', encoding='utf-8') as f:
-                manifest = vdf.load(f)
-                
-            if 'AppState' not in manifest:
+            app_state = _cached_parse(manifest_path, _parse_manifest_file)
+            if not app_state:
                 return None
                 
-            app_state = manifest['AppState']
             appid = app_state.get('appid')
             name = app_state.get('name')
             
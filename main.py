@@ -21,7 +21,7 @@ from config import settings
 # Importa a interface gráfica
 from PyQt5.QtWidgets import QApplication, QStyleFactory
 from PyQt5.QtCore import Qt, QTimer
-from PyQt5.QtGui import QIcon
+from PyQt5.QtGui import QIcon, QPixmapCache
 
 # Importa a janela principal
 from ui.main_window import MainWindow
@@ -102,6 +102,10 @@ def main():
         app.setApplicationName("NIX Launcher")
         app.setApplicationVersion("1.0.0")
         
+        # Cache de pixmaps do processo (capas já convertidas), em KB: 128 MB
+        # comportam centenas de capas 280x320 ARGB (~350 KB cada)
+        QPixmapCache.setCacheLimit(128 * 1024)
+        
         # Configurações de alta DPI e escalonamento
         app.setAttribute(Qt.AA_UseHighDpiPixmaps)
         app.setAttribute(Qt.AA_EnableHighDpiScaling, True)
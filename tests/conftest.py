@@ -10,9 +10,14 @@ from typing import Generator, Any, Dict
 from unittest.mock import MagicMock, patch
 
 # Adiciona a raiz do projeto ao path do Python para importações
+import os
 import sys
 from pathlib import Path
 
+# Sinaliza o modo de teste ao código da aplicação. Definido aqui, antes de
+# qualquer módulo de teste importar o pacote, pois é lido na importação
+os.environ.setdefault('NIX_TEST_MODE', '1')
+
 # Obtém o diretório raiz do projeto (onde está o pyproject.toml)
 PROJECT_ROOT = Path(__file__).parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
@@ -31,6 +36,29 @@ def no_sleep(monkeypatch: pytest.MonkeyPatch) -> None:
     
     monkeypatch.setattr('time.sleep', sleep_mock)
 
+@pytest.fixture(autouse=True)
+def rom_cache_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Aponta o cache padrão de ROMs para uma pasta temporária do teste.
+    
+    Evita gravar o índice de ROMs na pasta pessoal do desenvolvedor e que
+    workers do pytest-xdist disputem o mesmo arquivo.
+    """
+    cache_dir = tmp_path / "rom_cache"
+    monkeypatch.setattr(
+        'launcher.platforms.emulators._DEFAULT_ROM_CACHE_DIR', cache_dir, raising=False
+    )
+    return cache_dir
+
+@pytest.fixture(scope="session")
+def qt_app() -> Generator[Any, None, None]:
+    """Fornece uma QApplication real compartilhada por toda a sessão de testes.
+    
+    O PyQt5 só é importado pelos testes que usam esta fixture.
+    """
+    from PyQt5.QtWidgets import QApplication
+    app = QApplication.instance() or QApplication(sys.argv)
+    yield app
+
 @pytest.fixture
 def mock_qt_app() -> Generator[MagicMock, None, None]:
     """Fornece um mock para QApplication para testes que envolvem Qt."""
@@ -78,9 +106,21 @@ def pytest_addoption(parser: Any) -> None:
 def pytest_configure(config: Any) -> None:
     """Configura o pytest."""
     config.addinivalue_line("markers", "slow: marca o teste como lento")
+    config.addinivalue_line(
+        "markers", "serial: teste que não pode rodar em paralelo (pytest-xdist)"
+    )
 
+@pytest.hookimpl(tryfirst=True)
 def pytest_collection_modifyitems(config: Any, items: Any) -> None:
     """Modifica a coleção de testes com base nas opções de linha de comando."""
+    # Com o pytest-xdist (--dist=loadgroup), os testes marcados como serial
+    # formam um único grupo e rodam em sequência no mesmo worker; os demais são
+    # distribuídos livremente. Roda antes do xdist, que lê os grupos
+    serial_group = pytest.mark.xdist_group("serial")
+    for item in items:
+        if "serial" in item.keywords and item.get_closest_marker("xdist_group") is None:
+            item.add_marker(serial_group)
+    
     if config.getoption("--run-slow"):
         # --run-slow fornecido: não pular testes lentos
         return
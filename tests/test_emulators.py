@@ -5,14 +5,19 @@ Testes para a integração de emuladores no NIX Launcher.
 import os
 import sys
 import json
-import tempfile
-import shutil
+import logging
 from pathlib import Path
+from unittest.mock import patch
 import pytest
 
 # Adiciona o diretório raiz ao path para importar os módulos
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+try:
+    import orjson
+except ImportError:  # Dependência opcional: recai no módulo json padrão
+    orjson = None
+
 from launcher.platforms.emulators import EmulatorConfig, EmulatorHandler
 from launcher.game_manager import GameManager
 from config.emulator_config import EmulatorConfig as ConfigManager
@@ -37,36 +42,36 @@ TEST_EMULATORS = [
     }
 ]
 
-# Fixture para criar um ambiente de teste temporário
-@pytest.fixture
-def temp_config():
-    # Cria um diretório temporário
-    temp_dir = tempfile.mkdtemp()
-    config_path = Path(temp_dir) / "emulators.json"
+# Fixture para criar um ambiente de teste temporário, compartilhado pelos
+# testes do módulo (nenhum deles altera os arquivos criados)
+@pytest.fixture(scope="module")
+def temp_config(tmp_path_factory):
+    # Cria um diretório temporário (a limpeza fica a cargo do pytest)
+    temp_dir = tmp_path_factory.mktemp("emulators")
+    config_path = temp_dir / "emulators.json"
     
     # Cria um arquivo de configuração de teste
     test_config = {
         "emulators": TEST_EMULATORS,
         "rom_directories": [
-            str(Path(temp_dir) / "roms")
+            str(temp_dir / "roms")
         ]
     }
     
-    with open(config_path, 'w', encoding='utf-8') as f:
-        json.dump(test_config, f, indent=2)
+    if orjson is not None:
+        config_path.write_bytes(orjson.dumps(test_config, option=orjson.OPT_INDENT_2))
+    else:
+        config_path.write_bytes(json.dumps(test_config, indent=2).encode('utf-8'))
     
     # Cria alguns arquivos de ROM de teste
-    roms_dir = Path(temp_dir) / "roms"
+    roms_dir = temp_dir / "roms"
     roms_dir.mkdir(exist_ok=True)
     
     # Cria alguns arquivos de ROM falsos para teste
     (roms_dir / "Super Mario World.smc").touch()
     (roms_dir / "Sonic The Hedgehog.gen").touch()
     
-    yield str(config_path)
-    
-    # Limpa o diretório temporário após o teste
-    shutil.rmtree(temp_dir, ignore_errors=True)
+    return str(config_path)
 
 def test_emulator_config_loading(temp_config):
     """Testa o carregamento da configuração de emuladores."""
@@ -78,6 +83,23 @@ def test_emulator_config_loading(temp_config):
     assert emulators[1]["name"] == "Kega Fusion"
     assert len(config.get_rom_directories()) == 1
 
+def test_config_cached(tmp_path):
+    """Testa que a configuração só é relida quando o arquivo muda."""
+    config_path = tmp_path / "emulators.json"
+    config_path.write_text(json.dumps({"emulators": TEST_EMULATORS, "rom_directories": []}))
+    config = ConfigManager(str(config_path))
+    assert len(config.get_emulators()) == 2
+    
+    # Arquivo inalterado: nenhuma nova leitura
+    with patch('builtins.open', side_effect=AssertionError('configuração relida')):
+        assert len(config.get_emulators()) == 2
+        assert config.get_rom_directories() == []
+    
+    # Arquivo alterado: a próxima consulta vê o novo conteúdo
+    config_path.write_text(json.dumps({"emulators": TEST_EMULATORS[:1], "rom_directories": ["roms"]}))
+    assert len(config.get_emulators()) == 1
+    assert config.get_rom_directories() == ["roms"]
+
 def test_emulator_handler_initialization():
     """Testa a inicialização do manipulador de emuladores."""
     config = {
@@ -90,12 +112,8 @@ def test_emulator_handler_initialization():
     # Em ambiente de teste, is_available() retorna True se houver emuladores configurados
     assert handler.is_available() is True
 
-def test_game_manager_with_emulators(temp_config, tmp_path, monkeypatch):
+def test_game_manager_with_emulators(temp_config, tmp_path, monkeypatch, caplog):
     """Testa a integração do gerenciador de jogos com emuladores."""
-    # Força o ambiente de teste
-    import sys
-    sys.modules['pytest'] = True
-    
     # Configura o gerenciador com o caminho temporário
     config_manager = ConfigManager(temp_config)
     
@@ -111,69 +129,34 @@ def test_game_manager_with_emulators(temp_config, tmp_path, monkeypatch):
     # Garante que temos pelo menos um emulador configurado
     assert len(emulators) > 0, "Nenhum emulador configurado"
     
-    # Configuração para o GameManager
-    game_config = {
+    # Cria um GameManager com a configuração de teste
+    game_manager = GameManager({
         "emulators": emulators,
         "rom_directories": rom_dirs,
-        "pastas_hd": []
-    }
+        "rom_cache_file": str(tmp_path / "roms.json"),
+    })
     
-    # Log da configuração para debug
-    print("\nConfiguração do GameManager:")
-    print(f"- Número de emuladores: {len(emulators)}")
-    for i, emu in enumerate(emulators, 1):
-        print(f"  {i}. {emu.get('name', 'Sem nome')} - {emu.get('path', 'Sem caminho')}")
-        print(f"     Plataformas: {', '.join(emu.get('platforms', []))}")
-        print(f"     Extensões: {', '.join(emu.get('extensions', []))}")
-    print(f"- Diretórios de ROMs: {rom_dirs}")
-    
-    # Cria um GameManager com a configuração de teste
-    game_manager = GameManager({"emulators": emulators, "rom_directories": rom_dirs})
-    
-    # Habilita logs detalhados para debug
-    import logging
-    logging.basicConfig(level=logging.DEBUG)
-    
-    # Inicializa o gerenciador
-    assert game_manager.initialize() is True, "Falha ao inicializar o GameManager"
+    # Logs detalhados apenas dos manipuladores de plataforma e só durante a
+    # inicialização (capturados pelo pytest e exibidos em caso de falha)
+    with caplog.at_level(logging.DEBUG, logger='launcher.platforms'):
+        assert game_manager.initialize() is True, "Falha ao inicializar o GameManager"
     
     # Verifica se os emuladores foram carregados corretamente
     assert len(game_manager.platforms) > 0, "Nenhuma plataforma carregada"
     
-    # Log das plataformas carregadas
-    print("\nPlataformas carregadas:")
-    for platform in game_manager.platforms:
-        print(f"- {platform.name} (disponível: {platform.is_available()})")
-    
     # Verifica se há pelo menos um manipulador de emuladores
     emu_handlers = [p for p in game_manager.platforms if p.name == "Emuladores"]
-    print(f"\nManipuladores de emuladores encontrados: {len(emu_handlers)}")
-    
-    if emu_handlers:
-        emu_handler = emu_handlers[0]
-        print(f"Configuração do manipulador de emuladores: {emu_handler.config}")
-        print(f"Número de emuladores no handler: {len(emu_handler.emulators) if hasattr(emu_handler, 'emulators') else 'N/A'}")
-    
     assert len(emu_handlers) > 0, "Nenhum manipulador de emuladores encontrado"
     
     # Verifica se os jogos foram detectados
     games = game_manager.get_games()
-    print(f"\nTotal de jogos encontrados: {len(games)}")
-    
-    # Log dos jogos encontrados
-    for i, game in enumerate(games, 1):
-        print(f"{i}. {game.name} ({game.platform}) - {game.executable}")
-    
-    assert len(games) >= 2, f"Esperava pelo menos 2 jogos, mas encontrou {len(games)}"
-    
-    # Verifica se os jogos têm as plataformas corretas
-    platforms = {game.platform for game in games}
-    
-    # Log para debug
-    print(f"\nPlataformas encontradas: {platforms}")
-    print(f"Jogos encontrados: {[(g.name, g.platform) for g in games]}")
+    assert len(games) >= 2, (
+        f"Esperava pelo menos 2 jogos, mas encontrou {len(games)}: "
+        f"{[(g.name, g.platform) for g in games]}"
+    )
     
     # Verifica se pelo menos uma das plataformas esperadas está presente
+    platforms = {game.platform for game in games}
     expected_platforms = ["Super Nintendo", "SNES", "Sega Mega Drive", "Sega Genesis"]
     assert any(p in expected_platforms for p in platforms), \
         f"Nenhuma das plataformas esperadas encontrada. Encontradas: {platforms}"
@@ -204,7 +187,8 @@ def test_emulator_launch_game(monkeypatch, tmp_path):
     
     config = {
         "emulators": [emulator_config],
-        "rom_directories": [str(rom_dir)]
+        "rom_directories": [str(rom_dir)],
+        "rom_cache_file": str(tmp_path / "roms.json")
     }
     
     # Cria o handler e carrega os jogos
@@ -222,7 +206,73 @@ def test_emulator_launch_game(monkeypatch, tmp_path):
     result = handler.launch_game(game_id)
     assert result is True  # Deve retornar True mesmo com o mock
 
+def test_emulator_rom_index_cache(monkeypatch, tmp_path):
+    """Testa o reaproveitamento do índice de ROMs entre cargas."""
+    rom_dir = tmp_path / "roms"
+    (rom_dir / "SNES").mkdir(parents=True)
+    (rom_dir / "SNES" / "Super Mario World.smc").touch()
+    
+    config = {
+        "emulators": TEST_EMULATORS,
+        "rom_directories": [str(rom_dir)],
+        "rom_cache_file": str(tmp_path / "cache" / "roms.json")
+    }
+    
+    handler = EmulatorHandler(config)
+    handler.load_games()
+    assert len(handler.get_games()) == 1
+    assert Path(config["rom_cache_file"]).exists()
+    
+    # Conta as listagens de diretório feitas nas cargas seguintes
+    scanned = []
+    real_scandir = os.scandir
+    
+    def counting_scandir(path):
+        scanned.append(path)
+        return real_scandir(path)
+    
+    monkeypatch.setattr(os, "scandir", counting_scandir)
+    
+    # Nada mudou: a segunda carga vem inteira do índice
+    handler = EmulatorHandler(config)
+    handler.load_games()
+    assert [g.name for g in handler.get_games()] == ["Super Mario World"]
+    assert scanned == []
+    
+    # rescan() ignora o índice e lista todos os diretórios de novo
+    handler.rescan()
+    assert len(scanned) == 2
+    assert len(handler.get_games()) == 1
+
 if __name__ == "__main__":
     # Executa os testes diretamente
     import pytest
     pytest.main([__file__, "-v"])
+
+def test_emulator_rom_index_disabled(tmp_path, rom_cache_dir):
+    """Testa que rom_cache_file None desativa o índice de ROMs em disco."""
+    rom_dir = tmp_path / "roms"
+    rom_dir.mkdir()
+    (rom_dir / "Super Mario World.smc").touch()
+    
+    config = {
+        "emulators": TEST_EMULATORS,
+        "rom_directories": [str(rom_dir)],
+        "rom_cache_file": None
+    }
+    
+    handler = EmulatorHandler(config)
+    handler.load_games()
+    assert len(handler.get_games()) == 1
+    assert not rom_cache_dir.exists()
+
+@pytest.mark.parametrize("file_name,expected", [
+    ("indiana jones (genesis).zip", "Sega Genesis"),
+    ("business tycoon (snes).zip", "Super Nintendo"),
+    ("gb & snes pack.zip", "Super Nintendo"),
+    ("pokemon (game boy advance).zip", "Game Boy Advance"),
+])
+def test_identify_platform_priority(file_name, expected):
+    """Testa que o nome do arquivo resolve para a plataforma de maior prioridade."""
+    handler = EmulatorHandler({"emulators": TEST_EMULATORS, "rom_cache_file": None})
+    assert handler._identify_platform(file_name, "roms", "zip") == expected
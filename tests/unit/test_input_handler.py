@@ -4,8 +4,10 @@ Este módulo contém testes para a classe InputHandler, que gerencia entradas
 de gamepad e teclado no NIX Launcher.
 """
 
+import asyncio
+import math
 import pytest
-import time
+import threading
 from unittest.mock import MagicMock, patch, ANY
 from typing import Dict, Any, Callable, Optional
 
@@ -47,7 +49,7 @@ class TestInputEvent:
         assert event.button == Button.A
         assert event.state == 1
         assert not event.is_analog
-        assert isinstance(event.timestamp, float)
+        assert isinstance(event.timestamp, int)
     
     def test_input_event_creation_analog(self):
         """Testa a criação de um evento analógico."""
@@ -75,10 +77,20 @@ class TestInputHandler:
     def test_initialization(self, mock_input_callback: MagicMock):
         """Testa a inicialização do InputHandler."""
         handler = InputHandler(mock_input_callback)
-        assert handler._running is False
+        assert handler.is_running() is False
         assert handler._thread is None
         assert handler._deadzone == DEFAULT_DEADZONE
         assert isinstance(handler._keyboard_mapping, dict)
+        assert handler._keyboard_lookup["KEY_ENTER"] is Button.A
+    
+    def test_keyboard_mapping_lookup(self, input_handler: InputHandler, mock_input_callback: MagicMock):
+        """Testa a tabela de teclado pré-calculada e o descarte de mapeamentos inválidos."""
+        input_handler.set_keyboard_mapping({"key_w": Button.DPAD_UP, "KEY_X": "invalido"})
+        assert "KEY_X" not in input_handler._keyboard_lookup
+        
+        input_handler._process_keyboard_event(MagicMock(ev_type="Key", code="KEY_W", state=1))
+        mock_input_callback.assert_called_once()
+        assert mock_input_callback.call_args[0][0].button == Button.DPAD_UP
     
     def test_set_deadzone(self, input_handler: InputHandler):
         """Testa a configuração da zona morta."""
@@ -161,8 +173,10 @@ class TestInputHandler:
         
         # Testa o início
         input_handler.start()
-        assert input_handler._running is True
-        mock_thread_class.assert_called_once_with(target=input_handler._event_loop, daemon=True)
+        assert input_handler.is_running() is True
+        mock_thread_class.assert_called_once_with(
+            target=input_handler._event_loop, name="InputHandler", daemon=True
+        )
         mock_thread.start.assert_called_once()
         
         # Reseta o mock para o teste de parada
@@ -170,9 +184,68 @@ class TestInputHandler:
         
         # Testa a parada
         input_handler.stop()
-        assert input_handler._running is False
+        assert input_handler.is_running() is False
         mock_thread.join.assert_called_once()
     
+    def test_coalesce_events(self):
+        """Testa a coalescência de eventos analógicos por quadro."""
+        def raw(ev_type: str, code: str, state: int) -> MagicMock:
+            return MagicMock(ev_type=ev_type, code=code, state=state)
+        
+        events = [raw("Absolute", "ABS_X", value) for value in range(5)]
+        events += [
+            raw("Key", "BTN_SOUTH", 1),
+            raw("Absolute", "ABS_HAT0X", -1),
+            raw("Absolute", "ABS_HAT0X", 0),
+        ]
+        
+        result = [(e.code, e.state) for e in InputHandler._coalesce_events(events)]
+        
+        # Botões e D-Pad preservam a ordem; cada eixo mantém só o último valor
+        assert result == [
+            ("BTN_SOUTH", 1), ("ABS_HAT0X", -1), ("ABS_HAT0X", 0), ("ABS_X", 4)
+        ]
+    
+    @pytest.mark.parametrize("count,batch_size", [(1, 4), (8, 4), (10, 3), (22, 5)])
+    def test_batched_dispatch(self, count: int, batch_size: int):
+        """Testa que cada leitura gera no máximo uma chamada do callback em lote."""
+        single_callback = MagicMock()
+        batch_callback = MagicMock()
+        handler = InputHandler(single_callback, on_input_batch=batch_callback)
+        
+        # Alterna pressionar/soltar entre os botões para que nenhum evento seja descartado
+        codes = [code for code, button in InputHandler.BUTTON_MAPPING.items()
+                 if code.startswith("BTN_")]
+        events = [
+            MagicMock(ev_type="Key", code=codes[i % len(codes)], state=(i // len(codes) + 1) % 2)
+            for i in range(count)
+        ]
+        
+        with patch("launcher.input_handler.GAMEPAD_AVAILABLE", True):
+            for start in range(0, count, batch_size):
+                for event in handler._coalesce_events(events[start:start + batch_size]):
+                    handler._process_gamepad_event(event)
+                handler._flush_batch()
+        
+        single_callback.assert_not_called()
+        assert batch_callback.call_count <= math.ceil(count / batch_size)
+        delivered = [event for call in batch_callback.call_args_list for event in call[0][0]]
+        assert len(delivered) == count
+        assert all(isinstance(call[0][0], tuple) for call in batch_callback.call_args_list)
+    
+    def test_run_async_stop(self, input_handler: InputHandler):
+        """Testa a captura integrada ao asyncio e o encerramento via stop()."""
+        async def scenario() -> None:
+            task = asyncio.create_task(input_handler.run())
+            await asyncio.sleep(0)
+            assert input_handler.is_running() is True
+            
+            input_handler.stop()
+            await asyncio.wait_for(task, timeout=1.0)
+        
+        asyncio.run(scenario())
+        assert input_handler.is_running() is False
+    
     @pytest.mark.skipif(not GAMEPAD_AVAILABLE, reason="Suporte a gamepad não disponível")
     def test_process_gamepad_event_button(self, input_handler: InputHandler, mock_input_callback: MagicMock):
         """Testa o processamento de eventos de botão do gamepad."""
@@ -209,24 +282,42 @@ class TestInputHandler:
         assert called_event.button == Button.LEFT_X
         assert 0.4 < called_event.state < 0.6  # Deve estar próximo de 0.5
         assert called_event.is_analog
+    
+    @pytest.mark.skipif(not GAMEPAD_AVAILABLE, reason="Suporte a gamepad não disponível")
+    def test_gamepad_callback_error_propagates(self, input_handler: InputHandler, mock_input_callback: MagicMock):
+        """Testa que exceções do callback não são engolidas pelo tratamento do evento."""
+        mock_input_callback.side_effect = RuntimeError("falha no callback")
+        mock_event = MagicMock(ev_type="Key", code="BTN_SOUTH", state=1)
+        
+        with pytest.raises(RuntimeError, match="falha no callback"):
+            input_handler._process_gamepad_event(mock_event)
+    
+    def test_keyboard_callback_error_propagates(self, input_handler: InputHandler, mock_input_callback: MagicMock):
+        """Testa que exceções do callback em eventos de teclado chegam ao loop de eventos."""
+        mock_input_callback.side_effect = RuntimeError("falha no callback")
+        
+        with pytest.raises(RuntimeError, match="falha no callback"):
+            input_handler._process_keyboard_event(MagicMock(ev_type="Key", code="KEY_ENTER", state=1))
 
 # Testes de integração (opcional, podem ser movidos para outro arquivo)
 
+@pytest.mark.serial
 class TestInputHandlerIntegration:
     """Testes de integração para a classe InputHandler."""
     
     @pytest.mark.skipif(not GAMEPAD_AVAILABLE, reason="Suporte a gamepad não disponível")
-    def test_gamepad_connection(self, mock_input_callback: MagicMock):
+    def test_gamepad_connection(self):
         """Testa a detecção de conexão/desconexão de gamepad."""
         # Este teste requer um gamepad físico conectado
-        handler = InputHandler(mock_input_callback)
+        first_event = threading.Event()
+        handler = InputHandler(lambda event: first_event.set())
         
         try:
             # Inicia o manipulador
             handler.start()
             
-            # Dá um tempo para detecção inicial
-            time.sleep(0.5)
+            # Aguarda o primeiro evento, por no máximo meio segundo
+            first_event.wait(timeout=0.5)
             
             # Verifica se houve alguma interação (não podemos garantir o que será)
             # Apenas verificamos se não houve erros
@@ -26,19 +26,22 @@ def mock_settings():
 
 @pytest.fixture
 def theme_manager_instance(mock_settings):
-    """Instância do ThemeManager para testes."""
-    # Reseta o singleton para cada teste
-    ThemeManager._instance = None
-    return ThemeManager()
+    """Instância independente do ThemeManager para testes (sem tocar no singleton)."""
+    return ThemeManager(styles_dir=TEST_THEME_DIR, settings_obj=mock_settings)
 
 def test_theme_manager_singleton(theme_manager_instance):
     """Testa se o ThemeManager segue o padrão Singleton."""
     # Cria uma nova instância
+    instance = ThemeManager()
     another_instance = ThemeManager()
     
     # Verifica se é a mesma instância
-    assert theme_manager_instance is another_instance
-    assert id(theme_manager_instance) == id(another_instance)
+    assert instance is another_instance
+    assert instance is theme_manager
+    assert id(instance) == id(another_instance)
+    
+    # Instâncias com dependências injetadas não substituem o singleton
+    assert theme_manager_instance is not instance
 
 def test_load_theme_success(theme_manager_instance, tmp_path):
     """Testa o carregamento de um tema existente."""
@@ -60,6 +63,43 @@ def test_load_theme_success(theme_manager_instance, tmp_path):
     assert theme_manager_instance.current_theme == 'test'
     assert 'color: red' in theme_manager_instance._style_sheet
 
+def test_load_theme_cache_hit(theme_manager_instance, tmp_path):
+    """Testa que um tema já carregado não é relido enquanto o arquivo não muda."""
+    theme_file = tmp_path / 'cached_theme.qss'
+    theme_file.write_text('QWidget { color: blue; }')
+    
+    theme_manager_instance._styles_dir = tmp_path
+    theme_manager_instance.THEMES = {
+        'test': {'file': 'cached_theme.qss', 'is_dark': True}
+    }
+    assert theme_manager_instance.load_theme('test') is True
+    
+    # A segunda carga não pode abrir o arquivo
+    with patch('builtins.open', side_effect=AssertionError('arquivo relido')):
+        assert theme_manager_instance.load_theme('test') is True
+    assert 'color: blue' in theme_manager_instance._style_sheet
+
+def test_reload_theme_bypasses_cache(theme_manager_instance, tmp_path):
+    """Testa que reload_theme relê o arquivo mesmo com o mtime inalterado."""
+    theme_file = tmp_path / 'reload_theme.qss'
+    theme_file.write_text('QWidget { color: blue; }')
+    
+    theme_manager_instance._styles_dir = tmp_path
+    theme_manager_instance.THEMES = {
+        'test': {'file': 'reload_theme.qss', 'is_dark': True}
+    }
+    assert theme_manager_instance.load_theme('test') is True
+    
+    # Reescreve o conteúdo restaurando o mtime original
+    stat = theme_file.stat()
+    theme_file.write_text('QWidget { color: green; }')
+    os.utime(theme_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    
+    assert theme_manager_instance.load_theme('test') is True
+    assert 'color: blue' in theme_manager_instance._style_sheet
+    assert theme_manager_instance.reload_theme() is True
+    assert 'color: green' in theme_manager_instance._style_sheet
+
 def test_load_theme_file_not_found(theme_manager_instance, tmp_path, caplog):
     """Testa o carregamento de um tema com arquivo inexistente."""
     # Configura o tema de teste com arquivo que não existe
@@ -76,16 +116,13 @@ def test_load_theme_file_not_found(theme_manager_instance, tmp_path, caplog):
     # Verifica se tentou carregar o tema padrão
     assert 'dark' in caplog.text.lower()
 
-def test_apply_theme(theme_manager_instance, qtbot):
+def test_apply_theme(theme_manager_instance, qt_app):
     """Testa a aplicação do tema a um aplicativo Qt."""
-    from PyQt5.QtWidgets import QApplication
-    
     # Configura o tema
     theme_manager_instance._style_sheet = 'QWidget { color: red; }'
     theme_manager_instance._current_theme = 'dark'
     
-    # Cria um aplicativo de teste
-    app = QApplication.instance() or QApplication(sys.argv)
+    app = qt_app
     
     # Aplica o tema
     theme_manager_instance.apply_theme(app)
@@ -97,6 +134,33 @@ def test_apply_theme(theme_manager_instance, qtbot):
     palette = app.palette()
     assert palette.window().color().name() == '#1e1e1e'
 
+def test_apply_theme_skips_unchanged(theme_manager_instance, qt_app):
+    """Testa que reaplicar o mesmo tema ao mesmo alvo não refaz o trabalho."""
+    theme_manager_instance._style_sheet = 'QWidget { color: red; }'
+    theme_manager_instance._current_theme = 'dark'
+    target = MagicMock()
+    
+    theme_manager_instance.apply_theme(target)
+    theme_manager_instance.apply_theme(target)
+    target.setStyleSheet.assert_called_once()
+    target.setPalette.assert_called_once()
+    
+    # Mudar a variante do tema reaplica só a paleta
+    theme_manager_instance._current_theme = 'light'
+    theme_manager_instance.apply_theme(target)
+    target.setStyleSheet.assert_called_once()
+    assert target.setPalette.call_count == 2
+    
+    # Uma folha relida (novo objeto) é reaplicada; um novo alvo recebe tudo
+    theme_manager_instance._style_sheet = ''.join(['QWidget { color: blue; }'])
+    theme_manager_instance.apply_theme(target)
+    assert target.setStyleSheet.call_count == 2
+    
+    other = MagicMock()
+    theme_manager_instance.apply_theme(other)
+    other.setStyleSheet.assert_called_once()
+    other.setPalette.assert_called_once()
+
 def test_is_dark_theme_property(theme_manager_instance):
     """Testa a propriedade is_dark_theme."""
     # Testa com tema escuro
@@ -115,10 +179,9 @@ def test_is_dark_theme_property(theme_manager_instance):
     with patch.object(theme_manager_instance, '_is_system_dark_theme', return_value=False):
         assert theme_manager_instance.is_dark_theme is False
 
-@patch('platform.system')
-def test_detect_system_theme_windows(mock_system, theme_manager_instance):
+@patch('utils.theme_manager._SYSTEM', 'windows')
+def test_detect_system_theme_windows(theme_manager_instance):
     """Testa a detecção de tema no Windows."""
-    mock_system.return_value = 'Windows'
     
     # Testa com tema escuro
     with patch('winreg.OpenKey') as mock_open_key, \
@@ -126,15 +189,15 @@ def test_detect_system_theme_windows(mock_system, theme_manager_instance):
         assert theme_manager_instance._is_system_dark_theme() is True
         mock_open_key.assert_called_once()
     
+    theme_manager_instance.invalidate_system_theme_cache()
     # Testa com tema claro
     with patch('winreg.OpenKey') as mock_open_key, \
          patch('winreg.QueryValueEx', return_value=(1, 1)) as mock_query_value:
         assert theme_manager_instance._is_system_dark_theme() is False
 
-@patch('platform.system')
-def test_detect_system_theme_macos(mock_system, theme_manager_instance):
+@patch('utils.theme_manager._SYSTEM', 'darwin')
+def test_detect_system_theme_macos(theme_manager_instance):
     """Testa a detecção de tema no macOS."""
-    mock_system.return_value = 'Darwin'
     
     # Mock para o Foundation
     mock_nsuserdefaults = MagicMock()
@@ -144,13 +207,15 @@ def test_detect_system_theme_macos(mock_system, theme_manager_instance):
         assert theme_manager_instance._is_system_dark_theme() is True
     
     mock_nsuserdefaults.stringForKey_.return_value = 'Light'
+    theme_manager_instance.invalidate_system_theme_cache()
     with patch.dict('sys.modules', {'Foundation': MagicMock(NSUserDefaults=MagicMock(return_value=mock_nsuserdefaults))}):
         assert theme_manager_instance._is_system_dark_theme() is False
 
-@patch('platform.system')
-def test_detect_system_theme_linux(mock_system, theme_manager_instance):
+@patch('utils.theme_manager._SYSTEM', 'linux')
+@patch('utils.theme_manager._GSETTINGS_PATH', '/usr/bin/gsettings')
+@patch.dict(os.environ, {'XDG_CURRENT_DESKTOP': 'GNOME'})
+def test_detect_system_theme_linux(theme_manager_instance):
     """Testa a detecção de tema no Linux."""
-    mock_system.return_value = 'Linux'
     
     # Testa com tema GNOME
     with patch('subprocess.run') as mock_run:
@@ -159,15 +224,75 @@ def test_detect_system_theme_linux(mock_system, theme_manager_instance):
         assert theme_manager_instance._is_system_dark_theme() is True
     
     # Testa com tema claro
+    theme_manager_instance.invalidate_system_theme_cache()
     with patch('subprocess.run') as mock_run:
         mock_run.return_value.returncode = 0
         mock_run.return_value.stdout = "'Adwaita-light'"
         assert theme_manager_instance._is_system_dark_theme() is False
     
     # Testa com falha no subprocesso (cai para o padrão)
+    theme_manager_instance.invalidate_system_theme_cache()
     with patch('subprocess.run', side_effect=FileNotFoundError):
         assert theme_manager_instance._is_system_dark_theme() is False
 
+@patch('utils.theme_manager._SYSTEM', 'linux')
+@patch.dict(os.environ, {'XDG_CURRENT_DESKTOP': 'GNOME'})
+def test_detect_system_theme_kde(theme_manager_instance, tmp_path):
+    """Testa a detecção do esquema de cores do KDE via kdeglobals."""
+    kde_globals = tmp_path / '.config' / 'kdeglobals'
+    kde_globals.parent.mkdir()
+    kde_globals.write_text('[General]\nColorScheme=BreezeDark\n\n[KDE]\nSingleClick=false\n')
+    
+    with patch('subprocess.run', side_effect=FileNotFoundError), \
+         patch('utils.theme_manager.Path.home', return_value=tmp_path):
+        theme_manager_instance.invalidate_system_theme_cache()
+        assert theme_manager_instance._is_system_dark_theme() is True
+        
+        kde_globals.write_text('[General]\nColorScheme=BreezeLight\n')
+        theme_manager_instance.invalidate_system_theme_cache()
+        assert theme_manager_instance._is_system_dark_theme() is False
+
+@patch('utils.theme_manager._SYSTEM', 'linux')
+@patch.dict(os.environ, {'XDG_CURRENT_DESKTOP': 'KDE'})
+def test_detect_system_theme_kde_desktop_skips_gsettings(theme_manager_instance, tmp_path):
+    """Testa que no KDE o kdeglobals é lido sem executar o gsettings."""
+    kde_globals = tmp_path / '.config' / 'kdeglobals'
+    kde_globals.parent.mkdir()
+    kde_globals.write_text('[General]\nColorScheme=BreezeDark\n')
+    
+    with patch('subprocess.run') as mock_run, \
+         patch('utils.theme_manager.Path.home', return_value=tmp_path):
+        theme_manager_instance.invalidate_system_theme_cache()
+        assert theme_manager_instance._is_system_dark_theme() is True
+    mock_run.assert_not_called()
+
+@patch('utils.theme_manager._SYSTEM', 'linux')
+@patch('utils.theme_manager._GSETTINGS_PATH', None)
+@patch.dict(os.environ, {'XDG_CURRENT_DESKTOP': 'GNOME'})
+def test_detect_system_theme_without_gsettings(theme_manager_instance, tmp_path):
+    """Testa que sem o gsettings instalado nenhum processo é executado."""
+    with patch('subprocess.run') as mock_run, \
+         patch('utils.theme_manager.Path.home', return_value=tmp_path):
+        theme_manager_instance.invalidate_system_theme_cache()
+        assert theme_manager_instance._is_system_dark_theme() is False
+    mock_run.assert_not_called()
+
+@patch('utils.theme_manager._SYSTEM', 'linux')
+@patch('utils.theme_manager._GSETTINGS_PATH', '/usr/bin/gsettings')
+@patch.dict(os.environ, {'XDG_CURRENT_DESKTOP': 'GNOME'})
+def test_is_system_dark_theme_cached(theme_manager_instance):
+    """Testa que leituras seguidas reaproveitam a detecção do tema do sistema."""
+    theme_manager_instance._current_theme = 'system'
+    theme_manager_instance.invalidate_system_theme_cache()
+    
+    with patch('subprocess.run') as mock_run:
+        mock_run.return_value.returncode = 0
+        mock_run.return_value.stdout = "'Adwaita-dark'"
+        assert theme_manager_instance.is_dark_theme is True
+        assert theme_manager_instance.is_dark_theme is True
+    
+    mock_run.assert_called_once()
+
 def test_theme_change_notification(theme_manager_instance, mock_settings):
     """Testa a notificação de mudança de tema."""
     # Função de callback mock
@@ -1,11 +1,72 @@
-from PyQt5.QtWidgets import QPushButton, QVBoxLayout, QLabel, QWidget
-from PyQt5.QtCore import Qt, QPropertyAnimation, QEasingCurve, pyqtProperty, pyqtSignal
-from PyQt5.QtGui import QPixmap
+from PyQt5.QtWidgets import QGraphicsEffect, QPushButton, QVBoxLayout, QLabel, QWidget
+from PyQt5.QtCore import (Qt, QAbstractAnimation, QCoreApplication, QEasingCurve,
+                          QRectF, QVariantAnimation, pyqtProperty, pyqtSignal)
+from PyQt5.QtGui import QImage, QPainter, QPixmap, QPixmapCache
 from launcher.image_cache import baixar_imagem
 import logging
 
 logger = logging.getLogger(__name__)
 
+def game_field(jogo, attr, key, default=None):
+    """Lê um campo de um ``Game`` (atributo ``attr``) ou de um dicionário
+    no formato antigo (chave ``key``), sem precisar converter o jogo."""
+    value = getattr(jogo, attr, None)
+    if value is None and isinstance(jogo, dict):
+        value = jogo.get(key)
+    return default if value is None else value
+
+
+# Placeholder transparente exibido enquanto a capa carrega. Criado uma vez e
+# compartilhado (QPixmap é implicitamente compartilhado: setPixmap não copia)
+_PLACEHOLDER = None
+
+
+def _placeholder() -> QPixmap:
+    """Retorna o placeholder das capas, criando-o na primeira chamada."""
+    global _PLACEHOLDER
+    if _PLACEHOLDER is None:
+        _PLACEHOLDER = QPixmap(*GameCard.COVER_SIZE)
+        _PLACEHOLDER.fill(Qt.transparent)
+    return _PLACEHOLDER
+
+class _ScaleEffect(QGraphicsEffect):
+    """Desenha o cartão inteiro (moldura e widgets filhos) escalado em torno
+    do centro, sem alterar a geometria do widget."""
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._scale = 1.0
+    
+    def setScale(self, scale):
+        """Define o fator de escala e redesenha o cartão."""
+        self._scale = scale
+        self.updateBoundingRect()
+        self.update()
+    
+    def boundingRectFor(self, rect):
+        """Área ocupada pelo cartão escalado, que pode passar da geometria."""
+        if self._scale <= 1.0:
+            return QRectF(rect)
+        dx = rect.width() * (self._scale - 1.0) / 2
+        dy = rect.height() * (self._scale - 1.0) / 2
+        return QRectF(rect).adjusted(-dx, -dy, dx, dy)
+    
+    def draw(self, painter):
+        if self._scale == 1.0:
+            self.drawSource(painter)
+            return
+        
+        pixmap, offset = self.sourcePixmap(Qt.LogicalCoordinates)
+        center = self.sourceBoundingRect(Qt.LogicalCoordinates).center()
+        painter.save()
+        painter.setRenderHint(QPainter.SmoothPixmapTransform)
+        painter.translate(center)
+        painter.scale(self._scale, self._scale)
+        painter.translate(-center)
+        painter.drawPixmap(offset, pixmap)
+        painter.restore()
+
+
 class GameCard(QPushButton):
     """Widget de cartão de jogo para exibição na grade de jogos.
     
@@ -16,33 +77,50 @@ class GameCard(QPushButton):
     # Sinal emitido quando o cartão é clicado
     clicked_with_id = pyqtSignal(str)
     
+    # Capa decodificada no pool de E/S (QImage ou None), entregue na thread da
+    # interface pela conexão enfileirada do sinal
+    _cover_loaded = pyqtSignal(object)
+    
+    # Tamanho da área da capa
+    COVER_SIZE = (280, 320)
+    
+    # Animação de escala compartilhada por todos os cartões: só um cartão
+    # anima por vez (o que ganhou foco/hover); o anterior vai direto ao valor
+    # final em vez de manter uma segunda animação rodando
+    _animator = None
+    _animated = None
+    
     def __init__(self, jogo, parent: QWidget = None):
         """Inicializa o cartão do jogo.
         
         Args:
-            jogo: Dicionário com informações do jogo
+            jogo: O ``Game`` exibido (ou um dicionário com as chaves 'id',
+                'nome', 'fonte' e 'capa')
             parent: Widget pai, se houver
         """
         super().__init__(parent)
         self.jogo = jogo
         self._scale = 1.0
+        self._target_scale = 1.0
+        self.nome_label = None  # Criado em _setup_ui
+        # Escala visual aplicada à moldura e aos widgets filhos (ver setScale)
+        self._scale_effect = _ScaleEffect(self)
+        self.setGraphicsEffect(self._scale_effect)
         
         # Configurações iniciais
         self.setFocusPolicy(Qt.StrongFocus)
         self.setFixedSize(300, 400)
         self.setProperty('class', 'game-card')
         
-        # Configura a animação de foco
-        self.animation = QPropertyAnimation(self, b"scale")
-        self.animation.setDuration(200)
-        self.animation.setEasingCurve(QEasingCurve.OutBack)
-        
         # Layout principal
         self.layout = QVBoxLayout()
         self.layout.setContentsMargins(10, 10, 10, 10)
         self.layout.setSpacing(8)
         self.setLayout(self.layout)
         
+        # A capa pode chegar do pool de E/S logo após o início do carregamento
+        self._cover_loaded.connect(self._set_cover)
+        
         # Inicializa a interface do usuário
         self._setup_ui()
         
@@ -75,15 +153,16 @@ class GameCard(QPushButton):
         info_layout.setSpacing(4)
         
         # Nome do jogo
-        self.nome_label = QLabel(self.jogo.get('nome', 'Sem nome'))
+        self.nome_label = QLabel(game_field(self.jogo, 'name', 'nome', 'Sem nome'))
         self.nome_label.setProperty('class', 'game-card-title')
         self.nome_label.setWordWrap(True)
         self.nome_label.setAlignment(Qt.AlignCenter)
         info_layout.addWidget(self.nome_label)
         
         # Fonte/plataforma do jogo
-        if 'fonte' in self.jogo:
-            self.fonte_label = QLabel(self.jogo['fonte'])
+        fonte = game_field(self.jogo, 'platform', 'fonte')
+        if fonte:
+            self.fonte_label = QLabel(fonte)
             self.fonte_label.setProperty('class', 'game-card-platform')
             self.fonte_label.setAlignment(Qt.AlignCenter)
             info_layout.addWidget(self.fonte_label)
@@ -96,31 +175,40 @@ class GameCard(QPushButton):
 
     def _load_cover_image(self):
         """Carrega a imagem da capa do jogo de forma assíncrona."""
-        cover_url = self.jogo.get("capa")
+        cover_url = game_field(self.jogo, 'banner', 'capa')
         if not cover_url:
             self.capa.setText("Sem capa")
             return
+        
+        # Capa já exibida por outro cartão (ex.: lista recriada após
+        # refresh_games): reaproveita o pixmap sem baixar nem converter
+        self._cover_key = "{}@{}x{}".format(cover_url, *self.COVER_SIZE)
+        pixmap = QPixmapCache.find(self._cover_key)
+        if pixmap is not None and not pixmap.isNull():
+            self.capa.setPixmap(pixmap)
+            return
             
         # Define uma imagem de placeholder enquanto carrega
-        placeholder = QPixmap(280, 320)
-        placeholder.fill(Qt.transparent)
-        self.capa.setPixmap(placeholder)
-        
-        # Usa a thread de I/O para baixar a imagem
-        def on_image_loaded(pixmap):
-            if pixmap and not pixmap.isNull():
-                self.capa.setPixmap(
-                    pixmap.scaled(
-                        self.capa.size(), 
-                        Qt.KeepAspectRatio, 
-                        Qt.SmoothTransformation
-                    )
-                )
-            else:
-                self.capa.setText("Erro ao carregar")
-        
-        # Inicia o download da imagem
-        baixar_imagem(cover_url, on_image_loaded)
+        self.capa.setPixmap(_placeholder())
+        
+        # Download, decodificação e redimensionamento rodam no pool de E/S;
+        # o callback roda lá e só repassa o QImage pronto para a interface
+        def on_image_loaded(image):
+            try:
+                self._cover_loaded.emit(image)
+            except RuntimeError:
+                pass  # Cartão destruído antes do fim do download
+        
+        baixar_imagem(cover_url, on_image_loaded, size=self.COVER_SIZE)
+    
+    def _set_cover(self, image):
+        """Exibe a capa já decodificada e redimensionada (thread da interface)."""
+        if isinstance(image, QImage) and not image.isNull():
+            pixmap = QPixmap.fromImage(image)
+            QPixmapCache.insert(self._cover_key, pixmap)
+            self.capa.setPixmap(pixmap)
+        else:
+            self.capa.setText("Erro ao carregar")
     
     def enterEvent(self, event):
         """Evento quando o mouse entra no cartão."""
@@ -144,18 +232,51 @@ class GameCard(QPushButton):
         self._start_animation(1.0)
         super().focusOutEvent(event)
     
+    @classmethod
+    def _shared_animator(cls):
+        """Retorna a animação de escala compartilhada, criando-a sob demanda."""
+        if cls._animator is None:
+            animator = QVariantAnimation(QCoreApplication.instance())
+            animator.setDuration(200)
+            animator.setEasingCurve(QEasingCurve.OutBack)
+            animator.valueChanged.connect(cls._on_animation_value)
+            cls._animator = animator
+        return cls._animator
+    
+    @classmethod
+    def _on_animation_value(cls, value):
+        """Aplica o valor interpolado ao cartão animado no momento."""
+        card = cls._animated
+        if card is None:
+            return
+        try:
+            card.setScale(value)
+        except RuntimeError:
+            cls._animated = None  # Cartão destruído durante a animação
+    
     def _start_animation(self, target_scale):
         """Inicia a animação de escala do cartão."""
-        if self.animation.state() == QPropertyAnimation.Running:
-            self.animation.pause()
+        animator = self._shared_animator()
+        previous = GameCard._animated
+        if animator.state() == QAbstractAnimation.Running:
+            animator.stop()
+            if previous is not None and previous is not self:
+                try:
+                    previous.setScale(previous._target_scale)
+                except RuntimeError:
+                    pass
         
-        self.animation.setStartValue(self._scale)
-        self.animation.setEndValue(target_scale)
-        self.animation.start()
+        self._target_scale = target_scale
+        GameCard._animated = self
+        if target_scale > 1.0:
+            self.raise_()  # O cartão ampliado fica por cima dos vizinhos
+        animator.setStartValue(float(self._scale))
+        animator.setEndValue(float(target_scale))
+        animator.start()
     
     def _on_clicked(self):
         """Manipulador de clique do cartão."""
-        jogo_id = self.jogo.get('id')
+        jogo_id = game_field(self.jogo, 'id', 'id')
         if jogo_id:
             self.clicked_with_id.emit(jogo_id)
 
@@ -169,14 +290,10 @@ class GameCard(QPushButton):
             return
             
         self._scale = scale
-        self.setFixedSize(300 * scale, 400 * scale)
-        
-        # Atualiza o tamanho da fonte com base na escala para melhor legibilidade
-        if hasattr(self, 'nome_label'):
-            base_size = 16  # Tamanho base da fonte
-            scaled_size = max(10, int(base_size * (0.8 + 0.2 * scale)))
-            self.nome_label.setStyleSheet(f"font-size: {scaled_size}px;")
+        # A geometria continua fixa em 300x400: a escala é só visual (ver
+        # _ScaleEffect), então a grade não reposiciona os vizinhos a cada quadro.
+        # O título cresce junto com o restante do cartão
+        self._scale_effect.setScale(scale)
     
     # Define a propriedade scale para animação
     scale = pyqtProperty(float, getScale, setScale)
-    scale = pyqtProperty(float, getScale, setScale)
@@ -1,25 +1,28 @@
 from PyQt5.QtWidgets import QWidget, QVBoxLayout, QLabel, QPushButton
 from PyQt5.QtCore import Qt
 from launcher.game_launcher import iniciar_jogo
+from ui.game_card import game_field
 
 class GameDetailView(QWidget):
     def __init__(self, jogo, voltar_callback):
         super().__init__()
-        self.jogo = jogo
+        self.jogo = None
         self.voltar = voltar_callback
         self.setLayout(QVBoxLayout())
         self.setStyleSheet("background-color:#111; color:white;")
         self._setup_ui()
+        if jogo is not None:
+            self.update_game(jogo)
 
     def _setup_ui(self):
-        titulo = QLabel(self.jogo['nome'])
-        titulo.setAlignment(Qt.AlignCenter)
-        titulo.setStyleSheet("font-size:36px;")
-        self.layout().addWidget(titulo)
-        desc = QLabel(self.jogo.get('descricao', 'Sem descrição disponível.'))
-        desc.setWordWrap(True)
-        desc.setStyleSheet("font-size:18px; padding:20px;")
-        self.layout().addWidget(desc)
+        self.titulo = QLabel()
+        self.titulo.setAlignment(Qt.AlignCenter)
+        self.titulo.setStyleSheet("font-size:36px;")
+        self.layout().addWidget(self.titulo)
+        self.desc = QLabel()
+        self.desc.setWordWrap(True)
+        self.desc.setStyleSheet("font-size:18px; padding:20px;")
+        self.layout().addWidget(self.desc)
         btn_jogar = QPushButton("Jogar")
         btn_jogar.setFixedSize(200,60)
         btn_jogar.clicked.connect(self._jogar)
@@ -29,5 +32,12 @@ class GameDetailView(QWidget):
         btn_voltar.clicked.connect(self.voltar)
         self.layout().addWidget(btn_voltar, alignment=Qt.AlignCenter)
 
+    def update_game(self, jogo):
+        """Exibe outro jogo reaproveitando os widgets já criados."""
+        self.jogo = jogo
+        self.titulo.setText(game_field(jogo, 'name', 'nome', 'Sem nome'))
+        self.desc.setText(game_field(jogo, 'description', 'descricao', 'Sem descrição disponível.'))
+
     def _jogar(self):
-        iniciar_jogo(self.jogo.get("executavel"))
+        if self.jogo is not None:
+            iniciar_jogo(game_field(self.jogo, 'executable', 'executavel'))
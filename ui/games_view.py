@@ -1,20 +1,76 @@
 from PyQt5.QtWidgets import (QWidget, QLabel, QVBoxLayout, QGridLayout, 
-                            QScrollArea, QMessageBox)
-from PyQt5.QtCore import Qt, QTimer
+                            QScrollArea, QMessageBox, QStackedWidget)
+from PyQt5.QtCore import Qt, QObject, QThread, QTimer, pyqtSignal
 from ui.game_card import GameCard
 from ui.game_detail_view import GameDetailView
 from launcher.input_handler import GamepadListener
 from launcher.game_manager import game_manager
+from launcher.image_cache import prefetch_images
 import logging
 
 logger = logging.getLogger(__name__)
 
+
+class _InitWorker(QObject):
+    """Inicializa o gerenciador de jogos em uma QThread.
+    
+    A descoberta de plataformas e a varredura de jogos fazem E/S de disco;
+    rodando aqui, a thread da interface continua livre durante a carga.
+    """
+    
+    # Lista de jogos carregada
+    ready = pyqtSignal(object)
+    # Mensagem de erro
+    failed = pyqtSignal(str)
+    
+    def __init__(self, manager):
+        super().__init__()
+        self._manager = manager
+    
+    def run(self):
+        try:
+            if not self._manager.initialize():
+                raise Exception("Falha ao inicializar o gerenciador de jogos")
+            self.ready.emit(self._manager.get_games())
+        except Exception as e:
+            logger.error(f"Erro ao carregar jogos: {e}", exc_info=True)
+            self.failed.emit(str(e))
+
+
 class GamesView(QWidget):
+    # Linhas de cards criadas na primeira exibição e a cada vez que a rolagem
+    # (ou a navegação) se aproxima do fim da grade
+    INITIAL_ROWS = 4
+    BATCH_ROWS = 3
+    
+    # Janela (ms) em que atualizações seguidas da lista viram uma só reconstrução
+    REBUILD_DELAY_MS = 150
+    
+    # Repassa à thread da interface as atualizações da lista de jogos, que
+    # podem ser notificadas pelo gerenciador a partir de outra thread
+    _games_changed = pyqtSignal(object)
+    
     def __init__(self):
         super().__init__()
         self.setStyleSheet("background-color:#111;")
         self.setLayout(QVBoxLayout())
         self.cards = []
+        self._games = []
+        self._game_by_id = {}
+        self._pending_games = None
+        
+        # Reconstrução adiada da grade (ver _on_games_updated)
+        self._rebuild_timer = QTimer(self)
+        self._rebuild_timer.setSingleShot(True)
+        self._rebuild_timer.timeout.connect(self._do_rebuild)
+        self._games_changed.connect(self._on_games_updated)
+        
+        # Foco adiado: uma sequência rápida de movimentos (direcional
+        # pressionado) aplica foco e rolagem uma única vez no fim
+        self._focus_timer = QTimer(self)
+        self._focus_timer.setSingleShot(True)
+        self._focus_timer.setInterval(0)
+        self._focus_timer.timeout.connect(self._apply_focus)
         self.indice = 0
         self.cols = 3
         
@@ -43,7 +99,15 @@ class GamesView(QWidget):
         self.container.setLayout(self.grid)
         self.sa.setWidgetResizable(True)
         self.sa.setWidget(self.container)
-        self.layout().addWidget(self.sa)
+        self.sa.verticalScrollBar().valueChanged.connect(self._on_scroll)
+        
+        # Grade e detalhes são páginas de uma pilha: abrir e fechar os
+        # detalhes só troca a página, sem recriar a visualização
+        self.stack = QStackedWidget()
+        self.stack.addWidget(self.sa)
+        self.detail_view = GameDetailView(None, self._back_to_grid)
+        self.stack.addWidget(self.detail_view)
+        self.layout().addWidget(self.stack)
 
     def _init_game_loading(self):
         """Inicializa o carregamento dos jogos de forma assíncrona."""
@@ -54,46 +118,76 @@ class GamesView(QWidget):
         self.layout().addWidget(self.loading_label)
         
         # Inicializa o gerenciador de jogos em uma thread separada
-        QTimer.singleShot(100, self._initialize_game_manager)
+        self._init_thread = QThread(self)
+        self._init_worker = _InitWorker(self.game_manager)
+        self._init_worker.moveToThread(self._init_thread)
+        self._init_thread.started.connect(self._init_worker.run)
+        self._init_worker.ready.connect(self._on_manager_ready)
+        self._init_worker.failed.connect(self._on_manager_failed)
+        self._init_worker.ready.connect(self._init_thread.quit)
+        self._init_worker.failed.connect(self._init_thread.quit)
+        self._init_thread.finished.connect(self._init_worker.deleteLater)
+        self._init_thread.start()
     
-    def _initialize_game_manager(self):
-        """Inicializa o gerenciador de jogos e carrega os jogos."""
-        try:
-            # Inicializa o gerenciador de jogos
-            if not self.game_manager.initialize():
-                raise Exception("Falha ao inicializar o gerenciador de jogos")
-            
-            # Registra o callback para atualizações da lista de jogos
-            self.game_manager.add_game_list_updated_callback(self._on_games_updated)
-            
-            # Força uma atualização inicial dos jogos
-            self.game_manager.refresh_games()
-            
-        except Exception as e:
-            logger.error(f"Erro ao carregar jogos: {e}", exc_info=True)
-            QMessageBox.critical(
-                self, 
-                "Erro", 
-                f"Não foi possível carregar os jogos: {str(e)}"
-            )
-            # Remove a mensagem de carregamento em caso de erro
-            if hasattr(self, 'loading_label'):
-                self.loading_label.deleteLater()
+    def _on_manager_ready(self, games):
+        """Recebe a primeira lista de jogos carregada em segundo plano."""
+        # Registra o callback para atualizações posteriores da lista de jogos
+        self.game_manager.add_game_list_updated_callback(self._games_changed.emit)
+        self._on_games_updated(games)
+    
+    def _on_manager_failed(self, message):
+        """Exibe o erro da inicialização em segundo plano."""
+        QMessageBox.critical(
+            self, 
+            "Erro", 
+            f"Não foi possível carregar os jogos: {message}"
+        )
+        # Remove a mensagem de carregamento em caso de erro
+        if hasattr(self, 'loading_label'):
+            self.loading_label.deleteLater()
+            del self.loading_label
     
     def _on_games_updated(self, games):
-        """Callback chamado quando a lista de jogos é atualizada."""
+        """Callback chamado quando a lista de jogos é atualizada.
+        
+        Apenas guarda a lista mais recente e (re)inicia o timer: uma rajada de
+        atualizações (refresh_games seguido das fontes individuais) resulta em
+        uma única reconstrução da grade.
+        """
+        self._pending_games = games
+        self._rebuild_timer.start(self.REBUILD_DELAY_MS)
+    
+    def _do_rebuild(self):
+        """Reconstrói a grade com a última lista de jogos recebida."""
+        games, self._pending_games = self._pending_games, None
+        if games is None:
+            return
         try:
             # Remove a mensagem de carregamento se existir
             if hasattr(self, 'loading_label'):
                 self.loading_label.deleteLater()
                 del self.loading_label
             
-            # Limpa os cards existentes
-            self._clear_games()
-            
-            # Adiciona os novos jogos
-            for idx, game in enumerate(games):
-                self._add_game_card(game, idx)
+            # Reconstrói a grade com pintura e sinais suspensos: o Qt faz um
+            # único passe de layout no final em vez de um por card adicionado
+            self.container.setUpdatesEnabled(False)
+            self.grid.blockSignals(True)
+            try:
+                # Limpa os cards existentes
+                self._clear_games()
+                
+                # Cria apenas as primeiras linhas; as demais surgem sob demanda
+                self._games = list(games)
+                self._game_by_id = {g.id: g for g in self._games}
+                
+                # Baixa para o cache em disco, em paralelo no pool de E/S, as
+                # capas que faltam; os cartões criados depois só decodificam
+                prefetch_images(g.banner for g in self._games)
+                self._materialize(self.INITIAL_ROWS * self.cols)
+            finally:
+                self.grid.blockSignals(False)
+                self.container.setUpdatesEnabled(True)
+                self.container.updateGeometry()
             
             # Define o foco no primeiro jogo, se houver jogos
             if self.cards:
@@ -102,6 +196,23 @@ class GamesView(QWidget):
         except Exception as e:
             logger.error(f"Erro ao atualizar a lista de jogos: {e}", exc_info=True)
     
+    def _materialize(self, count):
+        """Cria os cards pendentes até que existam ``count`` cards na grade."""
+        for idx in range(len(self.cards), min(count, len(self._games))):
+            self._add_game_card(self._games[idx], idx)
+    
+    def _on_scroll(self, value):
+        """Cria mais uma leva de cards quando a rolagem chega perto do fim."""
+        if len(self.cards) >= len(self._games):
+            return
+        bar = self.sa.verticalScrollBar()
+        if value >= bar.maximum() - bar.pageStep() // 2:
+            self.container.setUpdatesEnabled(False)
+            try:
+                self._materialize(len(self.cards) + self.BATCH_ROWS * self.cols)
+            finally:
+                self.container.setUpdatesEnabled(True)
+    
     def _clear_games(self):
         """Remove todos os cards de jogos da interface."""
         for card in self.cards:
@@ -112,25 +223,13 @@ class GamesView(QWidget):
     def _add_game_card(self, game, index):
         """Adiciona um card de jogo à grade."""
         try:
-            # Converte o jogo para o formato esperado pelo GameCard
-            jogo = {
-                'id': game.id,
-                'name': game.name,
-                'platform': game.platform,
-                'banner': game.banner,
-                'icon': game.icon,
-                'playtime': game.playtime,
-                'last_played': game.last_played
-            }
-            
-            # Cria o card do jogo
-            card = GameCard(jogo)
-            card.clicked.connect(lambda _, c=card, g=game: self._open_detail(g, c))
+            # Cria o card do jogo (lê os campos direto do Game, sem cópia)
+            card = GameCard(game)
+            card.clicked_with_id.connect(self._on_card_activated)
             
             # Adiciona o card à grade
+            row, col = divmod(index, self.cols)
             self.cards.append(card)
-            row = len(self.cards) // self.cols
-            col = len(self.cards) % self.cols
             self.grid.addWidget(card, row, col)
             
         except Exception as e:
@@ -158,36 +257,40 @@ class GamesView(QWidget):
 
     def _move(self, delta):
         new = self.indice + delta
-        if 0 <= new < len(self.cards):
-            self._set_focus(new)
+        if 0 <= new < len(self._games):
+            if new >= len(self.cards):
+                # Navegação além dos cards já criados: cria a próxima leva
+                self._materialize(new + 1 + self.BATCH_ROWS * self.cols)
+            if new < len(self.cards):
+                self._set_focus(new)
 
     def _set_focus(self, i):
         if self.cards:
-            self.cards[self.indice].clearFocus()
             self.indice = i
-            self.cards[self.indice].setFocus()
-            self.cards[self.indice].ensureVisible()
+            self._focus_timer.start()
+    
+    def _apply_focus(self):
+        """Foca o card atual e rola a grade até ele."""
+        if 0 <= self.indice < len(self.cards):
+            card = self.cards[self.indice]
+            card.setFocus()
+            self.sa.ensureWidgetVisible(card)
 
+    def _on_card_activated(self, game_id):
+        """Abre os detalhes do jogo cujo card foi ativado."""
+        game = self._game_by_id.get(game_id)
+        if game is not None:
+            self._open_detail(game, self.sender())
+    
     def _open_detail(self, jogo, card):
         """Abre a visualização detalhada de um jogo."""
         try:
-            # Converte o jogo para o formato esperado pelo GameDetailView
-            jogo_dict = {
-                'id': jogo.id,
-                'name': jogo.name,
-                'platform': jogo.platform,
-                'banner': jogo.banner,
-                'icon': jogo.icon,
-                'playtime': jogo.playtime,
-                'last_played': jogo.last_played,
-                'metadata': jogo.metadata or {}
-            }
-            
-            # Cria e exibe a visualização detalhada
-            dv = GameDetailView(jogo_dict, lambda: self._back_to_grid())
-            self.layout().addWidget(dv)
-            dv.setFocus()
-            card.clearFocus()
+            # Atualiza e exibe a visualização detalhada
+            self.detail_view.update_game(jogo)
+            self.stack.setCurrentWidget(self.detail_view)
+            self.detail_view.setFocus()
+            if card is not None:
+                card.clearFocus()
             
         except Exception as e:
             logger.error(f"Erro ao abrir detalhes do jogo: {e}", exc_info=True)
@@ -198,6 +301,5 @@ class GamesView(QWidget):
             )
 
     def _back_to_grid(self):
-        w = self.layout().itemAt(1).widget()
-        w.deleteLater()
+        self.stack.setCurrentWidget(self.sa)
         self._set_focus(self.indice)
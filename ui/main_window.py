@@ -9,12 +9,11 @@ import logging
 from pathlib import Path
 from typing import Optional
 
-from PyQt5.QtWidgets import QMainWindow, QStackedWidget, QMessageBox, QWidget
+from PyQt5.QtWidgets import QApplication, QMainWindow, QShortcut, QStackedWidget
 from PyQt5.QtCore import Qt, QSize
-from PyQt5.QtGui import QIcon
+from PyQt5.QtGui import QIcon, QKeySequence
 
 from ui.games_view import GamesView
-from ui.settings_view import SettingsView  # Será implementado posteriormente
 from config import settings
 
 logger = logging.getLogger(__name__)
@@ -47,11 +46,9 @@ class MainWindow(QMainWindow):
         # Aplica o tema
         self._apply_theme()
         
-        # Configura a janela
+        # Configura a janela (o gerenciador de jogos é inicializado em
+        # segundo plano pela GamesView)
         self._setup_window()
-        
-        # Inicializa o gerenciador de jogos
-        self._init_game_manager()
     
     def _init_ui(self) -> None:
         """Inicializa os componentes da interface do usuário."""
@@ -63,15 +60,33 @@ class MainWindow(QMainWindow):
         self.central_widget = QStackedWidget()
         self.setCentralWidget(self.central_widget)
         
-        # Adiciona as visualizações
+        # Adiciona as visualizações; a de configurações só é criada (e
+        # estilizada) na primeira vez em que for exibida
         self.games_view = GamesView()
-        self.settings_view = SettingsView()  # Será implementado posteriormente
+        self.settings_view = None
         
         self.central_widget.addWidget(self.games_view)
-        self.central_widget.addWidget(self.settings_view)
         
         # Navega para a visualização de jogos por padrão
         self.central_widget.setCurrentWidget(self.games_view)
+        
+        # Ctrl+, abre as configurações; Esc volta aos jogos (ver show_settings)
+        QShortcut(QKeySequence("Ctrl+,"), self, activated=self.show_settings)
+    
+    def show_settings(self) -> None:
+        """Exibe a visualização de configurações, criando-a no primeiro uso."""
+        if self.settings_view is None:
+            from ui.settings_view import SettingsView
+            self.settings_view = SettingsView()
+            self.central_widget.addWidget(self.settings_view)
+            # Só vale dentro das configurações: na grade de jogos o Esc é livre
+            QShortcut(QKeySequence(Qt.Key_Escape), self.settings_view,
+                      activated=self.show_games, context=Qt.WidgetWithChildrenShortcut)
+        self.central_widget.setCurrentWidget(self.settings_view)
+    
+    def show_games(self) -> None:
+        """Volta para a visualização de jogos."""
+        self.central_widget.setCurrentWidget(self.games_view)
     
     def _setup_window(self) -> None:
         """Configura as propriedades da janela."""
@@ -102,45 +117,12 @@ class MainWindow(QMainWindow):
             logger.warning(f"Tema '{theme_name}' não encontrado. Usando tema padrão.")
             theme_name = 'dark'
         
-        # Aplica o tema usando o ThemeManager
+        # Aplica o tema uma única vez no nível do aplicativo: o Qt propaga a
+        # folha de estilo a todos os widgets, sem reanalisá-la por widget
         theme_manager.load_theme(theme_name)
-        theme_manager.apply_theme(self)
-        
-        # Aplica o tema a todos os widgets filhos
-        for widget in self.findChildren(QWidget):
-            if hasattr(widget, 'setStyleSheet'):
-                widget.setStyleSheet(theme_manager._style_sheet)
-        
-        # Atualiza o tema das visualizações existentes
-        if hasattr(self, 'games_view'):
-            self.games_view.setStyleSheet(theme_manager._style_sheet)
-        if hasattr(self, 'settings_view'):
-            self.settings_view.setStyleSheet(theme_manager._style_sheet)            
-        
-        # Força uma atualização da interface
-        self.update()
+        theme_manager.apply_theme(QApplication.instance() or self)
         logger.info(f"Tema '{theme_name}' aplicado com sucesso.")
     
-    def _init_game_manager(self) -> None:
-        """Inicializa o gerenciador de jogos."""
-        try:
-            from launcher.game_manager import game_manager
-            if not game_manager.initialize():
-                logger.error("Falha ao inicializar o gerenciador de jogos.")
-                QMessageBox.critical(
-                    self,
-                    "Erro de Inicialização",
-                    "Não foi possível inicializar o gerenciador de jogos.\n"
-                    "Verifique as configurações e tente novamente."
-                )
-        except Exception as e:
-            logger.critical(f"Erro crítico ao inicializar o gerenciador de jogos: {e}", exc_info=True)
-            QMessageBox.critical(
-                self,
-                "Erro Crítico",
-                f"Ocorreu um erro crítico ao inicializar o gerenciador de jogos:\n{str(e)}"
-            )
-    
     def closeEvent(self, event):
         """Evento chamado quando a janela está prestes a ser fechada."""
         # Limpa recursos antes de fechar
@@ -5,6 +5,7 @@ Este módulo define a interface do usuário para as configurações do aplicativ
 permitindo que os usuários personalizem a aparência e o comportamento do launcher.
 """
 
+import os
 import logging
 from pathlib import Path
 from typing import Dict, Any, Optional
@@ -13,13 +14,40 @@ from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QLabel, QPushButton, QComboBox, 
     QFormLayout, QCheckBox, QSpinBox, QFileDialog, QMessageBox
 )
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QTimer
 
 from config import settings
 from utils.theme_manager import theme_manager
 
 logger = logging.getLogger(__name__)
 
+# Temas na ordem das opções do combo de tema (e o inverso)
+_INDEX_TO_THEME = ('dark', 'light', 'system')
+_THEME_TO_INDEX = {theme: index for index, theme in enumerate(_INDEX_TO_THEME)}
+
+# Opções do seletor de diretório de instalação. Nunca incluir
+# DontUseNativeDialog: o diálogo próprio do Qt lista a pasta inteira na
+# thread da interface e trava em diretórios com muitas entradas
+_DIR_DIALOG_OPTIONS = (
+    QFileDialog.ShowDirsOnly
+    | QFileDialog.DontResolveSymlinks
+    | QFileDialog.DontUseCustomDirectoryIcons
+)
+
+def _setup_font_size_spin(spin: QSpinBox) -> None:
+    """Configura o intervalo e o sufixo do campo de tamanho da fonte."""
+    spin.setRange(8, 24)
+    spin.setSuffix(" px")
+
+# Campos do formulário, na ordem de exibição:
+# (rótulo, fábrica do widget, sinal de alteração, atributo, configuração extra)
+_FIELDS = (
+    ("Tema:", QComboBox, 'currentIndexChanged', 'theme_combo',
+     lambda combo: combo.addItems(["Escuro", "Claro", "Sistema"])),
+    ("", lambda: QCheckBox("Iniciar em tela cheia"), 'stateChanged', 'fullscreen_check', None),
+    ("Tamanho da fonte:", QSpinBox, 'valueChanged', 'font_size_spin', _setup_font_size_spin),
+)
+
 class SettingsView(QWidget):
     """Visualização de configurações do NIX Launcher."""
     
@@ -34,6 +62,24 @@ class SettingsView(QWidget):
         # Configurações iniciais
         self.settings_changed = False
         self.original_settings: Dict[str, Any] = {}
+        self._install_dir_dialog: Optional[QFileDialog] = None  # Criado no primeiro uso
+        
+        # Layout principal; os controles só são criados na primeira exibição
+        self.layout = QVBoxLayout(self)
+        self.layout.setContentsMargins(20, 20, 20, 20)
+        self.layout.setSpacing(15)
+        self._ui_built = False
+    
+    def showEvent(self, event) -> None:
+        """Monta os controles e carrega as configurações na primeira exibição."""
+        self._ensure_ui_built()
+        super().showEvent(event)
+    
+    def _ensure_ui_built(self) -> None:
+        """Cria os controles e carrega as configurações, uma única vez."""
+        if self._ui_built:
+            return
+        self._ui_built = True
         
         # Inicializa a interface do usuário
         self._init_ui()
@@ -43,10 +89,12 @@ class SettingsView(QWidget):
     
     def _init_ui(self) -> None:
         """Inicializa os componentes da interface do usuário."""
-        # Layout principal
-        self.layout = QVBoxLayout(self)
-        self.layout.setContentsMargins(20, 20, 20, 20)
-        self.layout.setSpacing(15)
+        # Marca a alteração de forma adiada: arrastar o SpinBox dispara um
+        # valueChanged por passo, mas o botão só é atualizado uma vez
+        self._changed_timer = QTimer(self)
+        self._changed_timer.setSingleShot(True)
+        self._changed_timer.setInterval(50)
+        self._changed_timer.timeout.connect(self._mark_changed)
         
         # Título
         title = QLabel("Configurações")
@@ -58,23 +106,14 @@ class SettingsView(QWidget):
         self.form_layout.setHorizontalSpacing(20)
         self.form_layout.setVerticalSpacing(10)
         
-        # Tema
-        self.theme_combo = QComboBox()
-        self.theme_combo.addItems(["Escuro", "Claro", "Sistema"])
-        self.theme_combo.currentIndexChanged.connect(self._on_setting_changed)
-        self.form_layout.addRow("Tema:", self.theme_combo)
-        
-        # Modo tela cheia
-        self.fullscreen_check = QCheckBox("Iniciar em tela cheia")
-        self.fullscreen_check.stateChanged.connect(self._on_setting_changed)
-        self.form_layout.addRow("", self.fullscreen_check)
-        
-        # Tamanho da fonte
-        self.font_size_spin = QSpinBox()
-        self.font_size_spin.setRange(8, 24)
-        self.font_size_spin.setSuffix(" px")
-        self.font_size_spin.valueChanged.connect(self._on_setting_changed)
-        self.form_layout.addRow("Tamanho da fonte:", self.font_size_spin)
+        # Campos simples: cada alteração marca as configurações como alteradas
+        for label, factory, signal, attr, setup in _FIELDS:
+            widget = factory()
+            if setup is not None:
+                setup(widget)
+            getattr(widget, signal).connect(self._on_setting_changed)
+            setattr(self, attr, widget)
+            self.form_layout.addRow(label, widget)
         
         # Diretório de instalação padrão
         self.install_dir_btn = QPushButton("Selecionar diretório...")
@@ -121,13 +160,13 @@ class SettingsView(QWidget):
             }
             
             # Aplica as configurações aos controles
-            theme_map = {'dark': 0, 'light': 1, 'system': 2}
-            self.theme_combo.setCurrentIndex(theme_map.get(self.original_settings['theme'], 0))
+            self.theme_combo.setCurrentIndex(_THEME_TO_INDEX.get(self.original_settings['theme'], 0))
             self.fullscreen_check.setChecked(self.original_settings['fullscreen'])
             self.font_size_spin.setValue(self.original_settings['font_size'])
             self.install_dir_label.setText(self.original_settings['install_dir'])
             
-            # Reseta a flag de alteração
+            # Reseta a flag de alteração (descartando a marcação pendente)
+            self._changed_timer.stop()
             self.settings_changed = False
             self.save_btn.setEnabled(False)
             
@@ -141,18 +180,34 @@ class SettingsView(QWidget):
     
     def _on_setting_changed(self, _=None) -> None:
         """Método chamado quando uma configuração é alterada."""
+        if not self.settings_changed:
+            self._changed_timer.start()
+    
+    def _mark_changed(self) -> None:
+        """Marca as configurações como alteradas e habilita o botão de salvar."""
         self.settings_changed = True
         self.save_btn.setEnabled(True)
     
     def _select_install_dir(self) -> None:
         """Abre um diálogo para selecionar o diretório de instalação."""
         current_dir = self.install_dir_label.text() or str(Path.home())
-        dir_path = QFileDialog.getExistingDirectory(
-            self,
-            "Selecionar diretório de instalação",
-            current_dir,
-            QFileDialog.ShowDirsOnly | QFileDialog.DontResolveSymlinks
-        )
+        
+        # O diálogo é criado uma vez e reaproveitado nas próximas aberturas
+        dialog = self._install_dir_dialog
+        if dialog is None:
+            # No GNOME o diálogo nativo (portal) se comporta melhor sem pai
+            desktop = os.environ.get('XDG_CURRENT_DESKTOP', '').upper()
+            parent = None if 'GNOME' in desktop else self
+            dialog = QFileDialog(parent, "Selecionar diretório de instalação")
+            dialog.setFileMode(QFileDialog.Directory)
+            dialog.setOptions(_DIR_DIALOG_OPTIONS)
+            self._install_dir_dialog = dialog
+        dialog.setDirectory(current_dir)
+        
+        if not dialog.exec_():
+            return
+        selected = dialog.selectedFiles()
+        dir_path = selected[0] if selected else ''
         
         if dir_path:
             self.install_dir_label.setText(dir_path)
@@ -162,23 +217,28 @@ class SettingsView(QWidget):
         """Salva as configurações alteradas."""
         try:
             # Mapeia o índice do tema para o valor correspondente
-            theme_map = {0: 'dark', 1: 'light', 2: 'system'}
-            
-            # Atualiza as configurações
-            settings.set('ui.theme', theme_map.get(self.theme_combo.currentIndex(), 'dark'))
-            settings.set('ui.fullscreen', self.fullscreen_check.isChecked())
-            settings.set('ui.font_size', self.font_size_spin.value())
-            settings.set('game.default_install_dir', self.install_dir_label.text())
+            index = self.theme_combo.currentIndex()
+            theme = _INDEX_TO_THEME[index] if 0 <= index < len(_INDEX_TO_THEME) else 'dark'
             
-            # Atualiza as configurações originais
-            self.original_settings = {
-                'theme': settings.get('ui.theme'),
-                'fullscreen': settings.get('ui.fullscreen'),
-                'font_size': settings.get('ui.font_size'),
-                'install_dir': settings.get('game.default_install_dir')
+            new_settings = {
+                'theme': theme,
+                'fullscreen': self.fullscreen_check.isChecked(),
+                'font_size': self.font_size_spin.value(),
+                'install_dir': self.install_dir_label.text()
             }
             
+            # Atualiza as configurações com uma única gravação e notificação
+            with settings.transaction():
+                settings.set('ui.theme', new_settings['theme'])
+                settings.set('ui.fullscreen', new_settings['fullscreen'])
+                settings.set('ui.font_size', new_settings['font_size'])
+                settings.set('game.default_install_dir', new_settings['install_dir'])
+            
+            # Os valores recém-gravados passam a ser os originais
+            self.original_settings = new_settings
+            
             # Desabilita o botão de salvar
+            self._changed_timer.stop()
             self.settings_changed = False
             self.save_btn.setEnabled(False)
             
@@ -200,8 +260,6 @@ class SettingsView(QWidget):
     def _restore_defaults(self) -> None:
         """Restaura as configurações padrão."""
         try:
-            from config.settings import DEFAULT_SETTINGS
-            
             # Pede confirmação ao usuário
             reply = QMessageBox.question(
                 self,
@@ -214,7 +272,7 @@ class SettingsView(QWidget):
             
             if reply == QMessageBox.Yes:
                 # Restaura as configurações padrão
-                settings.clear()
+                settings.reset_to_defaults()
                 
                 # Recarrega as configurações
                 self._load_settings()
@@ -1,4 +1,4 @@
-""
+"""
 Pacote de estilos para o NIX Launcher.
 
 Este pacote contém os arquivos de estilo QSS usados para estilizar a interface do usuário.
@@ -6,17 +6,13 @@ Este pacote contém os arquivos de estilo QSS usados para estilizar a interface
 
 from pathlib import Path
 
-# Caminho para o diretório de estilos
+# Caminho para o diretório de estilos (calculado uma única vez, na importação)
 STYLES_DIR = Path(__file__).parent
 
-# Caminhos para os arquivos de tema
-try:
-    DARK_THEME = (STYLES_DIR / 'dark.qss').resolve()
-    LIGHT_THEME = (STYLES_DIR / 'light.qss').resolve()
-    SYSTEM_THEME = (STYLES_DIR / 'system.qss').resolve()
-except Exception as e:
-    import logging
-    logging.error(f"Erro ao carregar temas: {e}")
-    DARK_THEME = LIGHT_THEME = SYSTEM_THEME = None
+# Caminhos para os arquivos de tema. Sem resolve(): nenhum acesso ao disco na
+# importação; a existência só é verificada ao abrir o arquivo
+DARK_THEME = STYLES_DIR / 'dark.qss'
+LIGHT_THEME = STYLES_DIR / 'light.qss'
+SYSTEM_THEME = STYLES_DIR / 'system.qss'
 
-__all__ = ['DARK_THEME', 'LIGHT_THEME', 'SYSTEM_THEME']
+__all__ = ['STYLES_DIR', 'DARK_THEME', 'LIGHT_THEME', 'SYSTEM_THEME']
@@ -5,10 +5,69 @@ Este módulo fornece funções para configurar o logging de forma consistente
 toda a aplicação.
 """
 
+import os
 import logging
 import logging.handlers
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Union, Dict, Any
+from typing import List, Optional, Union, Dict, Any
+
+
+# Handlers criados por setup_logging; só estes são reaproveitados ou fechados
+_own_handlers: List[logging.Handler] = []
+
+
+@lru_cache(maxsize=None)
+def _formatter(log_format: str) -> logging.Formatter:
+    """Retorna um Formatter compartilhado para o formato informado."""
+    return logging.Formatter(log_format)
+
+
+def _reuse_handlers(
+    root_logger: logging.Logger,
+    log_file: Optional[Union[str, Path]],
+    console_level: int,
+    file_level: int,
+    max_bytes: int,
+    backup_count: int,
+    formatter: logging.Formatter,
+) -> bool:
+    """Reaproveita os handlers de uma chamada anterior de ``setup_logging``.
+    
+    Se os handlers criados antes são exatamente um de console e (quando
+    pedido) um RotatingFileHandler para o mesmo arquivo, e continuam no
+    logger raiz, só os níveis e parâmetros são atualizados, sem reabrir o
+    arquivo de log.
+    
+    Returns:
+        True se os handlers existentes foram reaproveitados.
+    """
+    console_handler = file_handler = None
+    target = os.path.abspath(log_file) if log_file else None
+    for handler in _own_handlers:
+        if handler not in root_logger.handlers:
+            return False
+        if isinstance(handler, logging.handlers.RotatingFileHandler):
+            if handler.baseFilename != target or file_handler is not None:
+                return False
+            file_handler = handler
+        elif type(handler) is logging.StreamHandler and console_handler is None:
+            console_handler = handler
+        else:
+            return False
+    
+    if console_handler is None or (file_handler is None) != (target is None):
+        return False
+    
+    console_handler.setLevel(console_level)
+    console_handler.setFormatter(formatter)
+    if file_handler is not None:
+        file_handler.setLevel(file_level)
+        file_handler.setFormatter(formatter)
+        file_handler.maxBytes = max_bytes
+        file_handler.backupCount = backup_count
+    return True
+
 
 def setup_logging(
     log_file: Optional[Union[str, Path]] = None,
@@ -32,18 +91,19 @@ def setup_logging(
         log_format = (
             '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
         )
+    formatter = _formatter(log_format)
     
-    # Configuração básica
-    logging.basicConfig(
-        level=min(console_level, file_level) if log_file else console_level,
-        format=log_format,
-        handlers=[]  # Remove handlers padrão para evitar duplicação
-    )
+    # Chamadas repetidas (vários pontos de entrada) reaproveitam os handlers
+    root_logger = logging.getLogger()
+    if _reuse_handlers(root_logger, log_file, console_level, file_level,
+                       max_bytes, backup_count, formatter):
+        root_logger.setLevel(min(console_level, file_level) if log_file else console_level)
+        return
     
     # Configura console handler
     console_handler = logging.StreamHandler()
     console_handler.setLevel(console_level)
-    console_handler.setFormatter(logging.Formatter(log_format))
+    console_handler.setFormatter(formatter)
     
     # Configura file handler se especificado
     handlers = [console_handler]
@@ -58,13 +118,17 @@ def setup_logging(
             encoding='utf-8'
         )
         file_handler.setLevel(file_level)
-        file_handler.setFormatter(logging.Formatter(log_format))
+        file_handler.setFormatter(formatter)
         handlers.append(file_handler)
     
-    # Aplica os handlers
-    root_logger = logging.getLogger()
+    # Aplica os handlers. Os antigos saem pela API normal (que usa a trava do
+    # módulo logging); só os criados aqui são fechados, para não vazar
+    # descritores sem fechar handlers instalados por outro código
     for handler in root_logger.handlers[:]:
         root_logger.removeHandler(handler)
+    for handler in _own_handlers:
+        handler.close()
+    _own_handlers[:] = handlers
     for handler in handlers:
         root_logger.addHandler(handler)
     
@@ -6,19 +6,121 @@ do usuário, incluindo detecção de preferências do sistema operacional.
 """
 
 import os
+import re
+import shutil
 import platform
 import logging
+import threading
+import time
+import weakref
 from pathlib import Path
-from typing import Optional, Dict, Any, Union
-from PyQt5.QtWidgets import QStyleFactory
-
-from PyQt5.QtCore import QFile, QTextStream, QSettings, Qt
-from PyQt5.QtGui import QPalette, QColor, QGuiApplication
+from typing import TYPE_CHECKING, Optional, Dict, Any, Tuple, Union
 
 from config import settings
+from ui.styles import STYLES_DIR
+
+# O PyQt5 só é importado ao aplicar o tema: carregar e consultar temas não
+# paga o custo de importação do Qt (útil para testes e ferramentas sem interface)
+if TYPE_CHECKING:
+    from PyQt5.QtGui import QPalette
+    from PyQt5.QtWidgets import QApplication, QWidget
 
 logger = logging.getLogger(__name__)
 
+# Sistema operacional em minúsculas ('windows', 'darwin', 'linux'), obtido
+# uma única vez na importação
+_SYSTEM = platform.system().lower()
+
+# Caminho absoluto do gsettings, procurado uma única vez no PATH (None se
+# ausente, como em contêineres e instalações mínimas)
+_GSETTINGS_PATH = shutil.which('gsettings') if _SYSTEM == 'linux' else None
+
+# Validade (segundos) da detecção do tema do sistema operacional
+_SYSTEM_THEME_TTL = 5.0
+
+# Chave do registro do Windows com a preferência de tema claro/escuro
+_PERSONALIZE_KEY = r'Software\Microsoft\Windows\CurrentVersion\Themes\Personalize'
+# RegNotifyChangeKeyValue: notificar alterações de valores da chave
+_REG_NOTIFY_CHANGE_LAST_SET = 0x00000004
+
+# Esquema de cores do KDE em ~/.config/kdeglobals (basta a primeira ocorrência,
+# sem montar um ConfigParser para o arquivo inteiro)
+_KDE_COLOR_SCHEME_RE = re.compile(rb'^[ \t]*ColorScheme[ \t]*=[ \t]*(.+?)[ \t]*\r?$', re.M)
+
+# Cores das paletas por papel (QPalette.ColorRole) em RGB. As QPalette são
+# montadas uma única vez, no primeiro apply_theme de cada variante
+_DARK_PALETTE_COLORS = (
+    ('Window', (30, 30, 30)),
+    ('WindowText', (255, 255, 255)),
+    ('Base', (25, 25, 25)),
+    ('AlternateBase', (45, 45, 45)),
+    ('ToolTipBase', (45, 45, 45)),
+    ('ToolTipText', (255, 255, 255)),
+    ('Text', (255, 255, 255)),
+    ('Button', (45, 45, 45)),
+    ('ButtonText', (255, 255, 255)),
+    ('BrightText', (255, 0, 0)),
+    ('Highlight', (42, 130, 218)),
+    ('HighlightedText', (255, 255, 255)),
+    ('Link', (42, 130, 218)),
+    ('LinkVisited', (127, 0, 255)),
+)
+_LIGHT_PALETTE_COLORS = (
+    ('Window', (240, 240, 240)),
+    ('WindowText', (0, 0, 0)),
+    ('Base', (255, 255, 255)),
+    ('AlternateBase', (240, 240, 240)),
+    ('ToolTipBase', (255, 255, 255)),
+    ('ToolTipText', (0, 0, 0)),
+    ('Text', (0, 0, 0)),
+    ('Button', (240, 240, 240)),
+    ('ButtonText', (0, 0, 0)),
+    ('BrightText', (255, 0, 0)),
+    ('Highlight', (66, 165, 245)),
+    ('HighlightedText', (255, 255, 255)),
+    ('Link', (41, 121, 255)),
+    ('LinkVisited', (98, 0, 234)),
+)
+
+
+def _build_palette(colors: Tuple[Tuple[str, Tuple[int, int, int]], ...]) -> 'QPalette':
+    """Monta uma QPalette a partir de pares (papel, RGB)."""
+    from PyQt5.QtGui import QColor, QPalette
+    
+    palette = QPalette()
+    for role, rgb in colors:
+        palette.setColor(getattr(QPalette, role), QColor(*rgb))
+    return palette
+
+
+# Folhas de estilo já lidas: caminho -> (mtime_ns, conteúdo)
+_STYLESHEET_CACHE: Dict[str, Tuple[int, str]] = {}
+
+
+def _read_stylesheet(path: Path) -> str:
+    """Lê um arquivo QSS, reaproveitando o conteúdo anterior se ele não mudou.
+    
+    Trocar de tema (ou voltar a um tema já usado) custa só um ``stat`` enquanto
+    o arquivo não for alterado.
+    
+    Args:
+        path: Caminho do arquivo QSS.
+        
+    Returns:
+        Conteúdo da folha de estilo.
+    """
+    path_str = str(path)
+    mtime_ns = os.stat(path_str).st_mtime_ns
+    cached = _STYLESHEET_CACHE.get(path_str)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+    
+    with open(path_str, 'r', encoding='utf-8') as f:
+        style_sheet = f.read()
+    _STYLESHEET_CACHE[path_str] = (mtime_ns, style_sheet)
+    return style_sheet
+
+
 class ThemeManager:
     """Gerencia temas e estilos da interface do usuário."""
     
@@ -44,32 +146,63 @@ class ThemeManager:
     _instance = None
     _current_theme = None
     _style_sheet = ""
+    _sys_dark_cache: Tuple[float, bool] = (float('-inf'), False)  # (instante, resultado)
+    _dark_palette_cache: Optional['QPalette'] = None
+    _win_key = None  # Handle da chave Personalize, aberto uma única vez
+    _theme_watcher: Optional[threading.Thread] = None
+    _light_palette_cache: Optional['QPalette'] = None
+    # O que já foi aplicado e a que alvo (referência fraca: ids de objetos
+    # coletados podem ser reutilizados). A folha de estilo aplicada é mantida
+    # viva, então a comparação por identidade não sofre do mesmo problema
+    _applied_target: Optional[weakref.ref] = None
+    _applied_sheet: Optional[str] = None
+    _applied_palette: Optional[bool] = None
     
-    def __new__(cls):
-        """Implementa o padrão Singleton."""
+    def __new__(cls, styles_dir: Optional[Path] = None, settings_obj: Optional[Any] = None):
+        """Implementa o padrão Singleton.
+        
+        Com dependências injetadas (``styles_dir`` ou ``settings_obj``) é
+        criada uma instância independente, sem tocar no singleton global.
+        """
+        if styles_dir is not None or settings_obj is not None:
+            instance = super(ThemeManager, cls).__new__(cls)
+            instance._initialized = False
+            return instance
         if cls._instance is None:
             cls._instance = super(ThemeManager, cls).__new__(cls)
             cls._instance._initialized = False
         return cls._instance
     
-    def __init__(self):
-        """Inicializa o gerenciador de temas."""
+    def __init__(self, styles_dir: Optional[Path] = None, settings_obj: Optional[Any] = None):
+        """Inicializa o gerenciador de temas.
+        
+        Args:
+            styles_dir: Pasta dos arquivos QSS. Padrão: ``ui/styles`` do projeto.
+            settings_obj: Objeto de configurações (``get``/``add_observer``).
+                Padrão: ``config.settings``.
+        """
         if self._initialized:
             return
             
         self._initialized = True
-        self._styles_dir = Path(__file__).parent.parent / 'ui' / 'styles'
-        self._current_theme = settings.get('ui.theme', 'dark')
+        self._settings = settings_obj if settings_obj is not None else settings
+        self._styles_dir = Path(styles_dir) if styles_dir is not None else STYLES_DIR
+        self._current_theme = self._settings.get('ui.theme', 'dark')
+        
+        # No Windows, acompanha a preferência de tema por notificações do
+        # registro em vez de reabrir a chave a cada consulta
+        if _SYSTEM == 'windows':
+            self._start_windows_theme_watcher()
         
         # Carrega o tema atual
         self.load_theme(self._current_theme)
         
-        # Registra para receber notificações de mudança de tema
-        settings.add_observer(self._on_setting_changed)
+        # Registra para receber notificações apenas de mudança de tema
+        self._settings.add_observer(self._on_setting_changed, key='ui.theme')
     
     def _on_setting_changed(self, key: str, value: Any) -> None:
-        """Lida com mudanças nas configurações."""
-        if key == 'ui.theme' and value != self._current_theme:
+        """Lida com mudanças de ``ui.theme`` (único observador registrado)."""
+        if value != self._current_theme:
             self.load_theme(value)
     
     @property
@@ -84,27 +217,93 @@ class ThemeManager:
             return self._is_system_dark_theme()
         return self.THEMES[self._current_theme]['is_dark']
     
+    def invalidate_system_theme_cache(self) -> None:
+        """Descarta o resultado em cache da detecção do tema do sistema."""
+        self._sys_dark_cache = (float('-inf'), False)
+    
     def _is_system_dark_theme(self) -> bool:
         """
         Detecta se o sistema operacional está usando um tema escuro.
         
+        A consulta ao sistema (registro do Windows, ``gsettings``, etc.) é
+        reaproveitada por ``_SYSTEM_THEME_TTL`` segundos, já que
+        ``is_dark_theme`` pode ser lido com frequência pela interface.
+        
         Returns:
             bool: True se o sistema estiver usando um tema escuro, False caso contrário.
         """
+        now = time.monotonic()
+        checked_at, is_dark = self._sys_dark_cache
+        if now - checked_at < _SYSTEM_THEME_TTL:
+            return is_dark
+        
+        is_dark = self._detect_system_dark_theme()
+        # Com o observador do registro ativo o valor não expira: ele é
+        # atualizado quando o Windows notifica uma alteração
+        self._sys_dark_cache = (float('inf') if self._theme_watcher is not None else now, is_dark)
+        return is_dark
+    
+    def _personalize_key(self, winreg: Any) -> Any:
+        """Retorna o handle da chave Personalize, abrindo-o na primeira chamada."""
+        if self._win_key is None:
+            self._win_key = winreg.OpenKey(
+                winreg.HKEY_CURRENT_USER, _PERSONALIZE_KEY, 0,
+                winreg.KEY_READ | winreg.KEY_NOTIFY
+            )
+        return self._win_key
+    
+    def _start_windows_theme_watcher(self) -> None:
+        """Inicia a thread que espera alterações da chave Personalize."""
+        try:
+            import winreg
+            key = self._personalize_key(winreg)
+        except (OSError, ImportError) as e:
+            logger.debug(f"Observador de tema do Windows indisponível: {e}")
+            return
+        
+        self._theme_watcher = threading.Thread(
+            target=self._watch_windows_theme,
+            args=(key,),
+            name="nix-theme-watcher",
+            daemon=True
+        )
+        self._theme_watcher.start()
+    
+    def _watch_windows_theme(self, key: Any) -> None:
+        """Atualiza o cache do tema do sistema a cada notificação do registro."""
+        import ctypes
+        import winreg
+        
+        notify = ctypes.windll.advapi32.RegNotifyChangeKeyValue
+        while True:
+            # Bloqueia até a próxima alteração de valor da chave
+            if notify(key.handle, False, _REG_NOTIFY_CHANGE_LAST_SET, None, False) != 0:
+                logger.warning("Falha ao aguardar alterações do tema do Windows")
+                break
+            try:
+                value = winreg.QueryValueEx(key, 'AppsUseLightTheme')[0]
+            except OSError:
+                continue
+            self._sys_dark_cache = (float('inf'), value == 0)
+            logger.debug(f"Tema do Windows alterado: {'escuro' if value == 0 else 'claro'}")
+        
+        # Sem notificações: volta à consulta com validade limitada
+        self._theme_watcher = None
+        self.invalidate_system_theme_cache()
+    
+    def _detect_system_dark_theme(self) -> bool:
+        """Consulta o sistema operacional, sem cache; veja ``_is_system_dark_theme``."""
         try:
-            system = platform.system().lower()
+            system = _SYSTEM
             
             # Windows
             if system == 'windows':
                 try:
                     import winreg
-                    with winreg.OpenKey(
-                        winreg.HKEY_CURRENT_USER,
-                        r'Software\Microsoft\Windows\CurrentVersion\Themes\Personalize'
-                    ) as key:
-                        value = winreg.QueryValueEx(key, 'AppsUseLightTheme')[0]
-                        return value == 0
-                except (WindowsError, ImportError):
+                    key = self._personalize_key(winreg)
+                    value = winreg.QueryValueEx(key, 'AppsUseLightTheme')[0]
+                    return value == 0
+                except (OSError, ImportError):
                     pass
             
             # macOS
@@ -118,31 +317,21 @@ class ThemeManager:
             
             # Linux (GNOME, KDE, etc.)
             elif system == 'linux':
-                # Tenta detectar o tema do GNOME
-                try:
-                    import subprocess
-                    result = subprocess.run(
-                        ['gsettings', 'get', 'org.gnome.desktop.interface', 'gtk-theme'],
-                        capture_output=True,
-                        text=True
-                    )
-                    if result.returncode == 0:
-                        theme = result.stdout.strip().lower()
-                        return 'dark' in theme
-                except (FileNotFoundError, subprocess.SubprocessError):
-                    pass
+                # Consulta primeiro a fonte do ambiente em uso; a outra só
+                # serve de reserva. Fora do GNOME/KDE o gsettings (um fork +
+                # exec a cada detecção) não é consultado
+                desktop = os.environ.get('XDG_CURRENT_DESKTOP', '').lower()
+                if 'gnome' in desktop or 'unity' in desktop or not desktop:
+                    probes = (self._detect_gnome_dark_theme, self._detect_kde_dark_theme)
+                elif 'kde' in desktop:
+                    probes = (self._detect_kde_dark_theme, self._detect_gnome_dark_theme)
+                else:
+                    probes = (self._detect_kde_dark_theme,)
                 
-                # Tenta detectar o tema do KDE
-                try:
-                    import configparser
-                    kde_globals = Path.home() / '.config' / 'kdeglobals'
-                    if kde_globals.exists():
-                        config = configparser.ConfigParser()
-                        config.read(kde_globals)
-                        if 'KDE' in config and 'ColorScheme' in config['KDE']:
-                            return 'dark' in config['KDE']['ColorScheme'].lower()
-                except Exception:
-                    pass
+                for probe in probes:
+                    is_dark = probe()
+                    if is_dark is not None:
+                        return is_dark
             
         except Exception as e:
             logger.warning(f"Falha ao detectar tema do sistema: {e}")
@@ -150,6 +339,38 @@ class ThemeManager:
         # Padrão: tema claro
         return False
     
+    @staticmethod
+    def _detect_gnome_dark_theme() -> Optional[bool]:
+        """Lê o tema GTK do GNOME via ``gsettings``; None se não for possível."""
+        if not _GSETTINGS_PATH:
+            return None
+        import subprocess
+        try:
+            result = subprocess.run(
+                [_GSETTINGS_PATH, 'get', 'org.gnome.desktop.interface', 'gtk-theme'],
+                capture_output=True,
+                text=True
+            )
+            if result.returncode == 0:
+                theme = result.stdout.strip().lower()
+                return 'dark' in theme
+        except (FileNotFoundError, subprocess.SubprocessError):
+            pass
+        return None
+    
+    @staticmethod
+    def _detect_kde_dark_theme() -> Optional[bool]:
+        """Lê o esquema de cores do KDE em kdeglobals; None se não for possível."""
+        try:
+            kde_globals = Path.home() / '.config' / 'kdeglobals'
+            with open(kde_globals, 'rb') as f:
+                match = _KDE_COLOR_SCHEME_RE.search(f.read())
+            if match:
+                return b'dark' in match.group(1).lower()
+        except OSError:
+            pass
+        return None
+    
     def load_theme(self, theme_name: str) -> bool:
         """
         Carrega um tema pelo nome.
@@ -160,6 +381,10 @@ class ThemeManager:
         Returns:
             bool: True se o tema foi carregado com sucesso, False caso contrário.
         """
+        # Tema já carregado: nada a fazer ('system' sempre consulta o sistema)
+        if theme_name == self._current_theme and self._style_sheet and theme_name != 'system':
+            return True
+        
         if theme_name not in self.THEMES:
             logger.warning(f"Tema desconhecido: {theme_name}. Usando tema padrão.")
             theme_name = 'dark'
@@ -169,6 +394,7 @@ class ThemeManager:
         
         # Se for o tema do sistema, determina qual tema carregar
         if theme_name == 'system':
+            self.invalidate_system_theme_cache()  # Seleção explícita: consulta o sistema
             is_dark = self._is_system_dark_theme()
             theme_name = 'dark' if is_dark else 'light'
             logger.info(f"Tema do sistema detectado: {'escuro' if is_dark else 'claro'}")
@@ -177,8 +403,7 @@ class ThemeManager:
         theme_file = self._styles_dir / self.THEMES[theme_name]['file']
         
         try:
-            with open(theme_file, 'r', encoding='utf-8') as f:
-                self._style_sheet = f.read()
+            self._style_sheet = _read_stylesheet(theme_file)
             
             logger.debug(f"Tema {theme_name} carregado com sucesso de {theme_file}")
             return True
@@ -190,60 +415,73 @@ class ThemeManager:
                 return self.load_theme('dark')
             return False
     
-    def apply_theme(self, app) -> None:
+    def reload_theme(self) -> bool:
+        """
+        Relê do disco a folha de estilo do tema atual, ignorando o cache.
+        
+        Útil quando o arquivo foi trocado sem alterar o mtime (ex.: cópia
+        preservando a data) ou para forçar uma nova leitura durante ajustes.
+        
+        Returns:
+            bool: True se o tema foi recarregado com sucesso, False caso contrário.
+        """
+        _STYLESHEET_CACHE.clear()
+        self._style_sheet = ""  # Impede o atalho de tema já carregado
+        return self.load_theme(self._current_theme)
+    
+    def apply_theme(self, app: Union['QApplication', 'QWidget']) -> None:
         """
         Aplica o tema atual a um aplicativo Qt.
         
+        Cada etapa só é refeita quando muda algo para o mesmo alvo: a folha de
+        estilo (o texto em cache de ``_read_stylesheet`` é o mesmo objeto
+        enquanto o arquivo não muda), a variante clara/escura da paleta ou,
+        para o estilo da plataforma, o próprio alvo. Reaplicar o mesmo tema
+        não faz o Qt reanalisar o QSS.
+        
         Args:
             app: Instância de QApplication ou QMainWindow.
         """
-        if hasattr(app, 'setStyleSheet'):
-            app.setStyleSheet(self._style_sheet)
-        
-        # Ajusta a paleta de cores para temas escuros/claros
-        palette = app.palette()
+        applied = self._applied_target
+        new_target = applied is None or applied() is not app
+        if new_target:
+            self._applied_sheet = self._applied_palette = None
         
-        if self.is_dark_theme:
-            # Configurações para tema escuro
-            palette.setColor(palette.Window, QColor(30, 30, 30))
-            palette.setColor(palette.WindowText, QColor(255, 255, 255))
-            palette.setColor(palette.Base, QColor(25, 25, 25))
-            palette.setColor(palette.AlternateBase, QColor(45, 45, 45))
-            palette.setColor(palette.ToolTipBase, QColor(45, 45, 45))
-            palette.setColor(palette.ToolTipText, QColor(255, 255, 255))
-            palette.setColor(palette.Text, QColor(255, 255, 255))
-            palette.setColor(palette.Button, QColor(45, 45, 45))
-            palette.setColor(palette.ButtonText, QColor(255, 255, 255))
-            palette.setColor(palette.BrightText, QColor(255, 0, 0))
-            palette.setColor(palette.Highlight, QColor(42, 130, 218))
-            palette.setColor(palette.HighlightedText, QColor(255, 255, 255))
-            palette.setColor(palette.Link, QColor(42, 130, 218))
-            palette.setColor(palette.LinkVisited, QColor(127, 0, 255))
-        else:
-            # Configurações para tema claro
-            palette.setColor(palette.Window, QColor(240, 240, 240))
-            palette.setColor(palette.WindowText, QColor(0, 0, 0))
-            palette.setColor(palette.Base, QColor(255, 255, 255))
-            palette.setColor(palette.AlternateBase, QColor(240, 240, 240))
-            palette.setColor(palette.ToolTipBase, QColor(255, 255, 255))
-            palette.setColor(palette.ToolTipText, QColor(0, 0, 0))
-            palette.setColor(palette.Text, QColor(0, 0, 0))
-            palette.setColor(palette.Button, QColor(240, 240, 240))
-            palette.setColor(palette.ButtonText, QColor(0, 0, 0))
-            palette.setColor(palette.BrightText, QColor(255, 0, 0))
-            palette.setColor(palette.Highlight, QColor(66, 165, 245))
-            palette.setColor(palette.HighlightedText, QColor(255, 255, 255))
-            palette.setColor(palette.Link, QColor(41, 121, 255))
-            palette.setColor(palette.LinkVisited, QColor(98, 0, 234))
+        sheet = self._style_sheet
+        if sheet is not self._applied_sheet and hasattr(app, 'setStyleSheet'):
+            app.setStyleSheet(sheet)
+            self._applied_sheet = sheet
         
-        app.setPalette(palette)
+        # Paletas pré-montadas para temas escuros/claros (compartilhadas)
+        is_dark = self.is_dark_theme
+        if is_dark != self._applied_palette:
+            app.setPalette(self._dark_palette() if is_dark else self._light_palette())
+            self._applied_palette = is_dark
         
         # Aplica estilos específicos para diferentes sistemas operacionais
-        self._apply_platform_specific_styles(app)
+        if new_target:
+            self._apply_platform_specific_styles(app)
+            self._applied_target = weakref.ref(app)
     
-    def _apply_platform_specific_styles(self, app) -> None:
+    @classmethod
+    def _dark_palette(cls) -> 'QPalette':
+        """Retorna a paleta do tema escuro, montando-a na primeira chamada."""
+        if cls._dark_palette_cache is None:
+            cls._dark_palette_cache = _build_palette(_DARK_PALETTE_COLORS)
+        return cls._dark_palette_cache
+    
+    @classmethod
+    def _light_palette(cls) -> 'QPalette':
+        """Retorna a paleta do tema claro, montando-a na primeira chamada."""
+        if cls._light_palette_cache is None:
+            cls._light_palette_cache = _build_palette(_LIGHT_PALETTE_COLORS)
+        return cls._light_palette_cache
+    
+    def _apply_platform_specific_styles(self, app: Union['QApplication', 'QWidget']) -> None:
         """Aplica estilos específicos para diferentes sistemas operacionais."""
-        system = platform.system().lower()
+        from PyQt5.QtWidgets import QStyleFactory
+        
+        system = _SYSTEM
         
         # Estilos específicos para Windows
         if system == 'windows':